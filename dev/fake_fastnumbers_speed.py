@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+"""
+Benchmark the fallbacks used when fastnumbers is not installed.
+
+Splits typical file names with natsort's own regular expressions, then
+times converting the components with try_float/try_int, and with the
+generators over fast_float/fast_int that were used before them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+try:
+    from natsort.compat import fake_fastnumbers as fake
+    from natsort.utils import NumericalRegularExpressions as NumRegex
+except ImportError:
+    sys.path.insert(0, ".")
+    from natsort.compat import fake_fastnumbers as fake
+    from natsort.utils import NumericalRegularExpressions as NumRegex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+NAMES = [
+    "IMG_20240105_1234.jpg",
+    "report v1.10 final (2).pdf",
+    "track-07 - remix.mp3",
+    "/home/user/projects/natsort-8.4.0.tar.gz",
+    "chapter12section3b.txt",
+    "Folder (10)",
+    "version 2.0.0-rc1",
+    "data_-5.5e3_point",
+]
+
+
+def _no_op(x: str) -> str:
+    return x
+
+
+def old_try_float(x: list[str]) -> Iterator[fake.StrOrFloat]:
+    """Convert like the generator over fast_float that was used before."""
+    return (fake.fast_float(y, nan=float("inf"), key=_no_op) for y in x)
+
+
+def old_try_int(x: list[str]) -> Iterator[fake.StrOrInt]:
+    """Convert like the generator over fast_int that was used before."""
+    return (fake.fast_int(y, key=_no_op) for y in x)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=20000,
+        help="Times to convert each name. The default is %(default)s.",
+    )
+    args = parser.parse_args()
+
+    # Like natsort, drop the empty components before converting.
+    float_parts = [
+        list(filter(None, NumRegex.float_sign_exp().split(x))) for x in NAMES
+    ]
+    int_parts = [list(filter(None, NumRegex.int_nosign().split(x))) for x in NAMES]
+    cases = {
+        "float": (
+            lambda: [list(old_try_float(x)) for x in float_parts],
+            lambda: [list(fake.try_float(x, map=True)) for x in float_parts],
+        ),
+        "int": (
+            lambda: [list(old_try_int(x)) for x in int_parts],
+            lambda: [list(fake.try_int(x, map=True)) for x in int_parts],
+        ),
+    }
+
+    sys.stdout.write(f"{'us per name':>12} {'before':>8} {'after':>8}\n")
+    for label, (old, new) in cases.items():
+        before, after = (
+            min(timeit.repeat(f, number=args.number, repeat=5))
+            / args.number
+            / len(NAMES)
+            * 1e6
+            for f in (old, new)
+        )
+        sys.stdout.write(f"{label:>12} {before:>8.2f} {after:>8.2f}\n")
+
+
+if __name__ == "__main__":
+    main()
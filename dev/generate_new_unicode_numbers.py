@@ -1,5 +1,5 @@
 #! /usr/bin/env python
-"""Generate the numeric hex list of unicode numerals."""
+"""Generate the tables of unicode numerals, digits, and decimals."""
 
 from __future__ import annotations
 
@@ -15,30 +15,55 @@ desired_this_file = cwd / "dev" / this_base
 if this_file != desired_this_file:
     sys.exit(this_base + " must be called from project root")
 
-# We will write the new numeric hex collection to a natsort package file.
-target = cwd / "natsort" / "unicode_numeric_hex.py"
+# Collect each non-ASCII numeric character, then the digits and decimals
+# which are subsets of the numerals.
+numeric = []
+for i in range(0x110000):
+    a = chr(i)
+    if a in "0123456789":
+        continue
+    if unicodedata.numeric(a, None) is not None:
+        numeric.append(a)
+digits = [a for a in numeric if unicodedata.digit(a, None) is not None]
+decimals = [a for a in numeric if unicodedata.decimal(a, None) is not None]
+tables = {
+    "numeric": numeric,
+    "digits": digits,
+    "decimals": decimals,
+    "digits_no_decimals": [a for a in digits if a not in decimals],
+    "numeric_no_decimals": [a for a in numeric if a not in decimals],
+}
+
+
+def escape(a: str) -> str:
+    """Write a character as an ASCII escape sequence."""
+    if ord(a) > 0xFFFF:  # noqa: PLR2004
+        return f"\\U{ord(a):08x}"
+    return f"\\u{ord(a):04x}"
+
+
+# We will write the new tables to a natsort package file.
+target = cwd / "natsort" / "unicode_numeric_data.py"
 with target.open("w") as fl:
     print(
-        '''# -*- coding: utf-8 -*-
-"""
-Contains all possible non-ASCII unicode numbers.
-"""
+        f'''"""Contains all possible non-ASCII unicode numbers."""
+
+from __future__ import annotations
 
 # Rather than determine what unicode characters are numeric on the fly which
-# would incur a startup runtime penalty, the hex values are hard-coded below.
-numeric_hex = (''',
+# would incur a startup runtime penalty, the characters are hard-coded below.
+# This file is generated by dev/generate_new_unicode_numbers.py.
+
+# The version of the unicode database these tables were generated from.
+unidata_version = "{unicodedata.unidata_version}"''',
         file=fl,
     )
 
-    # Write out each individual hex value.
-    for i in range(0x110000):
-        try:
-            a = chr(i)
-        except ValueError:
-            break
-        if a in "0123456789":
-            continue
-        if unicodedata.numeric(a, None) is not None:
-            print(f"    0x{i:X},", file=fl)
-
-    print(")", file=fl)
+    # Write out each table, several characters per line.
+    chunk = 8
+    for name, chars in tables.items():
+        print(f"\n{name} = (", file=fl)
+        for i in range(0, len(chars), chunk):
+            line = "".join(escape(a) for a in chars[i : i + chunk])
+            print(f'    "{line}"', file=fl)
+        print(")", file=fl)
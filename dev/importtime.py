@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+"""
+Benchmark the time it takes to import natsort.
+
+Runs "python -X importtime" several times in fresh interpreters, and reports
+the median self and cumulative import times of the slowest modules.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-c",
+        "--code",
+        default="import natsort",
+        help="The code to time. The default is %(default)r.",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=15,
+        help="Number of interpreters to run. The default is %(default)s.",
+    )
+    parser.add_argument(
+        "-t",
+        "--top",
+        type=int,
+        default=15,
+        help="Number of modules to report. The default is %(default)s.",
+    )
+    args = parser.parse_args()
+
+    # Each line looks like "import time: self [us] | cumulative | imported package"
+    times: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for _ in range(args.repeat):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", args.code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        for line in result.stderr.splitlines():
+            self_us, cumulative_us, module = line.split(":", 1)[1].split("|")
+            if self_us.strip().isdigit():
+                times[module.strip()].append((int(self_us), int(cumulative_us)))
+
+    median = {
+        module: (
+            statistics.median(x for x, _ in values),
+            statistics.median(y for _, y in values),
+        )
+        for module, values in times.items()
+    }
+    sys.stdout.write(f"{'self [us]':>10} {'cumulative':>10}  module\n")
+    slowest = sorted(median.items(), key=lambda x: x[1][1], reverse=True)
+    for module, (self_us, cumulative_us) in slowest[: args.top]:
+        sys.stdout.write(f"{self_us:>10.0f} {cumulative_us:>10.0f}  {module}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 try:
     # The redundant "as" tells mypy to treat as explict import
     from natsort._version import __version__ as __version__
@@ -9,55 +12,135 @@ try:
 except ImportError:
     __version__ = "unknown version"
     __version_tuple__ = (0, 0, "unknown version")
-from natsort.natsort import (
-    NatsortKeyType,
-    OSSortKeyType,
-    as_ascii,
-    as_utf8,
-    decoder,
-    humansorted,
-    index_humansorted,
-    index_natsorted,
-    index_realsorted,
-    natsort_key,
-    natsort_keygen,
-    natsorted,
-    numeric_regex_chooser,
-    order_by_index,
-    os_sort_key,
-    os_sort_keygen,
-    os_sorted,
-    realsorted,
-)
 from natsort.ns_enum import NSType, ns
-from natsort.utils import KeyType, NatsortInType, NatsortOutType, chain_functions
+
+if TYPE_CHECKING:
+    from natsort.fs import natglob, natsorted_scandir, natwalk
+    from natsort.mmap_index import NatsortIndex, natsort_index, natsort_mmap
+    from natsort.natsort import (
+        CachedNatsortKey,
+        NatsortKeyType,
+        OSSortKeyType,
+        as_ascii,
+        as_utf8,
+        cached_natsort_keygen,
+        decoder,
+        humansorted,
+        index_humansorted,
+        index_natsorted,
+        index_realsorted,
+        natgroupby,
+        natmedian,
+        natnth,
+        natpartition,
+        natpercentile,
+        natrank,
+        natsort_inplace,
+        natsort_key,
+        natsort_keygen,
+        natsorted,
+        natsorted_iter,
+        natsorted_paths,
+        numeric_regex_chooser,
+        order_by_index,
+        order_by_index_inplace,
+        os_sort_key,
+        os_sort_keygen,
+        os_sorted,
+        realsorted,
+        versionsorted,
+    )
+    from natsort.utils import (
+        KeyType,
+        NatsortInType,
+        NatsortOutType,
+        chain_functions,
+        encode_key,
+    )
 
 __all__ = [
+    "CachedNatsortKey",
     "KeyType",
     "NSType",
     "NatsortInType",
+    "NatsortIndex",
     "NatsortKeyType",
     "NatsortOutType",
     "OSSortKeyType",
     "as_ascii",
     "as_utf8",
+    "cached_natsort_keygen",
     "chain_functions",
     "decoder",
+    "encode_key",
     "humansorted",
     "index_humansorted",
     "index_natsorted",
     "index_realsorted",
+    "natglob",
+    "natgroupby",
+    "natmedian",
+    "natnth",
+    "natpartition",
+    "natpercentile",
+    "natrank",
+    "natsort_index",
+    "natsort_inplace",
     "natsort_key",
     "natsort_keygen",
+    "natsort_mmap",
     "natsorted",
+    "natsorted_iter",
+    "natsorted_paths",
+    "natsorted_scandir",
+    "natwalk",
     "ns",
     "numeric_regex_chooser",
     "order_by_index",
+    "order_by_index_inplace",
     "os_sort_key",
     "os_sort_keygen",
     "os_sorted",
     "realsorted",
+    "versionsorted",
 ]
 
+# The modules that define the bulk of the API are only imported when one of
+# their attributes is first accessed, so that "import natsort" stays cheap.
+_lazy_attributes = {
+    "KeyType": "natsort.utils",
+    "NatsortInType": "natsort.utils",
+    "NatsortOutType": "natsort.utils",
+    "chain_functions": "natsort.utils",
+    "encode_key": "natsort.utils",
+    "natglob": "natsort.fs",
+    "natsorted_scandir": "natsort.fs",
+    "natwalk": "natsort.fs",
+    "NatsortIndex": "natsort.mmap_index",
+    "natsort_index": "natsort.mmap_index",
+    "natsort_mmap": "natsort.mmap_index",
+}
+_lazy_attributes.update(
+    (name, "natsort.natsort")
+    for name in __all__
+    if name not in _lazy_attributes and name not in {"NSType", "ns"}
+)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    try:
+        module = _lazy_attributes[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 # Add the ns keys to this namespace for convenience.
 globals().update(dict(ns.__members__.items()))
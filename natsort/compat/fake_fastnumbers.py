@@ -7,9 +7,12 @@ Used when the fastnumbers module is not installed.
 from __future__ import annotations
 
 import unicodedata
-from typing import Callable, Union
+from typing import TYPE_CHECKING, Callable, Union
 
-from natsort.unicode_numbers import decimal_chars
+from natsort.unicode_numbers import decimals
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 _NAN_INF = [
     "INF",
@@ -32,7 +35,9 @@ _NAN_INF = [
 _NAN_INF.extend(["+" + x[:2] for x in _NAN_INF] + ["-" + x[:2] for x in _NAN_INF])
 NAN_INF = frozenset(_NAN_INF)
 ASCII_NUMS = "0123456789+-"
-POTENTIAL_FIRST_CHAR = frozenset(decimal_chars + list(ASCII_NUMS + "."))
+POTENTIAL_FIRST_CHAR = frozenset(decimals + ASCII_NUMS + ".")
+SIGNS = frozenset("+-")
+SIGNS_AND_DECIMAL_POINT = frozenset("+-.")
 
 StrOrFloat = Union[str, float]
 StrOrInt = Union[str, int]
@@ -120,3 +125,111 @@ def fast_int(
             return _uni(x, key(x)) if len(x) == 1 else key(x)
         except TypeError:  # pragma: no cover
             return key(x)
+
+
+def _no_op(x: str) -> str:
+    return x
+
+
+def try_float(
+    x: Iterable[str],
+    *,
+    map: bool,  # noqa: ARG001
+    nan: float = float("inf"),
+    on_fail: Callable[[str], str] = _no_op,
+    _uni: Callable[[str, None], float | None] = unicodedata.numeric,
+    _nan_inf: frozenset[str] = NAN_INF,
+    _start: frozenset[str] = SIGNS_AND_DECIMAL_POINT,
+) -> Iterator[StrOrFloat]:
+    """
+    Convert strings split by natsort's float regular expression to floats.
+
+    Unlike *fast_float*, this does not accept arbitrary input. Each
+    string must be one of the components produced by splitting on one
+    of the float regular expressions in *natsort.utils*, where any
+    component that starts like a number *is* a number. This allows
+    components to be classified by their first few characters only,
+    without raising and catching an exception for every non-number.
+
+    Parameters
+    ----------
+    x : iterable of str
+        Strings to attempt to convert to a float.
+    map : bool
+        Must be *True*; present for API compatibility with fastnumbers.
+    nan : float
+        Value to return instead of NaN if NaN would be returned.
+    on_fail : callable
+        Single-argument function to apply to strings that are not numbers.
+
+    Yields
+    ------
+    *str* or *float*
+
+    """
+    for y in x:
+        first = y[0]
+        if first.isdecimal() or (
+            first in _start
+            and (
+                y[1:2].isdecimal()
+                or (first != "." and y[1:2] == "." and y[2:3].isdecimal())
+            )
+        ):
+            yield float(y)
+        elif y.lstrip()[:3] in _nan_inf:
+            # Words like "inf" or "nan" are not matched by the regular
+            # expression but are still converted to floats.
+            try:
+                ret = float(y)
+            except ValueError:
+                yield on_fail(y)
+            else:
+                yield nan if ret != ret else ret
+        elif len(y) == 1:
+            val = _uni(y, None)
+            yield on_fail(y) if val is None else val
+        else:
+            yield on_fail(y)
+
+
+def try_int(
+    x: Iterable[str],
+    *,
+    map: bool,  # noqa: ARG001
+    on_fail: Callable[[str], str] = _no_op,
+    _uni: Callable[[str, None], int | None] = unicodedata.digit,
+    _signs: frozenset[str] = SIGNS,
+) -> Iterator[StrOrInt]:
+    """
+    Convert strings split by natsort's int regular expression to ints.
+
+    Unlike *fast_int*, this does not accept arbitrary input. Each
+    string must be one of the components produced by splitting on one
+    of the int regular expressions in *natsort.utils*, so that a string
+    is a number exactly when it is made of decimal characters (with an
+    optional sign) or it is a single digit character. This check is made
+    without raising and catching an exception for every non-number.
+
+    Parameters
+    ----------
+    x : iterable of str
+        Strings to attempt to convert to an int.
+    map : bool
+        Must be *True*; present for API compatibility with fastnumbers.
+    on_fail : callable
+        Single-argument function to apply to strings that are not numbers.
+
+    Yields
+    ------
+    *str* or *int*
+
+    """
+    for y in x:
+        if y.isdecimal() or (y[0] in _signs and y[1:].isdecimal()):
+            yield int(y)
+        elif len(y) == 1:
+            val = _uni(y, None)
+            yield on_fail(y) if val is None else val
+        else:
+            yield on_fail(y)
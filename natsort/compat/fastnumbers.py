@@ -58,9 +58,11 @@ try:
         del fast_float, fast_int
         from fastnumbers import try_float, try_int
 except ImportError:
+    # The fallback functions take advantage of the fact that natsort
+    # only passes components split by its own regular expressions.
     from natsort.compat.fake_fastnumbers import (  # type: ignore[no-redef]
-        fast_float,
-        fast_int,
+        try_float,
+        try_int,
     )
 
 # Re-map the old-or-compatibility functions fast_float/fast_int to the
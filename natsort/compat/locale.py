@@ -7,7 +7,7 @@ Makes uniform API to either local or PyICU.
 from __future__ import annotations
 
 import sys
-from typing import Callable, Union
+from typing import Any, Callable, Union
 
 StrOrBytes = Union[str, bytes]
 TrxfmFunc = Callable[[str], StrOrBytes]
@@ -18,17 +18,25 @@ TrxfmFunc = Callable[[str], StrOrBytes]
 null_string = ""
 null_string_max = chr(sys.maxunicode) * 20
 
-# This variable could be str or bytes depending on the locale library
+# The below depend on the locale library being used. Importing PyICU is slow,
+# so which library to use is not determined until one of these is first
+# accessed (see __getattr__ at the bottom of this module).
+#
+# The null strings could be str or bytes depending on the locale library
 # being used, so give the type-checker this information.
 null_string_locale: StrOrBytes
 null_string_locale_max: StrOrBytes
+dumb_sort: Callable[[], bool]
+get_strxfrm: Callable[[], TrxfmFunc]
+get_thousands_sep: Callable[[], str]
+get_decimal_point: Callable[[], str]
 
-# strxfrm can be buggy (especially on OSX and *possibly* some other
-# BSD-based systems), so prefer icu if available.
-try:
-    from locale import getlocale
 
-    import icu
+def _icu_backend() -> dict[str, Any]:
+    """Define the locale functionality using PyICU."""
+    from locale import getlocale  # noqa: PLC0415
+
+    import icu  # noqa: PLC0415
 
     null_string_locale = b""
 
@@ -63,9 +71,21 @@ try:
         sep = icu.DecimalFormatSymbols.kDecimalSeparatorSymbol
         return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
 
-except ImportError:
-    import locale
-    from locale import strxfrm
+    return {
+        "null_string_locale": null_string_locale,
+        "null_string_locale_max": null_string_locale_max,
+        "dumb_sort": dumb_sort,
+        "get_icu_locale": get_icu_locale,
+        "get_strxfrm": get_strxfrm,
+        "get_thousands_sep": get_thousands_sep,
+        "get_decimal_point": get_decimal_point,
+    }
+
+
+def _locale_backend() -> dict[str, Any]:
+    """Define the locale functionality using the locale module."""
+    import locale  # noqa: PLC0415
+    from locale import strxfrm  # noqa: PLC0415
 
     null_string_locale = null_string
     null_string_locale_max = null_string_max
@@ -132,3 +152,33 @@ except ImportError:
     def get_decimal_point() -> str:
         """Return the appropriate decimal point for this locale."""
         return locale.localeconv()["decimal_point"]
+
+    return {
+        "null_string_locale": null_string_locale,
+        "null_string_locale_max": null_string_locale_max,
+        "dumb_sort": dumb_sort,
+        "get_strxfrm": get_strxfrm,
+        "get_thousands_sep": get_thousands_sep,
+        "get_decimal_point": get_decimal_point,
+    }
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name not in __annotations__ and name != "get_icu_locale":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # strxfrm can be buggy (especially on OSX and *possibly* some other
+    # BSD-based systems), so prefer icu if available.
+    try:
+        backend = _icu_backend()
+    except ImportError:
+        backend = _locale_backend()
+    globals().update(backend)
+
+    # get_icu_locale is only available when using PyICU.
+    try:
+        return backend[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
@@ -0,0 +1,428 @@
+"""
+Natural ordering of directory listings.
+
+:func:`natsorted_scandir`, :func:`natwalk` and :func:`natglob` list
+directories with `os.scandir`, and sort each listing by the names of its
+entries, which are known without a `stat` call.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from functools import partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Literal, overload
+
+from natsort.natsort import natsort_keygen, os_sort_keygen
+from natsort.ns_enum import NSType, ns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from natsort.utils import NatsortInType, NatsortOutType
+
+
+def natsorted_scandir(
+    path: str | os.PathLike[str] = ".",
+    key: Callable[[os.DirEntry[str]], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType | None = ns.DEFAULT,
+) -> list[os.DirEntry[str]]:
+    """
+    List the entries of a directory with `os.scandir`, in natural order.
+
+    The entries are sorted by their name, which `os.scandir` already
+    knows, so no `stat` call or full path is needed to sort them. Each
+    entry's ``is_dir()``, ``is_file()`` and ``stat()`` methods are
+    available, and are cached, as with `os.scandir`.
+
+    Parameters
+    ----------
+    path : str or path-like, optional
+        The directory to list. The default is the current directory.
+
+    key : callable, optional
+        A key used to get the value to sort each `os.DirEntry` by.
+        The default is the ``name`` of the entry.
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum or None, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. If None, sort in the same
+        order as your operating system's file browser, like `os_sorted`.
+        The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list
+        The `os.DirEntry` objects of the directory, in sorted order.
+
+    See Also
+    --------
+    natwalk
+    os_sorted
+
+    Examples
+    --------
+    List a directory of numbered files::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     for name in ['file10', 'file2', 'file1']:
+        ...         Path(tmp, name).touch()
+        ...     [entry.name for entry in natsorted_scandir(tmp)]
+        ...
+        ['file1', 'file2', 'file10']
+
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    entries.sort(key=_scandir_keygen(key, alg), reverse=reverse)
+    return entries
+
+
+def natwalk(  # noqa: PLR0913, PLR0917
+    top: str | os.PathLike[str],
+    topdown: bool = True,
+    onerror: Callable[[OSError], object] | None = None,
+    followlinks: bool = False,
+    key: Callable[[os.DirEntry[str]], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType | None = ns.DEFAULT,
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """
+    Walk a directory tree like `os.walk`, in natural order.
+
+    This produces the same ``(dirpath, dirnames, filenames)`` tuples as
+    `os.walk` (and supports the same options), except that the names are
+    naturally sorted and the directories are visited in that order.
+    Each directory's listing is read and sorted lazily, when the walk
+    reaches it, so the results start immediately rather than after the
+    whole tree has been listed.
+
+    Parameters
+    ----------
+    top : str or path-like
+        The root of the directory tree to walk.
+
+    topdown : {{True, False}}, optional
+        If True, each directory is produced before its subdirectories,
+        and *dirnames* may be modified in place to choose which of them
+        are visited. Otherwise, each directory is produced after its
+        subdirectories. The default is `True`.
+
+    onerror : callable, optional
+        Called with the `OSError` if a directory cannot be listed.
+        By default, such errors are ignored.
+
+    followlinks : {{True, False}}, optional
+        Visit directories pointed to by symlinks. The default is `False`.
+
+    key : callable, optional
+        A key used to get the value to sort each `os.DirEntry` by.
+        The default is the ``name`` of the entry.
+
+    reverse : {{True, False}}, optional
+        Produce the names in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum or None, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. If None, sort in the same
+        order as your operating system's file browser, like `os_sorted`.
+        The default is `ns.INT`.
+
+    Returns
+    -------
+    out : iterator
+        The ``(dirpath, dirnames, filenames)`` of each directory.
+
+    See Also
+    --------
+    natsorted_scandir
+
+    """
+    sort_key = _scandir_keygen(key, alg)
+    stack: list[str | tuple[str, list[str], list[str]]] = [os.fspath(top)]
+    while stack:
+        dirpath = stack.pop()
+        if isinstance(dirpath, tuple):
+            yield dirpath  # A bottom-up result, once its subdirectories are done.
+            continue
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError as error:
+            if onerror is not None:
+                onerror(error)
+            continue
+        entries.sort(key=sort_key, reverse=reverse)
+
+        dirnames, filenames, subdirs = _split_dir_entries(entries, followlinks)
+        if topdown:
+            yield dirpath, dirnames, filenames
+            # The directory names may have been changed by the caller.
+            subdirs = [
+                path
+                for path in map(partial(os.path.join, dirpath), dirnames)
+                if followlinks or not os.path.islink(path)  # noqa: PTH114
+            ]
+        else:
+            stack.append((dirpath, dirnames, filenames))
+        stack.extend(reversed(subdirs))
+
+
+@overload
+def natglob(
+    pattern: str,
+    reverse: bool = ...,
+    alg: NSType | None = ...,
+    *,
+    recursive: bool = ...,
+    lazy: Literal[True] = ...,
+) -> Iterator[str]: ...
+
+
+@overload
+def natglob(
+    pattern: str,
+    reverse: bool = ...,
+    alg: NSType | None = ...,
+    *,
+    recursive: bool = ...,
+    lazy: Literal[False],
+) -> list[str]: ...
+
+
+def natglob(
+    pattern: str,
+    reverse: bool = False,
+    alg: NSType | None = ns.DEFAULT,
+    *,
+    recursive: bool = False,
+    lazy: bool = True,
+) -> Iterator[str] | list[str]:
+    """
+    Find the paths matching a pattern like `glob.iglob`, in natural order.
+
+    This matches the same paths as `glob.iglob`, but each directory is
+    naturally sorted as it is listed. The matches are produced directory
+    by directory: the directories to search are visited depth first in
+    natural order (each one before its subdirectories), and the matches
+    in each directory are produced in natural order. The results start
+    immediately, without listing every directory first.
+
+    For patterns that match in several levels of directories, such as
+    ``**/*.txt``, this is not the order of
+    ``natsorted(glob.glob(pattern), alg=ns.PATH)``: ``z.txt`` comes before
+    ``a/y.txt``, because the matches of a directory come before those of
+    its subdirectories.
+
+    Parameters
+    ----------
+    pattern : str
+        The shell-style pattern to match, as for `glob.iglob`.
+
+    reverse : {{True, False}}, optional
+        Produce the matches of each directory in reversed sorted order.
+        The default is `False`.
+
+    alg : ns enum or None, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting the names in each directory. For details into
+        these options, please see the :class:`ns` class documentation.
+        If None, sort in the same order as your operating system's file
+        browser, like `os_sorted`. The default is `ns.INT`.
+
+    recursive : {{True, False}}, optional
+        If True, the pattern "**" matches any files and zero or more
+        directories and subdirectories. The default is `False`.
+
+    lazy : {{True, False}}, optional
+        If True, return an iterator over the matches. Otherwise, return
+        a list of all the matches. The default is `True`.
+
+    Returns
+    -------
+    out : iterator or list
+        The matching paths.
+
+    See Also
+    --------
+    natsorted_scandir
+    natwalk
+
+    Examples
+    --------
+    Find numbered files::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     for name in ['file10.txt', 'file2.txt', 'file1.csv']:
+        ...         Path(tmp, name).touch()
+        ...     [Path(x).name for x in natglob(str(Path(tmp, 'file*')))]
+        ...
+        ['file1.csv', 'file2.txt', 'file10.txt']
+
+    """
+    listdir = partial(
+        _natsorted_listdir, key=_scandir_keygen(None, alg), reverse=reverse
+    )
+    matches = _natglob(pattern, recursive, False, listdir)
+    if recursive and pattern == "**":
+        next(matches)  # As with glob, do not match the empty path.
+    return matches if lazy else list(matches)
+
+
+def _natglob(
+    pattern: str,
+    recursive: bool,
+    dironly: bool,
+    listdir: Callable[[str, bool], list[os.DirEntry[str]]],
+) -> Iterator[str]:
+    """Match a pattern one path component at a time, as glob does."""
+    dirname, basename = os.path.split(pattern)
+    if not _has_magic(pattern):
+        if basename:
+            if os.path.lexists(pattern):
+                yield pattern
+        elif os.path.isdir(dirname):  # noqa: PTH112
+            yield pattern  # Patterns ending with a separator must be directories.
+        return
+
+    # The directories are matched lazily, in sorted order, and then each
+    # one is searched for the last component of the pattern in turn.
+    if dirname != pattern and _has_magic(dirname):
+        dirs: Iterable[str] = _natglob(dirname, recursive, True, listdir)
+    else:
+        dirs = [dirname]
+    if recursive and basename == "**":
+        glob_in_dir = _glob_recursive
+    elif _has_magic(basename):
+        glob_in_dir = _glob_pattern
+    else:
+        glob_in_dir = _glob_literal
+    for parent in dirs:
+        for name in glob_in_dir(parent, basename, dironly, listdir):
+            yield os.path.join(parent, name)  # noqa: PTH118
+
+
+def _glob_literal(
+    dirname: str,
+    pattern: str,
+    dironly: bool,  # noqa: ARG001
+    listdir: Callable[[str, bool], list[os.DirEntry[str]]],  # noqa: ARG001
+) -> Iterator[str]:
+    """Match a component without wildcards, which need not be listed."""
+    if pattern:
+        if os.path.lexists(os.path.join(dirname, pattern)):  # noqa: PTH118
+            yield pattern
+    elif os.path.isdir(dirname):  # noqa: PTH112
+        yield pattern
+
+
+def _glob_pattern(
+    dirname: str,
+    pattern: str,
+    dironly: bool,
+    listdir: Callable[[str, bool], list[os.DirEntry[str]]],
+) -> Iterator[str]:
+    """Match a component with wildcards against the sorted directory listing."""
+    names = [entry.name for entry in listdir(dirname, dironly)]
+    if pattern[:1] != ".":
+        names = [name for name in names if name[:1] != "."]
+    yield from fnmatch.filter(names, pattern)
+
+
+def _glob_recursive(
+    dirname: str,
+    pattern: str,
+    dironly: bool,
+    listdir: Callable[[str, bool], list[os.DirEntry[str]]],
+) -> Iterator[str]:
+    """Match "**" against a directory and everything in it, depth-first."""
+    yield pattern[:0]
+    stack = [(dirname, "", iter(listdir(dirname, dironly)))]
+    while stack:
+        parent, prefix, entries = stack[-1]
+        for entry in entries:
+            if entry.name[:1] == ".":
+                continue
+            name = os.path.join(prefix, entry.name) if prefix else entry.name  # noqa: PTH118
+            yield name
+            if _is_dir(entry):
+                path = os.path.join(parent, entry.name) if parent else entry.name  # noqa: PTH118
+                stack.append((path, name, iter(listdir(path, dironly))))
+                break
+        else:
+            stack.pop()
+
+
+def _natsorted_listdir(
+    dirname: str,
+    dironly: bool,
+    key: Callable[[os.DirEntry[str]], NatsortOutType],
+    reverse: bool,
+) -> list[os.DirEntry[str]]:
+    """List a directory (or only its subdirectories) in sorted order."""
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            entries = [entry for entry in it if not dironly or _is_dir(entry)]
+    except OSError:
+        return []
+    entries.sort(key=key, reverse=reverse)
+    return entries
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    """Return whether an entry is a directory (or a link to one)."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+# The same test for wildcards that glob uses.
+_has_magic = re.compile("[*?[]").search
+
+
+def _split_dir_entries(
+    entries: list[os.DirEntry[str]], followlinks: bool
+) -> tuple[list[str], list[str], list[str]]:
+    """Split directory entries into directory names, file names and subdirs."""
+    dirnames = []
+    filenames = []
+    subdirs = []
+    for entry in entries:
+        if not _is_dir(entry):
+            filenames.append(entry.name)
+            continue
+        dirnames.append(entry.name)
+        try:
+            is_symlink = entry.is_symlink()
+        except OSError:
+            is_symlink = False
+        if followlinks or not is_symlink:
+            subdirs.append(entry.path)
+    return dirnames, filenames, subdirs
+
+
+def _scandir_keygen(
+    key: Callable[[os.DirEntry[str]], NatsortInType] | None,
+    alg: NSType | None,
+) -> Callable[[os.DirEntry[str]], NatsortOutType]:
+    """Create the key to sort directory entries with."""
+    if key is None:
+        key = attrgetter("name")
+    if alg is None:
+        return os_sort_keygen(key)
+    return natsort_keygen(key, alg)
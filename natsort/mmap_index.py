@@ -0,0 +1,591 @@
+"""
+Natural ordering of the lines of large files.
+
+:func:`natsort_mmap` sorts the lines of a memory-mapped file without
+reading them into a list, and :func:`natsort_index` writes their natural
+order to an index file that :class:`NatsortIndex` can search later.
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Callable
+
+from natsort import utils
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import NSType, ns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
+
+    from typing_extensions import Self
+
+
+def natsort_mmap(  # noqa: PLR0913
+    path: str | os.PathLike[str],
+    sep: bytes = b"\n",
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+    *,
+    output: str | os.PathLike[str] | None = None,
+    chunk_size: int = 1 << 18,
+) -> array[int]:
+    r"""
+    Naturally sort the lines of a file without reading them into strings.
+
+    The file is memory-mapped, and the natural key of each line is computed
+    from its bytes with ``ns.BYTES``, so no `str` (or list of lines) is
+    created. The lines are identified by their position in the file, which
+    takes much less memory for large files than the lines themselves, and
+    only the keys of `chunk_size` lines are in memory at any time.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The file to sort.
+
+    sep : bytes, optional
+        The separator between lines. A separator at the end of the file
+        does not start another line. The default is ``b"\n"``.
+
+    reverse : {{True, False}}, optional
+        Return the lines in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. ``ns.BYTES`` is always added.
+        As with `natsorted`, ``ns.PRESORT`` orders lines with equal keys
+        by their `str`. The default is `ns.INT`.
+
+    output : str or path-like, optional
+        If given, also write the lines to this file in sorted order,
+        each followed by `sep`. It must not be the input file.
+
+    chunk_size : int, optional
+        The most lines whose natural keys are held in memory at once.
+        Larger files are sorted in chunks of this many lines, which are
+        then merged (computing each key again). The default is 262144.
+
+    Returns
+    -------
+    out : array.array
+        The byte offset and length of each line, in sorted order, as
+        consecutive elements of an ``array.array('q')``.
+
+    See Also
+    --------
+    natsorted
+
+    Examples
+    --------
+    Sort the lines of a file::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     _ = Path(tmp, 'in.txt').write_bytes(b'item10\nitem9\nitem1\n')
+        ...     pairs = natsort_mmap(Path(tmp, 'in.txt'), output=Path(tmp, 'out.txt'))
+        ...     sorted_text = Path(tmp, 'out.txt').read_bytes()
+        ...
+        >>> list(pairs)
+        [13, 5, 7, 5, 0, 6]
+        >>> sorted_text
+        b'item1\nitem9\nitem10\n'
+
+    """
+    if not sep:
+        msg = "natsort_mmap: 'sep' must not be empty"
+        raise ValueError(msg)
+    if chunk_size < 1:
+        msg = f"natsort_mmap: 'chunk_size' must be at least 1, got {chunk_size!r}"
+        raise ValueError(msg)
+    with open(path, "rb") as f:  # noqa: PTH123
+        if os.fstat(f.fileno()).st_size == 0:
+            # An empty file cannot be memory-mapped.
+            if output is not None:
+                open(output, "wb").close()  # noqa: PTH123
+            return array("q")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pairs = _line_positions(mm, sep)
+            offsets, lengths = pairs[::2], pairs[1::2]
+            index = _sorted_line_index(
+                lambda j: mm[offsets[j] : offsets[j] + lengths[j]],
+                len(offsets),
+                reverse,
+                alg,
+                chunk_size,
+            )
+            result = array("q")
+            for j in index:
+                result.append(offsets[j])
+                result.append(lengths[j])
+            if output is not None:
+                _write_lines(mm, result, sep, output)
+    return result
+
+
+def _sorted_line_index(
+    line: Callable[[int], bytes],
+    n: int,
+    reverse: bool,
+    alg: NSType,
+    chunk_size: int,
+) -> Iterable[int]:
+    """Sort the line numbers, holding the keys of one chunk at a time."""
+    keygen = natsort_keygen(None, alg | ns.BYTES)
+    runs = []
+    for start in range(0, n, chunk_size):
+        chunk = range(start, min(start + chunk_size, n))
+        index = list(chunk)
+        if alg & ns.PRESORT:
+            # Ties are ordered by str, exactly as natsorted does.
+            index.sort(reverse=reverse, key=lambda j: str(line(j)))
+        keys = [keygen(line(j)) for j in chunk]
+        index.sort(reverse=reverse, key=lambda j: keys[j - start])
+        runs.append(array("q", index))
+    if len(runs) == 1:
+        return runs[0]
+
+    # Merge the sorted chunks, computing each key a second time.
+    # The merge is stable, so equal keys stay in their order in the file.
+    def merge_key(j: int) -> Any:  # noqa: ANN401
+        x = line(j)
+        return (keygen(x), str(x)) if alg & ns.PRESORT else keygen(x)
+
+    return heapq.merge(*runs, key=merge_key, reverse=reverse)
+
+
+def _line_positions(mm: mmap.mmap, sep: bytes) -> array[int]:
+    """Find the offset and length of each line in a memory-mapped file."""
+    pairs = array("q")
+    size = len(mm)
+    start = 0
+    find = mm.find
+    while start < size:
+        end = find(sep, start)
+        if end == -1:
+            end = size
+        pairs.append(start)
+        pairs.append(end - start)
+        start = end + len(sep)
+    return pairs
+
+
+def _write_lines(
+    mm: mmap.mmap,
+    pairs: array[int],
+    sep: bytes,
+    output: str | os.PathLike[str],
+) -> None:
+    """Write the lines at the given offsets and lengths, in order."""
+    with memoryview(mm) as view, open(output, "wb") as f:  # noqa: PTH123
+        write = f.write
+        for i in range(0, len(pairs), 2):
+            write(view[pairs[i] : pairs[i] + pairs[i + 1]])
+            write(sep)
+
+
+# An index file starts with this header, then holds the offset and length
+# of each line in natural order, then the end of the encoded key of each
+# line within the encoded keys, which are stored last. The numbers are in
+# native byte order, so the magic records that order. The header is the
+# magic, the algorithm, the number of lines, then the size and modification
+# time (in nanoseconds) of the indexed file, to notice when it changes.
+_INDEX_HEADER = struct.Struct("=8sqqqq")
+_INDEX_MAGIC = b"natsidx" + sys.byteorder[:1].encode()
+
+
+def natsort_index(
+    path: str | os.PathLike[str],
+    index: str | os.PathLike[str],
+    sep: bytes = b"\n",
+    alg: NSType = ns.DEFAULT,
+    *,
+    chunk_size: int = 1 << 18,
+) -> NatsortIndex:
+    r"""
+    Build an index file of the lines of a file in natural order.
+
+    The lines are sorted as with :func:`natsort_mmap`, and the offset and
+    length of each line is written to `index` in natural order along with
+    its natural key, encoded with :func:`encode_key`. The index can then
+    be opened with :class:`NatsortIndex` any number of times to find the
+    lines in a natural range, or with a given prefix, by binary search,
+    without sorting the file again. The index also records the size and
+    modification time of `path`, so that it cannot be used to read the
+    lines of the file once it has changed.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The file to index.
+
+    index : str or path-like
+        The index file to write. It is overwritten if it exists.
+
+    sep : bytes, optional
+        The separator between lines. A separator at the end of the file
+        does not start another line. The default is ``b"\n"``.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. ``ns.BYTES`` is always added,
+        and the index remembers it for its lookups. The default is `ns.INT`.
+
+    chunk_size : int, optional
+        The most lines whose natural keys are held in memory at once while
+        sorting; see :func:`natsort_mmap`. The default is 262144.
+
+    Returns
+    -------
+    out : NatsortIndex
+        The new index, opened to read the lines of `path`.
+
+    See Also
+    --------
+    NatsortIndex
+    natsort_mmap
+
+    Examples
+    --------
+    Index a listing once, then look up natural ranges of it::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     _ = Path(tmp, 'in.txt').write_bytes(b'shard_10\nshard_9\nshard_100\n')
+        ...     with natsort_index(Path(tmp, 'in.txt'), Path(tmp, 'in.idx')) as idx:
+        ...         found = [idx.line(i) for i in idx.between('shard_9', 'shard_99')]
+        ...
+        >>> found
+        [b'shard_9', b'shard_10']
+
+    """
+    if not sep:
+        msg = "natsort_index: 'sep' must not be empty"
+        raise ValueError(msg)
+    if chunk_size < 1:
+        msg = f"natsort_index: 'chunk_size' must be at least 1, got {chunk_size!r}"
+        raise ValueError(msg)
+    alg |= ns.BYTES
+    with open(path, "rb") as f, open(index, "wb") as out:  # noqa: PTH123
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            # An empty file cannot be memory-mapped.
+            n = 0
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                n = _write_index(mm, sep, alg, chunk_size, out)
+        # The header is written last, so an unfinished index is not valid.
+        out.seek(0)
+        out.write(
+            _INDEX_HEADER.pack(_INDEX_MAGIC, alg, n, stat.st_size, stat.st_mtime_ns)
+        )
+    return NatsortIndex(index, path)
+
+
+def _write_index(
+    mm: mmap.mmap,
+    sep: bytes,
+    alg: NSType,
+    chunk_size: int,
+    out: BinaryIO,
+) -> int:
+    """Write the index of the lines of a memory-mapped file, but not its header."""
+    pairs = _line_positions(mm, sep)
+    offsets, lengths = pairs[::2], pairs[1::2]
+    n = len(offsets)
+
+    def line(j: int) -> bytes:
+        return mm[offsets[j] : offsets[j] + lengths[j]]
+
+    sorted_pairs = array("q")
+    key_ends = array("q")
+    end = 0
+    # The keys are written first, after space for the arrays before them.
+    out.seek(_INDEX_HEADER.size + 3 * n * sorted_pairs.itemsize)
+    for key, j in _sorted_encoded_lines(line, n, alg, chunk_size):
+        sorted_pairs.append(offsets[j])
+        sorted_pairs.append(lengths[j])
+        end += out.write(key)
+        key_ends.append(end)
+    out.seek(_INDEX_HEADER.size)
+    sorted_pairs.tofile(out)
+    key_ends.tofile(out)
+    return n
+
+
+def _sorted_encoded_lines(
+    line: Callable[[int], bytes],
+    n: int,
+    alg: NSType,
+    chunk_size: int,
+) -> Iterator[tuple[bytes, int]]:
+    """
+    Sort the line numbers by encoded key, holding one chunk of keys at a time.
+
+    Unlike `_sorted_line_index`, the keys are produced with the line numbers.
+    The encoded keys are compared as they are (then the line numbers, so that
+    equal keys stay in their order in the file) without a key function.
+    """
+    keygen = natsort_keygen(None, alg)
+    encode_key = utils.encode_key
+    presort = alg & ns.PRESORT
+
+    def entry(j: int) -> tuple[Any, ...]:
+        x = line(j)
+        key = encode_key(keygen(x))
+        # As in natsorted, PRESORT orders equal keys by str.
+        return (key, str(x), j) if presort else (key, j)
+
+    runs = []
+    for start in range(0, n, chunk_size):
+        run = sorted(map(entry, range(start, min(start + chunk_size, n))))
+        if n <= chunk_size:
+            return ((x[0], x[-1]) for x in run)
+        runs.append(array("q", [x[-1] for x in run]))
+    merged = heapq.merge(*(map(entry, run) for run in runs))
+    return ((x[0], x[-1]) for x in merged)
+
+
+class NatsortIndex:
+    r"""
+    Read an index of the lines of a file in natural order.
+
+    The index is created by :func:`natsort_index`, and is memory-mapped,
+    so opening it takes the same (short) time whatever its size. Each
+    line is identified by its position in the natural order, and lines
+    are found by a binary search of their encoded natural keys, using
+    the same algorithm that the index was built with.
+
+    Parameters
+    ----------
+    index : str or path-like
+        The index file.
+
+    path : str or path-like, optional
+        The indexed file, to read lines from with :meth:`line`. A
+        `ValueError` is raised if its size or modification time is not
+        the same as when it was indexed, since the index would then give
+        the wrong lines.
+
+    Examples
+    --------
+    Find the lines whose natural key begins with that of a prefix::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     _ = Path(tmp, 'in.txt').write_bytes(b'a1.txt\na10\na1\nb1\n')
+        ...     natsort_index(Path(tmp, 'in.txt'), Path(tmp, 'in.idx')).close()
+        ...     with NatsortIndex(Path(tmp, 'in.idx'), Path(tmp, 'in.txt')) as idx:
+        ...         found = [idx.line(i) for i in idx.prefix('a1')]
+        ...         n = len(idx)
+        ...
+        >>> found
+        [b'a1', b'a1.txt']
+        >>> n
+        4
+
+    """
+
+    __slots__ = (
+        "_files",
+        "_keygen",
+        "_keys",
+        "_maps",
+        "_pairs",
+        "_text",
+        "_views",
+        "alg",
+    )
+
+    def __init__(  # noqa: D107
+        self,
+        index: str | os.PathLike[str],
+        path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self._files: list[BinaryIO] = []
+        self._maps: list[mmap.mmap] = []
+        self._views: list[memoryview] = []
+        try:
+            mm, alg, n, stamp = _read_index_header(self._map(index), index)
+            start = _INDEX_HEADER.size
+            with memoryview(mm) as view:
+                self._views.append(view[start : start + 16 * n].cast("q"))
+                self._views.append(view[start + 16 * n : start + 24 * n].cast("q"))
+            self._pairs, ends = self._views
+            self._keys = _IndexKeys(mm, start + 24 * n, ends)
+            # An empty indexed file has no lines to read.
+            self._text = None if path is None else self._map(path, stamp) or b""
+        except BaseException:
+            self.close()
+            raise
+        self.alg: NSType = alg
+        self._keygen = natsort_keygen(None, self.alg)
+
+    def _map(
+        self,
+        path: str | os.PathLike[str],
+        stamp: tuple[int, int] | None = None,
+    ) -> mmap.mmap | None:
+        """
+        Memory-map a file for reading, or return None if it is empty.
+
+        If given, the file's size and modification time must be `stamp`.
+        """
+        f = open(path, "rb")  # noqa: PTH123, SIM115
+        self._files.append(f)
+        stat = os.fstat(f.fileno())
+        if stamp is not None and (stat.st_size, stat.st_mtime_ns) != stamp:
+            msg = f"NatsortIndex: {os.fspath(path)!r} has changed since it was indexed"
+            raise ValueError(msg)
+        if stat.st_size == 0:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mm)
+        return mm
+
+    def _encode(self, x: str | bytes, prefix: bool = False) -> bytes:
+        """Encode the natural key of a query."""
+        if isinstance(x, str):
+            x = x.encode()
+        return utils.encode_key(self._keygen(x), prefix=prefix)
+
+    def __len__(self) -> int:
+        """Return the number of lines in the index."""
+        return len(self._keys)
+
+    def __getitem__(self, i: int) -> tuple[int, int]:
+        """Return the offset and length of the line at position *i*."""
+        i = range(len(self))[i]
+        return self._pairs[2 * i], self._pairs[2 * i + 1]
+
+    def line(self, i: int) -> bytes:
+        """Return the line at position *i* from the indexed file."""
+        if self._text is None:
+            msg = "NatsortIndex: the indexed file was not given"
+            raise ValueError(msg)
+        offset, length = self[i]
+        return self._text[offset : offset + length]
+
+    def key(self, i: int) -> bytes:
+        """Return the encoded natural key of the line at position *i*."""
+        return self._keys[range(len(self))[i]]
+
+    def bisect_left(self, x: str | bytes) -> int:
+        """Return the position of the first line not before *x*."""
+        return bisect_left(self._keys, self._encode(x))
+
+    def bisect_right(self, x: str | bytes) -> int:
+        """Return the position of the first line after *x*."""
+        return bisect_right(self._keys, self._encode(x))
+
+    def between(
+        self,
+        low: str | bytes | None = None,
+        high: str | bytes | None = None,
+    ) -> range:
+        """
+        Return the positions of the lines from *low* to *high*, inclusive.
+
+        Either end may be None to leave that side of the range open.
+        `str` arguments are encoded as UTF-8.
+        """
+        start = 0 if low is None else self.bisect_left(low)
+        stop = len(self) if high is None else self.bisect_right(high)
+        return range(start, max(start, stop))
+
+    def prefix(self, x: str | bytes) -> range:
+        """
+        Return the positions of the lines whose natural key begins with that of *x*.
+
+        The last part of *x* may be incomplete if it is text, so ``"a1.t"``
+        matches ``"a1.txt"``, but not if it is a number, so ``"a1"`` does
+        not match ``"a10"`` (which is not next to ``"a1"`` in natural order).
+        `str` arguments are encoded as UTF-8.
+        """
+        target = self._encode(x, prefix=True)
+        start = bisect_left(self._keys, target)
+        stop = bisect_right(_KeyPrefixes(self._keys, len(target)), target, start)
+        return range(start, stop)
+
+    def close(self) -> None:
+        """Close the index and the indexed file."""
+        # The views of the index must be released before it can be closed.
+        for view in self._views:
+            view.release()
+        for mm in self._maps:
+            mm.close()
+        for f in self._files:
+            f.close()
+        self._views.clear()
+        self._maps.clear()
+        self._files.clear()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+
+def _read_index_header(
+    mm: mmap.mmap | None,
+    index: str | os.PathLike[str],
+) -> tuple[mmap.mmap, int, int, tuple[int, int]]:
+    """
+    Check an index.
+
+    Return it with its algorithm, number of lines, and the size and
+    modification time of the indexed file.
+    """
+    if mm is None or mm[: len(_INDEX_MAGIC)] != _INDEX_MAGIC:
+        msg = f"{os.fspath(index)!r} is not a natsort index for this machine"
+        raise ValueError(msg)
+    _, alg, n, size, mtime = _INDEX_HEADER.unpack_from(mm)
+    return mm, alg, n, (size, mtime)
+
+
+class _IndexKeys:
+    """The encoded keys of an index, as a sequence for bisection."""
+
+    __slots__ = ("_ends", "_mm", "_start")
+
+    def __init__(self, mm: mmap.mmap, start: int, ends: memoryview) -> None:
+        self._mm = mm
+        self._start = start
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self._start + (self._ends[i - 1] if i else 0)
+        return self._mm[start : self._start + self._ends[i]]
+
+
+class _KeyPrefixes:
+    """The first *size* bytes of each key of an index."""
+
+    __slots__ = ("_keys", "_size")
+
+    def __init__(self, keys: _IndexKeys, size: int) -> None:
+        self._keys = keys
+        self._size = size
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._keys[i][: self._size]
@@ -1,21 +1,31 @@
 """
-Along with ns_enum.py, this module contains all of the natsort public API.
+Along with ns_enum.py, this module contains most of the natsort public API.
 
-The majority of the "work" is defined in utils.py.
+The majority of the "work" is defined in utils.py. Sorting of directory
+listings is in fs.py, and of the lines of large files in mmap_index.py.
 """
 
 from __future__ import annotations
 
-import platform
-from functools import partial
+import heapq
+import random
+import sys
+import weakref
+from array import array
+from bisect import bisect_left
+from functools import cache, lru_cache, partial
+from importlib import import_module
+from itertools import groupby
 from operator import itemgetter
 from pathlib import PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Literal,
     TypeVar,
     cast,
+    overload,
 )
 
 import natsort.compat.locale
@@ -24,7 +34,8 @@ from natsort.ns_enum import NS_DUMB, NSType, ns
 from natsort.utils import NatsortInType, NatsortOutType
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Sequence
+    from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+
 
 # Common input and output types
 T = TypeVar("T")
@@ -128,6 +139,9 @@ def as_utf8(s: Any) -> Any:  # noqa: ANN401
 def natsort_keygen(
     key: Callable[[Any], NatsortInType] | None = None,
     alg: NSType = ns.DEFAULT,
+    *,
+    fields: Iterable[tuple[Callable[[Any], NatsortInType] | None, NSType]]
+    | None = None,
 ) -> Callable[[Any], NatsortOutType]:
     """
     Generate a key to sort strings and numbers naturally.
@@ -151,6 +165,14 @@ def natsort_keygen(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    fields : iterable of (callable, ns enum) pairs, optional
+        Sort by several fields of each input, each with its own algorithm.
+        Each pair gives a function that extracts the field from the
+        input (or `None` to use the input as-is) and the `ns` options
+        for that field, which are combined with `alg`. The returned key
+        is a tuple of the natural sort key of each field, in order.
+        If `key` is also given, it is applied before extracting the fields.
+
     Returns
     -------
     out : function
@@ -173,6 +195,21 @@ def natsort_keygen(
         >>> a
         ['num-3', 'num2', 'num5.10', 'num5.3']
 
+    Use `fields` to sort rows by several columns, each parsed differently::
+
+        >>> from operator import itemgetter
+        >>> rows = [('v1', 'b-2.5'), ('V2', 'a1'), ('v1', 'B-10')]
+        >>> rows.sort(
+        ...     key=natsort_keygen(
+        ...         fields=[
+        ...             (itemgetter(0), ns.IGNORECASE),
+        ...             (itemgetter(1), ns.REAL | ns.IGNORECASE),
+        ...         ]
+        ...     )
+        ... )
+        >>> rows
+        [('v1', 'B-10'), ('v1', 'b-2.5'), ('V2', 'a1')]
+
     """
     try:
         ns.DEFAULT | alg
@@ -180,6 +217,38 @@ def natsort_keygen(
         msg = "natsort_keygen: 'alg' argument must be from the enum 'ns'"
         raise ValueError(msg + f", got {alg!s}") from None
 
+    # Each field gets its own parsing functions, chosen only once.
+    if fields is not None:
+        return _fields_keygen(key, alg, fields)
+
+    # Return the natsort key with the parsing path pre-chosen.
+    string_func, bytes_func, num_func = _parse_functions(alg)
+    return partial(
+        utils.natsort_key,
+        key=key,
+        string_func=string_func,
+        bytes_func=bytes_func,
+        num_func=num_func,
+    )
+
+
+def _parse_functions(
+    alg: NSType,
+) -> tuple[
+    utils.StrParser | utils.PathSplitter,
+    utils.BytesTransformer,
+    utils.NumTransformer,
+]:
+    """Create the functions that parse strings, bytes, and numbers."""
+    # Versions have their own parser that bypasses the general machinery.
+    if alg & ns.VERSION:
+        version_func = utils.parse_version_factory(alg)
+        return (
+            version_func,
+            utils.parse_bytes_factory(alg),
+            utils.parse_version_number_or_none_factory(version_func),
+        )
+
     # Add the NS_DUMB option if the locale library is broken.
     if alg & ns.LOCALEALPHA and natsort.compat.locale.dumb_sort():
         alg |= NS_DUMB
@@ -205,7 +274,7 @@ def natsort_keygen(
     final_transform = utils.final_data_transform_factory(alg, sep, pre_sep)
 
     # Create the high-level parsing functions for strings, bytes, and numbers.
-    string_func = utils.parse_string_factory(
+    string_func: utils.StrParser | utils.PathSplitter = utils.parse_string_factory(
         alg,
         sep,
         regex.split,
@@ -217,30 +286,176 @@ def natsort_keygen(
         string_func = utils.parse_path_factory(string_func)
     bytes_func = utils.parse_bytes_factory(alg)
     num_func = utils.parse_number_or_none_factory(alg, sep, pre_sep)
+    return string_func, bytes_func, num_func
 
-    # Return the natsort key with the parsing path pre-chosen.
-    return partial(
-        utils.natsort_key,
-        key=key,
-        string_func=string_func,
-        bytes_func=bytes_func,
-        num_func=num_func,
-    )
+
+def _fields_keygen(
+    key: Callable[[Any], Any] | None,
+    alg: NSType,
+    fields: Iterable[tuple[Callable[[Any], NatsortInType] | None, NSType]],
+) -> Callable[[Any], NatsortOutType]:
+    """Combine the natsort keys of several fields into a single key."""
+    parsers = []
+    for getter, field_alg in fields:
+        try:
+            combined_alg = alg | field_alg
+        except TypeError:
+            msg = "natsort_keygen: 'alg' argument must be from the enum 'ns'"
+            raise ValueError(msg + f", got {field_alg!s}") from None
+        parsers.append((getter, *_parse_functions(combined_alg)))
+
+    def fields_key(
+        x: Any,  # noqa: ANN401
+        *,
+        _parsers: tuple[Any, ...] = tuple(parsers),
+        _natsort_key: Callable[..., NatsortOutType] = utils.natsort_key,
+    ) -> NatsortOutType:
+        if key is not None:
+            x = key(x)
+        out = []
+        for getter, string_func, bytes_func, num_func in _parsers:
+            val = x if getter is None else getter(x)
+            # Most fields are strings, which are parsed directly; anything
+            # else goes through the usual type checks of natsort_key.
+            if type(val) is str:
+                out.append(string_func(val))
+            else:
+                out.append(_natsort_key(val, None, string_func, bytes_func, num_func))
+        return tuple(out)
+
+    return fields_key
 
 
 # Exposed for simplicity if one needs the default natsort key.
-natsort_key = natsort_keygen()
-natsort_key.__doc__ = """\
-natsort_key(val)
-The default natural sorting key.
+# It is created on first access, see __getattr__ at the bottom of this module.
+natsort_key: NatsortKeyType
 
-This is the output of :func:`natsort_keygen` with default values.
 
-See Also
---------
-natsort_keygen
+class CachedNatsortKey:
+    """
+    A natsort key that remembers the key it computed for each object.
 
-"""
+    Created by :func:`cached_natsort_keygen`; see there for details.
+    The computed keys are stored by object identity, and each one is
+    forgotten when its object is garbage collected.
+    """
+
+    __slots__ = ("_cache", "_natsort_key")
+
+    def __init__(self, natsort_key: Callable[[Any], NatsortOutType]) -> None:  # noqa: D107
+        self._natsort_key = natsort_key
+        self._cache: dict[int, tuple[weakref.ref[Any], NatsortOutType]] = {}
+
+    def __call__(self, x: Any) -> NatsortOutType:  # noqa: ANN401
+        """Return the natsort key of *x*, computing it only if needed."""
+        entry = self._cache.get(id(x))
+        if entry is not None:
+            return entry[1]
+        out = self._natsort_key(x)
+        try:
+            ref = weakref.ref(x, partial(_forget_cached_key, self._cache, id(x)))
+        except TypeError:
+            # Objects that cannot be weakly referenced (e.g. str or tuple)
+            # are never cached, because there is no way to tell when their
+            # identity could be reused by another object.
+            return out
+        self._cache[id(x)] = (ref, out)
+        return out
+
+    def __len__(self) -> int:
+        """Return the number of objects whose key is currently stored."""
+        return len(self._cache)
+
+    def invalidate(self, *objs: Any) -> None:  # noqa: ANN401
+        """Forget the stored keys of the given objects, if any."""
+        for obj in objs:
+            entry = self._cache.get(id(obj))
+            if entry is not None and entry[0]() is obj:
+                del self._cache[id(obj)]
+
+    def clear(self) -> None:
+        """Forget all stored keys."""
+        self._cache.clear()
+
+
+def _forget_cached_key(
+    cache: dict[int, tuple[weakref.ref[Any], NatsortOutType]],
+    ident: int,
+    ref: weakref.ref[Any],
+) -> None:
+    """Remove the entry for an object that was just garbage collected."""
+    entry = cache.get(ident)
+    if entry is not None and entry[0] is ref:
+        del cache[ident]
+
+
+def cached_natsort_keygen(
+    key: Callable[[Any], NatsortInType] | None = None,
+    alg: NSType = ns.DEFAULT,
+    *,
+    fields: Iterable[tuple[Callable[[Any], NatsortInType] | None, NSType]]
+    | None = None,
+) -> CachedNatsortKey:
+    """
+    Generate a natsort key that caches the key of each object.
+
+    This is intended for long-lived objects (e.g. database rows or GUI
+    models) that are sorted over and over again. The first time each
+    object is given to the returned key, its key is computed exactly
+    as with :func:`natsort_keygen` and stored against the identity
+    of the object, so it does not need to be hashable. Later calls
+    with the same object return the stored key.
+
+    Objects that do not support weak references, such as `str`,
+    `int`, or `tuple`, are never cached.
+
+    Parameters
+    ----------
+    key : callable, optional
+        A key used to manipulate the input value before parsing for
+        numbers. It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    fields : iterable of (callable, ns enum) pairs, optional
+        Sort by several fields of each input, each with its own algorithm.
+        See :func:`natsort_keygen` for details.
+
+    Returns
+    -------
+    out : CachedNatsortKey
+        A callable suitable for passing as the `key` argument to
+        functions such as `sorted`. If an object changes in a way
+        that affects its key, call ``out.invalidate(obj)`` to
+        forget its stored key, or ``out.clear()`` to forget all
+        stored keys.
+
+    See Also
+    --------
+    natsort_keygen
+
+    Examples
+    --------
+    Re-sort the same objects without recomputing their keys::
+
+        >>> class Item:
+        ...     def __init__(self, name):
+        ...         self.name = name
+        >>> items = [Item('num3'), Item('num5'), Item('num2')]
+        >>> key = cached_natsort_keygen(key=lambda x: x.name)
+        >>> [x.name for x in sorted(items, key=key)]
+        ['num2', 'num3', 'num5']
+        >>> items[2].name = 'num9'
+        >>> key.invalidate(items[2])
+        >>> [x.name for x in sorted(items, key=key)]
+        ['num3', 'num5', 'num9']
+
+    """
+    return CachedNatsortKey(natsort_keygen(key, alg, fields=fields))
 
 
 def natsorted(
@@ -282,6 +497,7 @@ def natsorted(
     realsorted : A wrapper for ``natsorted(seq, alg=ns.REAL)``.
     humansorted : A wrapper for ``natsorted(seq, alg=ns.LOCALE)``.
     index_natsorted : Returns the sorted indexes from `natsorted`.
+    natsort_inplace : Sort a list in place.
     os_sorted : Sort according to your operating system's rules.
 
     Examples
@@ -293,21 +509,26 @@ def natsorted(
         ['num2', 'num3', 'num5']
 
     """
-    if alg & ns.PRESORT:
-        seq = sorted(seq, reverse=reverse, key=str)
-    return sorted(seq, reverse=reverse, key=natsort_keygen(key, alg))
+    result = list(seq)
+    natsort_inplace(result, key, reverse, alg)
+    return result
 
 
-def humansorted(
+def natsorted_iter(
     seq: Iterable[T],
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
-) -> list[T]:
+) -> Iterator[T]:
     """
-    Sort an iterable naturally while properly sorting non-numeric characters.
+    Iterate over an iterable in natural order without sorting it all first.
 
-    This is a wrapper around ``natsorted(seq, alg=ns.LOCALE)``.
+    The keys of all elements are computed up front and arranged into a
+    heap in linear time, after which each element is produced on demand.
+    Reading the first `k` of `N` elements therefore takes O(N + k log N)
+    time rather than the O(N log N) of `natsorted`, which is useful
+    when only the first few elements are needed (e.g. for pagination).
+    The elements are produced in the same order as `natsorted`.
 
     Parameters
     ----------
@@ -315,71 +536,99 @@ def humansorted(
         The input to sort.
 
     key : callable, optional
-        A key used to determine how to sort each element of the sequence.
+        A key used to determine how to sort each element of the iterable.
         It is **not** applied recursively.
         It should accept a single argument and return a single value.
 
     reverse : {{True, False}}, optional
-        Return the list in reversed sorted order. The default is
+        Produce the elements in reversed sorted order. The default is
         `False`.
 
     alg : ns enum, optional
         This option is used to control which algorithm `natsort`
         uses when sorting. For details into these options, please see
-        the :class:`ns` class documentation. The default is `ns.LOCALE`.
+        the :class:`ns` class documentation. The default is `ns.INT`.
 
     Returns
     -------
-    out : list
-        The sorted input.
+    out : iterator
+        The elements of the input, in sorted order.
 
     See Also
     --------
-    index_humansorted : Returns the sorted indexes from `humansorted`.
-
-    Notes
-    -----
-    Please read :ref:`locale_issues` before using `humansorted`.
+    natsorted
 
     Examples
     --------
-    Use `humansorted` just like the builtin `sorted`::
+    Take only the first elements in natural order::
 
-        >>> a = ['Apple', 'Banana', 'apple', 'banana']
-        >>> natsorted(a)
-        ['Apple', 'Banana', 'apple', 'banana']
-        >>> humansorted(a)
-        ['apple', 'Apple', 'banana', 'Banana']
+        >>> from itertools import islice
+        >>> a = ['num3', 'num5', 'num2', 'num10', 'num1']
+        >>> list(islice(natsorted_iter(a), 2))
+        ['num1', 'num2']
 
     """
-    return natsorted(seq, key, reverse, alg | ns.LOCALE)
+    items = list(seq)
+    keys: Iterable[Any] = map(natsort_keygen(key, alg), items)
+    if alg & ns.PRESORT:
+        # Equal keys are ordered by their string form, like natsorted.
+        keys = zip(keys, map(str, items))
+    if reverse:
+        keys = map(_ReverseOrder, keys)
+    # The position breaks ties between equal keys to keep the sort stable.
+    heap = list(zip(keys, range(len(items))))
+    heapq.heapify(heap)
+    return _pop_in_order(heap, items)
 
 
-def realsorted(
-    seq: Iterable[T],
-    key: Callable[[T], NatsortInType] | None = None,
+class _ReverseOrder:
+    """Wrap a key so that it compares in the opposite order."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:  # noqa: ANN401
+        self.key = key
+
+    def __lt__(self, other: _ReverseOrder) -> bool:
+        return bool(other.key < self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ReverseOrder) and bool(self.key == other.key)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _pop_in_order(heap: list[tuple[Any, int]], items: list[T]) -> Iterator[T]:
+    """Pop the elements of the heap one at a time."""
+    while heap:
+        yield items[heapq.heappop(heap)[1]]
+
+
+def natsorted_paths(
+    paths: Iterable[T],
+    key: Callable[[T], str | PurePath] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
 ) -> list[T]:
     """
-    Sort an iterable naturally while properly sorting signed floats.
-
-    A signed float in a string could be "a-5.7". This is a wrapper around
-    ``natsorted(seq, alg=ns.REAL)``.
+    Naturally sort file paths, parsing each distinct path component once.
 
-    The behavior of :func:`realsorted` for `natsort` version >= 4.0.0
-    was the default behavior of :func:`natsorted` for `natsort`
-    version < 4.0.0.
+    This returns the same result as ``natsorted(paths, key, reverse,
+    alg | ns.PATH)``, but is faster for many paths that share their
+    directories. Instead of computing a key for every component of every
+    path, the paths are inserted into a tree of their components, the
+    key of each distinct component is computed only once, and the
+    children of each node of the tree are sorted separately.
 
     Parameters
     ----------
-    seq : iterable
-        The input to sort.
+    paths : iterable
+        The paths to sort, as strings or `pathlib.PurePath` objects.
 
     key : callable, optional
-        A key used to determine how to sort each element of the sequence.
-        It is **not** applied recursively.
-        It should accept a single argument and return a single value.
+        A key used to get the path of each element of the iterable.
+        It should accept a single argument and return a string or
+        `pathlib.PurePath`.
 
     reverse : {{True, False}}, optional
         Return the list in reversed sorted order. The default is
@@ -388,7 +637,8 @@ def realsorted(
     alg : ns enum, optional
         This option is used to control which algorithm `natsort`
         uses when sorting. For details into these options, please see
-        the :class:`ns` class documentation. The default is `ns.REAL`.
+        the :class:`ns` class documentation. ``ns.PATH`` is always
+        added. The default is `ns.INT`.
 
     Returns
     -------
@@ -397,49 +647,119 @@ def realsorted(
 
     See Also
     --------
-    index_realsorted : Returns the sorted indexes from `realsorted`.
+    natsorted
+    os_sorted
 
     Examples
     --------
-    Use `realsorted` just like the builtin `sorted`::
+    Sort paths by each of their components::
 
-        >>> a = ['num5.10', 'num-3', 'num5.3', 'num2']
-        >>> natsorted(a)
-        ['num2', 'num5.3', 'num5.10', 'num-3']
-        >>> realsorted(a)
-        ['num-3', 'num2', 'num5.10', 'num5.3']
+        >>> a = ['dir10/file2', 'dir2/file10', 'dir2/file1.txt', 'dir2']
+        >>> natsorted_paths(a)
+        ['dir2', 'dir2/file1.txt', 'dir2/file10', 'dir10/file2']
 
     """
-    return natsorted(seq, key, reverse, alg | ns.REAL)
+    items = list(paths)
+    if alg & ns.VERSION:
+        # Versions are not split into path components.
+        return natsorted(items, key, reverse, alg | ns.PATH)
 
-
-def index_natsorted(
+    if key is None:
+        root = _path_tree(cast("list[str | PurePath]", items), alg)
+    else:
+        root = _path_tree(map(key, items), alg)
+
+    # Walk the tree depth-first. A path sorts before the paths that it is
+    # a prefix of, so each node's own positions come before its children
+    # (or after them when reversed).
+    result: list[T] = []
+    stack: list[_PathNode | list[int]] = [root]
+    while stack:
+        top = stack.pop()
+        if isinstance(top, list):
+            result.extend(map(items.__getitem__, top))
+            continue
+        if alg & ns.PRESORT:
+            # Only positions with the same key are here, ordered by str.
+            top.positions.sort(key=lambda i: str(items[i]), reverse=reverse)
+        if reverse:
+            stack.append(top.positions)
+        stack.extend(top.children[k] for k in sorted(top.children, reverse=not reverse))
+        if not reverse:
+            stack.append(top.positions)
+    return result
+
+
+def _path_tree(paths: Iterable[str | PurePath], alg: NSType) -> _PathNode:
+    """Insert the positions of paths into a tree keyed by their components."""
+    # Components with equal keys share a node, because a path key is
+    # compared component by component, even if the components differ.
+    component_key = natsort_keygen(None, alg & ~ns.PATH)
+    component_keys: dict[str, NatsortOutType] = {}
+    root = _PathNode()
+    for i, path in enumerate(paths):
+        node = root
+        for component in utils.path_splitter(path):
+            try:
+                k = component_keys[component]
+            except KeyError:
+                k = component_keys[component] = component_key(component)
+            try:
+                node = node.children[k]
+            except KeyError:
+                node.children[k] = node = _PathNode()
+        node.positions.append(i)
+    return root
+
+
+class _PathNode:
+    """A node in a tree of path components."""
+
+    __slots__ = ("children", "positions")
+
+    def __init__(self) -> None:
+        self.children: dict[NatsortOutType, _PathNode] = {}
+        self.positions: list[int] = []
+
+
+def natgroupby(
     seq: Iterable[T],
+    by: int | Callable[[NatsortOutType], Any] = 1,
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
-) -> list[int]:
+) -> Iterator[tuple[Any, list[T]]]:
     """
-    Determine the list of the indexes used to sort the input sequence.
+    Naturally sort an iterable and group it by the start of each natural key.
 
-    Sorts a sequence naturally, but returns a list of sorted the
-    indexes and not the sorted list itself. This list of indexes
-    can be used to sort multiple lists by the sorted order of the
-    given sequence.
+    The natural key of each element is computed only once, both to sort
+    the input and to group it, so that e.g. all files whose names begin
+    with the same text can be collected without parsing them again.
 
     Parameters
     ----------
     seq : iterable
-        The input to sort.
+        The input to sort and group.
+
+    by : int or callable, optional
+        How to group the natural keys. An integer groups the elements
+        whose natural keys share that many leading components. A callable
+        is given each natural key and returns the value to group by; it
+        must be consistent with the sort order, so that each group is
+        contiguous. The default is 1, which groups by the first component
+        of each natural key. That is the leading text of each element, or
+        an empty string if it starts with a number, so all the elements
+        that start with a number form one group (use 2 to also group them
+        by that number).
 
     key : callable, optional
-        A key used to determine how to sort each element of the sequence.
+        A key used to determine how to sort each element of the iterable.
         It is **not** applied recursively.
         It should accept a single argument and return a single value.
 
     reverse : {{True, False}}, optional
-        Return the list in reversed sorted order. The default is
-        `False`.
+        Return the groups, and the elements within them, in reversed
+        sorted order. The default is `False`.
 
     alg : ns enum, optional
         This option is used to control which algorithm `natsort`
@@ -448,64 +768,125 @@ def index_natsorted(
 
     Returns
     -------
-    out : tuple
-        The ordered indexes of the input.
+    out : iterator
+        Pairs of the shared start of the natural keys (as computed by
+        `natsort_keygen`) and a list of the elements of that group, in
+        sorted order.
+
+    Raises
+    ------
+    ValueError
+        If `by` is an integer less than 1.
 
     See Also
     --------
     natsorted
-    order_by_index
+    natsort_keygen
 
     Examples
     --------
-    Use index_natsorted if you want to sort multiple lists by the
-    sorted order of one list::
+    Group frame files by the name of their sequence::
 
-        >>> a = ['num3', 'num5', 'num2']
-        >>> b = ['foo', 'bar', 'baz']
-        >>> index = index_natsorted(a)
-        >>> index
-        [2, 0, 1]
-        >>> # Sort both lists by the sort order of a
-        >>> order_by_index(a, index)
-        ['num2', 'num3', 'num5']
-        >>> order_by_index(b, index)
-        ['baz', 'foo', 'bar']
+        >>> a = ['shot_b10.exr', 'shot_a2.exr', 'shot_b9.exr', 'shot_a10.exr']
+        >>> for prefix, group in natgroupby(a):
+        ...     print(prefix, group)
+        ...
+        ('shot_a',) ['shot_a2.exr', 'shot_a10.exr']
+        ('shot_b',) ['shot_b9.exr', 'shot_b10.exr']
 
     """
-    newkey: Callable[[tuple[int, T]], NatsortInType]
-    if key is None:
-        newkey = itemgetter(1)
-    else:
+    if isinstance(by, int):
+        if by < 1:
+            msg = f"natgroupby: 'by' must be at least 1, got {by!r}"
+            raise ValueError(msg)
+        by = itemgetter(slice(by))
+    items = list(seq)
+    index, keys = _natsort_index_and_keys(items, key, reverse, alg)
+    prefixes = map(by, map(keys.__getitem__, index))
+    return _group_in_order(zip(prefixes, index), items)
+
+
+def _group_in_order(
+    prefixed: Iterable[tuple[Any, int]], items: list[T]
+) -> Iterator[tuple[Any, list[T]]]:
+    """Collect the runs of sorted indexes with the same prefix into groups."""
+    for prefix, group in groupby(prefixed, itemgetter(0)):
+        yield prefix, [items[i] for _, i in group]
+
+
+def natsort_inplace(
+    lst: list[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> None:
+    """
+    Sort a list naturally, in place.
+
+    This is the in-place counterpart of `natsorted`, in the same way
+    that ``list.sort`` is the in-place counterpart of `sorted`.
+    No copy of the list is made, even when using ``ns.PRESORT``.
+
+    Parameters
+    ----------
+    lst : list
+        The list to sort.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the list.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Sort the list in reversed order. The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    See Also
+    --------
+    natsorted : Returns a new sorted list instead.
+    natsort_keygen : Generates the key that makes natural sorting possible.
+
+    Examples
+    --------
+    Use `natsort_inplace` just like the ``list.sort`` method::
 
-        def newkey(x: tuple[int, T]) -> NatsortInType:
-            return key(itemgetter(1)(x))
+        >>> a = ['num3', 'num5', 'num2']
+        >>> natsort_inplace(a)
+        >>> a
+        ['num2', 'num3', 'num5']
 
-    # Pair the index and sequence together, then sort by element
-    index_seq_pair = list(enumerate(seq))
+    """
+    # PRESORT is deliberately two stable sorts rather than one sort with
+    # a (natural key, str) composite key. Comparing tuples checks each
+    # natural key for equality before ordering it, roughly doubling the
+    # cost of every comparison, while sorting by str is fast and leaves
+    # runs in the data that the natural sort takes advantage of.
     if alg & ns.PRESORT:
-        index_seq_pair.sort(reverse=reverse, key=lambda x: str(itemgetter(1)(x)))
-    index_seq_pair.sort(reverse=reverse, key=natsort_keygen(newkey, alg))
-    return [x for x, _ in index_seq_pair]
+        lst.sort(reverse=reverse, key=str)
+    lst.sort(reverse=reverse, key=natsort_keygen(key, alg))
 
 
-def index_humansorted(
+def humansorted(
     seq: Iterable[T],
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
-) -> list[int]:
+) -> list[T]:
     """
-    Get the list of indexes of ``humansorted``.
+    Sort an iterable naturally while properly sorting non-numeric characters.
 
-    This is a wrapper around ``index_natsorted(seq, alg=ns.LOCALE)``.
+    This is a wrapper around ``natsorted(seq, alg=ns.LOCALE)``.
 
     Parameters
     ----------
-    seq: iterable
+    seq : iterable
         The input to sort.
 
-    key: callable, optional
+    key : callable, optional
         A key used to determine how to sort each element of the sequence.
         It is **not** applied recursively.
         It should accept a single argument and return a single value.
@@ -521,13 +902,12 @@ def index_humansorted(
 
     Returns
     -------
-    out : tuple
-        The ordered indexes of the input.
+    out : list
+        The sorted input.
 
     See Also
     --------
-    humansorted
-    order_by_index
+    index_humansorted : Returns the sorted indexes from `humansorted`.
 
     Notes
     -----
@@ -535,33 +915,40 @@ def index_humansorted(
 
     Examples
     --------
-    Use `index_humansorted` just like the builtin `sorted`::
+    Use `humansorted` just like the builtin `sorted`::
 
         >>> a = ['Apple', 'Banana', 'apple', 'banana']
-        >>> index_humansorted(a)
-        [2, 0, 3, 1]
+        >>> natsorted(a)
+        ['Apple', 'Banana', 'apple', 'banana']
+        >>> humansorted(a)
+        ['apple', 'Apple', 'banana', 'Banana']
 
     """
-    return index_natsorted(seq, key, reverse, alg | ns.LOCALE)
+    return natsorted(seq, key, reverse, alg | ns.LOCALE)
 
 
-def index_realsorted(
+def realsorted(
     seq: Iterable[T],
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
-) -> list[int]:
+) -> list[T]:
     """
-    Get the list of indexes of ``realsorted``.
+    Sort an iterable naturally while properly sorting signed floats.
 
-    This is a wrapper around ``index_natsorted(seq, alg=ns.REAL)``.
+    A signed float in a string could be "a-5.7". This is a wrapper around
+    ``natsorted(seq, alg=ns.REAL)``.
+
+    The behavior of :func:`realsorted` for `natsort` version >= 4.0.0
+    was the default behavior of :func:`natsorted` for `natsort`
+    version < 4.0.0.
 
     Parameters
     ----------
-    seq: iterable
+    seq : iterable
         The input to sort.
 
-    key: callable, optional
+    key : callable, optional
         A key used to determine how to sort each element of the sequence.
         It is **not** applied recursively.
         It should accept a single argument and return a single value.
@@ -577,30 +964,812 @@ def index_realsorted(
 
     Returns
     -------
-    out : tuple
-        The ordered indexes of the input.
+    out : list
+        The sorted input.
 
     See Also
     --------
-    realsorted
-    order_by_index
+    index_realsorted : Returns the sorted indexes from `realsorted`.
 
     Examples
     --------
-    Use `index_realsorted` just like the builtin `sorted`::
+    Use `realsorted` just like the builtin `sorted`::
 
         >>> a = ['num5.10', 'num-3', 'num5.3', 'num2']
-        >>> index_realsorted(a)
-        [1, 3, 0, 2]
+        >>> natsorted(a)
+        ['num2', 'num5.3', 'num5.10', 'num-3']
+        >>> realsorted(a)
+        ['num-3', 'num2', 'num5.10', 'num5.3']
 
     """
-    return index_natsorted(seq, key, reverse, alg | ns.REAL)
+    return natsorted(seq, key, reverse, alg | ns.REAL)
 
 
-def order_by_index(
-    seq: Sequence[Any],
-    index: Iterable[int],
-    iter: bool = False,
+def versionsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> list[T]:
+    """
+    Sort an iterable of version strings.
+
+    This is a wrapper around ``natsorted(seq, alg=ns.VERSION)``.
+    Dotted releases are compared number by number, and pre-release
+    tags like "rc2" or "-beta.3" sort before the release they belong to.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to sort.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.VERSION`.
+
+    Returns
+    -------
+    out : list
+        The sorted input.
+
+    See Also
+    --------
+    natsorted
+
+    Examples
+    --------
+    Use `versionsorted` just like the builtin `sorted`::
+
+        >>> a = ['1.10.0', '1.9.2', '1.10.0rc2', '2.0.0-beta.3', '1.10.0.post1']
+        >>> realsorted(a)
+        ['1.10.0', '1.10.0.post1', '1.10.0rc2', '1.9.2', '2.0.0-beta.3']
+        >>> versionsorted(a)
+        ['1.9.2', '1.10.0rc2', '1.10.0', '1.10.0.post1', '2.0.0-beta.3']
+
+    """
+    return natsorted(seq, key, reverse, alg | ns.VERSION)
+
+
+@overload
+def index_natsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    output: Literal["list"] = ...,
+) -> list[int]: ...
+
+
+@overload
+def index_natsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    output: Literal["array"],
+) -> array[int]: ...
+
+
+@overload
+def index_natsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    output: Literal["numpy"],
+) -> Any: ...  # noqa: ANN401
+
+
+def index_natsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+    *,
+    output: Literal["list", "array", "numpy"] = "list",
+) -> list[int] | array[int] | Any:
+    """
+    Determine the list of the indexes used to sort the input sequence.
+
+    Sorts a sequence naturally, but returns a list of sorted the
+    indexes and not the sorted list itself. This list of indexes
+    can be used to sort multiple lists by the sorted order of the
+    given sequence.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to sort.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    output : {{"list", "array", "numpy"}}, optional
+        The type of the returned indexes. "array" returns a compact
+        ``array.array('l')`` and "numpy" returns a NumPy integer array
+        (which requires NumPy to be installed). The default is "list".
+
+    Returns
+    -------
+    out : list
+        The ordered indexes of the input.
+
+    See Also
+    --------
+    natsorted
+    order_by_index
+
+    Examples
+    --------
+    Use index_natsorted if you want to sort multiple lists by the
+    sorted order of one list::
+
+        >>> a = ['num3', 'num5', 'num2']
+        >>> b = ['foo', 'bar', 'baz']
+        >>> index = index_natsorted(a)
+        >>> index
+        [2, 0, 1]
+        >>> # Sort both lists by the sort order of a
+        >>> order_by_index(a, index)
+        ['num2', 'num3', 'num5']
+        >>> order_by_index(b, index)
+        ['baz', 'foo', 'bar']
+
+    """
+    _check_output("index_natsorted", output)
+    index, _ = _natsort_index_and_keys(seq, key, reverse, alg)
+    return _convert_output(index, output)
+
+
+def _natsort_index_and_keys(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None,
+    reverse: bool,
+    alg: NSType,
+) -> tuple[list[int], list[NatsortOutType]]:
+    """Return the sorted indexes of *seq*, and the key of each element."""
+    # Compute each key once, then sort the positions by looking up their key.
+    # See natsort_inplace for why PRESORT is implemented as two sorts.
+    if alg & ns.PRESORT:
+        seq = list(seq)
+    keys = list(map(natsort_keygen(key, alg), seq))
+    index = list(range(len(keys)))
+    if alg & ns.PRESORT:
+        index.sort(reverse=reverse, key=list(map(str, seq)).__getitem__)
+    index.sort(reverse=reverse, key=keys.__getitem__)
+    return index, keys
+
+
+def _check_output(func_name: str, output: str) -> None:
+    """Ensure the requested output type of a function returning integers exists."""
+    if output not in {"list", "array", "numpy"}:
+        msg = f"{func_name}: 'output' must be 'list', 'array', or 'numpy'"
+        raise ValueError(msg + f", got {output!r}")
+
+
+def _convert_output(
+    values: list[int],
+    output: str,
+) -> list[int] | array[int] | Any:  # noqa: ANN401
+    """Convert a list of integers to the requested output type."""
+    if output == "array":
+        return array("l", values)
+    if output == "numpy":
+        np = import_module("numpy")
+        return np.array(values, dtype=np.intp)
+    return values
+
+
+def index_humansorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> list[int]:
+    """
+    Get the list of indexes of ``humansorted``.
+
+    This is a wrapper around ``index_natsorted(seq, alg=ns.LOCALE)``.
+
+    Parameters
+    ----------
+    seq: iterable
+        The input to sort.
+
+    key: callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.LOCALE`.
+
+    Returns
+    -------
+    out : tuple
+        The ordered indexes of the input.
+
+    See Also
+    --------
+    humansorted
+    order_by_index
+
+    Notes
+    -----
+    Please read :ref:`locale_issues` before using `humansorted`.
+
+    Examples
+    --------
+    Use `index_humansorted` just like the builtin `sorted`::
+
+        >>> a = ['Apple', 'Banana', 'apple', 'banana']
+        >>> index_humansorted(a)
+        [2, 0, 3, 1]
+
+    """
+    return index_natsorted(seq, key, reverse, alg | ns.LOCALE)
+
+
+def index_realsorted(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> list[int]:
+    """
+    Get the list of indexes of ``realsorted``.
+
+    This is a wrapper around ``index_natsorted(seq, alg=ns.REAL)``.
+
+    Parameters
+    ----------
+    seq: iterable
+        The input to sort.
+
+    key: callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.REAL`.
+
+    Returns
+    -------
+    out : tuple
+        The ordered indexes of the input.
+
+    See Also
+    --------
+    realsorted
+    order_by_index
+
+    Examples
+    --------
+    Use `index_realsorted` just like the builtin `sorted`::
+
+        >>> a = ['num5.10', 'num-3', 'num5.3', 'num2']
+        >>> index_realsorted(a)
+        [1, 3, 0, 2]
+
+    """
+    return index_natsorted(seq, key, reverse, alg | ns.REAL)
+
+
+@overload
+def natrank(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    method: Literal["dense", "min", "ordinal"] = ...,
+    output: Literal["list"] = ...,
+) -> list[int]: ...
+
+
+@overload
+def natrank(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    method: Literal["dense", "min", "ordinal"] = ...,
+    output: Literal["array"],
+) -> array[int]: ...
+
+
+@overload
+def natrank(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = ...,
+    reverse: bool = ...,
+    alg: NSType = ...,
+    *,
+    method: Literal["dense", "min", "ordinal"] = ...,
+    output: Literal["numpy"],
+) -> Any: ...  # noqa: ANN401
+
+
+def natrank(  # noqa: PLR0913
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+    *,
+    method: Literal["dense", "min", "ordinal"] = "dense",
+    output: Literal["list", "array", "numpy"] = "list",
+) -> list[int] | array[int] | Any:
+    """
+    Determine the rank of each element of a sequence in natural order.
+
+    The ranks start at 1 and are returned in the order of the input,
+    so the rank of ``seq[i]`` is at position ``i`` of the output.
+    Elements with equal natural sort keys share the same rank
+    (except with ``method="ordinal"``). Since the ranks are plain integers,
+    they can be stored and sorted on instead of the sort keys.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to rank.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Rank in reversed sorted order, so that the largest element has
+        rank 1. The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    method : {{"dense", "min", "ordinal"}}, optional
+        How ranks are assigned. "dense" gives equal elements the same rank
+        and the next distinct element the following rank; "min" gives equal
+        elements the position of the first of them in sorted order, leaving
+        gaps; "ordinal" gives every element its position in sorted order,
+        breaking ties by input order. The default is "dense".
+
+    output : {{"list", "array", "numpy"}}, optional
+        The type of the returned ranks. "array" returns a compact
+        ``array.array('l')`` and "numpy" returns a NumPy integer array
+        (which requires NumPy to be installed). The default is "list".
+
+    Returns
+    -------
+    out : list
+        The rank of each element of the input.
+
+    See Also
+    --------
+    index_natsorted
+
+    Examples
+    --------
+    Use `natrank` to compute the natural order of a sequence once::
+
+        >>> a = ['num3', 'num5', 'num2', 'num03']
+        >>> natrank(a)
+        [2, 3, 1, 2]
+        >>> natrank(a, method='min')
+        [2, 4, 1, 2]
+        >>> natrank(a, method='ordinal')
+        [2, 4, 1, 3]
+
+    """
+    if method not in {"dense", "min", "ordinal"}:
+        msg = "natrank: 'method' must be 'dense', 'min', or 'ordinal'"
+        raise ValueError(msg + f", got {method!r}")
+    _check_output("natrank", output)
+
+    index, keys = _natsort_index_and_keys(seq, key, reverse, alg)
+    ranks = [0] * len(index)
+    if method == "ordinal":
+        for rank, i in enumerate(index, 1):
+            ranks[i] = rank
+    else:
+        # Walk the elements in sorted order, starting a new rank
+        # each time the key differs from that of the previous element.
+        dense = method == "dense"
+        rank = 0
+        previous: NatsortOutType | None = None
+        for position, i in enumerate(index, 1):
+            if position == 1 or keys[i] != previous:
+                rank = rank + 1 if dense else position
+                previous = keys[i]
+            ranks[i] = rank
+    return _convert_output(ranks, output)
+
+
+def natpartition(
+    seq: Iterable[T],
+    k: int,
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> list[T]:
+    """
+    Partition an iterable around the element in position `k` of its natural order.
+
+    The returned list has the element that `natsorted` would place in
+    position `k` at position `k`, with every element before it sorting
+    before (or equal to) it and every element after it sorting after
+    (or equal to) it, but otherwise in no particular order. This takes
+    expected linear time instead of the O(N log N) of a full sort.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to partition.
+
+    k : int
+        The position in sorted order to partition around. Negative
+        values count from the end, as with list indexing.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Partition according to reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list
+        The partitioned input.
+
+    Raises
+    ------
+    IndexError
+        If `k` is out of range for the input.
+
+    See Also
+    --------
+    natnth : Return only the element in position `k`.
+    natsorted
+
+    Examples
+    --------
+    Partition around the third-smallest element::
+
+        >>> a = ['num9', 'num1', 'num10', 'num3', 'num2']
+        >>> natpartition(a, 2)[2]
+        'num3'
+
+    """
+    items = list(seq)
+    order = _natselect(items, [_check_position(k, len(items))], key, reverse, alg)
+    return [items[i] for i in order]
+
+
+def natnth(
+    seq: Iterable[T],
+    k: int,
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> T:
+    """
+    Return the element in position `k` of the natural order of an iterable.
+
+    This is equivalent to ``natsorted(seq)[k]``, but takes expected linear
+    time instead of the O(N log N) of a full sort.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to select from.
+
+    k : int
+        The position in sorted order of the element to return. Negative
+        values count from the end, as with list indexing.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Select according to reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out
+        The element in position `k`.
+
+    Raises
+    ------
+    IndexError
+        If `k` is out of range for the input.
+
+    See Also
+    --------
+    natpartition
+    natmedian
+    natpercentile
+
+    Examples
+    --------
+    Use `natnth` to find a single element in natural order::
+
+        >>> a = ['num9', 'num1', 'num10', 'num3', 'num2']
+        >>> natnth(a, 0), natnth(a, -1)
+        ('num1', 'num10')
+
+    """
+    items = list(seq)
+    k = _check_position(k, len(items))
+    return items[_natselect(items, [k], key, reverse, alg)[k]]
+
+
+def natmedian(
+    seq: Iterable[T],
+    key: Callable[[T], NatsortInType] | None = None,
+    alg: NSType = ns.DEFAULT,
+) -> T:
+    """
+    Return the median element of an iterable in natural order.
+
+    For an even number of elements, the lower of the two middle elements
+    is returned, since elements in general cannot be averaged.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to select from.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out
+        The median element.
+
+    Raises
+    ------
+    IndexError
+        If the input is empty.
+
+    See Also
+    --------
+    natnth
+    natpercentile
+
+    Examples
+    --------
+    Use `natmedian` to find the middle element in natural order::
+
+        >>> natmedian(['num9', 'num1', 'num10', 'num3', 'num2'])
+        'num3'
+
+    """
+    items = list(seq)
+    return natnth(items, (len(items) - 1) // 2, key, False, alg)
+
+
+@overload
+def natpercentile(
+    seq: Iterable[T],
+    q: float,
+    key: Callable[[T], NatsortInType] | None = ...,
+    alg: NSType = ...,
+) -> T: ...
+
+
+@overload
+def natpercentile(
+    seq: Iterable[T],
+    q: Iterable[float],
+    key: Callable[[T], NatsortInType] | None = ...,
+    alg: NSType = ...,
+) -> list[T]: ...
+
+
+def natpercentile(
+    seq: Iterable[T],
+    q: float | Iterable[float],
+    key: Callable[[T], NatsortInType] | None = None,
+    alg: NSType = ns.DEFAULT,
+) -> T | list[T]:
+    """
+    Return the element at one or more percentiles of the natural order.
+
+    The element at percentile `q` is the one in position
+    ``floor(q / 100 * (N - 1))`` of the sorted input (the "lower" method
+    of ``numpy.percentile``), since elements in general cannot be
+    interpolated. All percentiles are found together in expected
+    linear time, without a full sort.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to select from.
+
+    q : float or iterable of floats
+        The percentile(s) to find, each between 0 and 100 inclusive.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the iterable.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out
+        The element at percentile `q`, or a list of the elements
+        at each percentile if `q` is iterable.
+
+    Raises
+    ------
+    ValueError
+        If a percentile is not between 0 and 100.
+    IndexError
+        If the input is empty.
+
+    See Also
+    --------
+    natnth
+    natmedian
+
+    Examples
+    --------
+    Find the boundaries of evenly sized buckets in natural order::
+
+        >>> shards = [f'shard{i}' for i in range(100, 0, -1)]
+        >>> natpercentile(shards, [0, 25, 50, 75, 100])
+        ['shard1', 'shard25', 'shard50', 'shard75', 'shard100']
+
+    """
+    items = list(seq)
+    qs = [q] if isinstance(q, (int, float)) else list(q)
+    if any(not 0 <= x <= 100 for x in qs):  # noqa: PLR2004
+        msg = f"natpercentile: percentiles must be between 0 and 100, got {q!r}"
+        raise ValueError(msg)
+    if not items:
+        msg = "natpercentile: cannot find the percentile of an empty input"
+        raise IndexError(msg)
+    positions = [int(x / 100 * (len(items) - 1)) for x in qs]
+    order = _natselect(items, positions, key, False, alg)
+    found = [items[order[k]] for k in positions]
+    return found[0] if isinstance(q, (int, float)) else found
+
+
+def _check_position(k: int, n: int) -> int:
+    """Convert a possibly negative position to a non-negative one."""
+    if not -n <= k < n:
+        msg = f"position {k} is out of range for {n} elements"
+        raise IndexError(msg)
+    return k + n if k < 0 else k
+
+
+def _natselect(
+    items: list[T],
+    positions: list[int],
+    key: Callable[[T], NatsortInType] | None,
+    reverse: bool,
+    alg: NSType,
+) -> list[int]:
+    """
+    Order the indexes of *items* so that each wanted position is in sorted order.
+
+    Each element of *positions* will hold the index of the element that
+    `index_natsorted` would put there, without sorting everything.
+    A random sample of the keys is sorted to choose pivots that closely
+    bracket each wanted position, every key is placed between the pivots
+    in one pass, and then only the (small) groups that contain a wanted
+    position are sorted. This is the idea of the Floyd-Rivest selection
+    algorithm, and takes expected linear time.
+    """
+    keys: list[Any] = list(map(natsort_keygen(key, alg), items))
+    if alg & ns.PRESORT:
+        keys = list(zip(keys, map(str, items)))
+    n = len(keys)
+    if n <= 1024:  # noqa: PLR2004
+        return sorted(range(n), key=keys.__getitem__, reverse=reverse)
+
+    # Choose pivots from the sample on either side of each wanted position.
+    # Pivot positions are counted in ascending order, even when reversed.
+    sample = sorted(random.Random(n).sample(keys, int(n ** (2 / 3))))  # noqa: S311
+    gap = int(len(sample) ** 0.5)
+    chosen = []
+    for k in positions:
+        r = (n - 1 - k if reverse else k) * len(sample) // n
+        chosen.append(sample[max(r - gap, 0)])
+        chosen.append(sample[min(r + gap, len(sample) - 1)])
+    chosen.sort()
+    pivots = [x for i, x in enumerate(chosen) if i == 0 or chosen[i - 1] < x]
+
+    # Group the indexes by the pivots they fall between. Keys equal to a pivot
+    # are grouped together, and each group keeps its indexes in ascending
+    # order, so sorting a group keeps equal keys in input order.
+    groups: list[list[int]] = [[] for _ in range(len(pivots) + 1)]
+    for i, g in enumerate(map(partial(bisect_left, pivots), keys)):
+        groups[g].append(i)
+    if reverse:
+        groups.reverse()
+
+    order: list[int] = []
+    wanted = sorted(set(positions))
+    for group in groups:
+        start, stop = len(order), len(order) + len(group)
+        if any(start <= k < stop for k in wanted):
+            group.sort(key=keys.__getitem__, reverse=reverse)
+        order.extend(group)
+    return order
+
+
+def order_by_index(
+    seq: Sequence[Any],
+    index: Iterable[int],
+    iter: bool = False,
 ) -> Iterable[Any]:
     """
     Order a given sequence by an index sequence.
@@ -659,6 +1828,88 @@ def order_by_index(
     return (seq[i] for i in index) if iter else [seq[i] for i in index]
 
 
+def order_by_index_inplace(
+    index: Sequence[int],
+    *seqs: MutableSequence[Any],
+) -> None:
+    """
+    Order one or more sequences by an index sequence, in place.
+
+    This applies the same reordering as `order_by_index`, but
+    modifies each given sequence rather than creating a new one.
+    The reordering is applied by following the cycles of the
+    permutation in `index`, moving the elements of all sequences
+    together in a single pass, so the only additional memory used
+    is one byte per element to track which positions are done.
+
+    Parameters
+    ----------
+    index : sequence
+        The sequence that indicates how to order `seqs`.
+        It must contain each integer from 0 up to its length
+        exactly once, such as the output of `index_natsorted`.
+
+    *seqs : mutable sequences
+        The sequences to order. Each must be the same length
+        as `index`. Any sequence that supports item assignment
+        can be used, such as a `list` or a NumPy array.
+
+    Raises
+    ------
+    ValueError
+        If `index` is not a permutation of the positions of `seqs`.
+        In this case none of the sequences are modified.
+
+    See Also
+    --------
+    order_by_index
+    index_natsorted
+
+    Examples
+    --------
+    Reorder several lists by the sorted order of the first::
+
+        >>> a = ['num3', 'num5', 'num2']
+        >>> b = ['foo', 'bar', 'baz']
+        >>> order_by_index_inplace(index_natsorted(a), a, b)
+        >>> a
+        ['num2', 'num3', 'num5']
+        >>> b
+        ['baz', 'foo', 'bar']
+
+    """
+    n = len(index)
+    if any(len(seq) != n for seq in seqs):
+        msg = "order_by_index_inplace: all sequences must be the same length as index"
+        raise ValueError(msg)
+
+    # Check that the index is a permutation before touching anything.
+    # Afterwards, each position is marked pending with 1 and done with 0.
+    pending = bytearray(n)
+    for i in index:
+        if not 0 <= i < n or pending[i]:
+            msg = "order_by_index_inplace: index must be a permutation"
+            raise ValueError(msg + f" of range({n}), got {i!r} out of place")
+        pending[i] = 1
+
+    for start in range(n):
+        if not pending[start]:
+            continue
+        # Save the values at the start of the cycle, then shift each value
+        # back to the position that wants it until the cycle closes.
+        saved = [seq[start] for seq in seqs]
+        dst = start
+        src = index[dst]
+        while src != start:
+            for seq in seqs:
+                seq[dst] = seq[src]
+            pending[dst] = 0
+            dst, src = src, index[src]
+        for seq, value in zip(seqs, saved):
+            seq[dst] = value
+        pending[dst] = 0
+
+
 def numeric_regex_chooser(alg: NSType) -> str:
     """
     Select an appropriate regex for the type of number of interest.
@@ -690,25 +1941,65 @@ def _split_apply(
     return utils.path_splitter(v, treat_base=treat_base)
 
 
-# Choose the implementation based on the host OS
-if platform.system() == "Windows":
-    from ctypes import windll, wintypes  # type: ignore[attr-defined]
-    from functools import cmp_to_key
+def os_sort_keygen(
+    key: Callable[[Any], NatsortInType] | None = None,
+) -> Callable[[Any], NatsortOutType]:
+    """
+    Generate a sorting key to replicate your file browser's sort order.
 
-    _windows_sort_cmp = windll.Shlwapi.StrCmpLogicalW
-    _windows_sort_cmp.argtypes = [wintypes.LPWSTR, wintypes.LPWSTR]
-    _windows_sort_cmp.restype = wintypes.INT
-    _winsort_key = cmp_to_key(_windows_sort_cmp)
+    See :func:`os_sorted` for description and caveats.
 
-    def os_sort_keygen(  # noqa: D103
-        key: Callable[[Any], NatsortInType] | None = None,
-    ) -> Callable[[Any], NatsortOutType]:
-        return cast(
-            "Callable[[Any], NatsortOutType]",
-            lambda x: tuple(map(_winsort_key, _split_apply(x, key, treat_base=False))),
-        )
+    Returns
+    -------
+    out : function
+        A function that parses input for OS path sorting that is
+        suitable for passing as the `key` argument to functions
+        such as `sorted`.
+
+    See Also
+    --------
+    os_sort_key
+    os_sorted
+
+    Notes
+    -----
+    This will implicitly coerce all inputs to str before collating.
+    The key remembers the collation keys of the most recently used
+    path components.
+
+    """
+    component_keygen, treat_base = _os_sort_component_keygen()
+    # Directory names and extensions repeat across paths, so the keys of
+    # the most recently used components are remembered.
+    component_key = lru_cache(maxsize=_OS_SORT_CACHE_SIZE)(component_keygen())
+    return cast(
+        "Callable[[Any], NatsortOutType]",
+        lambda x: tuple(map(component_key, _split_apply(x, key, treat_base))),
+    )
+
+
+# The number of path components whose keys each os_sort_keygen key remembers.
+_OS_SORT_CACHE_SIZE = 4096
+
+
+@cache
+def _os_sort_component_keygen() -> tuple[Callable[[], Callable[[str], Any]], bool]:
+    """
+    Choose how to collate path components based on the host OS.
+
+    Returns a function that creates a key for a single path component,
+    and whether the file extensions should be split from the base name.
+    """
+    if sys.platform == "win32":
+        from ctypes import windll, wintypes  # type: ignore[attr-defined]  # noqa: PLC0415
+        from functools import cmp_to_key  # noqa: PLC0415
+
+        _windows_sort_cmp = windll.Shlwapi.StrCmpLogicalW
+        _windows_sort_cmp.argtypes = [wintypes.LPWSTR, wintypes.LPWSTR]
+        _windows_sort_cmp.restype = wintypes.INT
+        _winsort_key = cmp_to_key(_windows_sort_cmp)
+        return lambda: _winsort_key, False
 
-else:
     # For UNIX-based platforms, ICU performs MUCH better than locale
     # at replicating the file explorer's sort order. We will use
     # ICU's ability to do basic natural sorting as it also better
@@ -719,65 +2010,29 @@ else:
     # which will give good results in most cases (e.g. when there aren't
     # a bunch of special characters).
     try:
-        import icu
+        import icu  # noqa: PLC0415
 
     except ImportError:
-        # No ICU installed
-        def os_sort_keygen(  # noqa: D103
-            key: Callable[[Any], NatsortInType] | None = None,
-        ) -> Callable[[Any], NatsortOutType]:
-            return natsort_keygen(key=key, alg=ns.LOCALE | ns.PATH | ns.IGNORECASE)
-
-    else:
-        # ICU installed
-        def os_sort_keygen(  # noqa: D103
-            key: Callable[[Any], NatsortInType] | None = None,
-        ) -> Callable[[Any], NatsortOutType]:
-            loc = natsort.compat.locale.get_icu_locale()
-            collator = icu.Collator.createInstance(loc)
-            collator.setAttribute(
-                icu.UCollAttribute.NUMERIC_COLLATION,
-                icu.UCollAttributeValue.ON,
-            )
-            return lambda x: tuple(map(collator.getSortKey, _split_apply(x, key)))
-
-
-os_sort_keygen.__doc__ = """
-Generate a sorting key to replicate your file browser's sort order.
-
-See :func:`os_sorted` for description and caveats.
-
-Returns
--------
-out : function
-    A function that parses input for OS path sorting that is
-    suitable for passing as the `key` argument to functions
-    such as `sorted`.
-
-See Also
---------
-os_sort_key
-os_sorted
-
-Notes
------
-On Windows, this will implicitly coerce all inputs to str before
-collating.
-
-"""
-
-os_sort_key = os_sort_keygen()
-os_sort_key.__doc__ = """
-os_sort_key(val)
-The default key to replicate your file browser's sort order.
+        # No ICU installed. Each component is parsed as natsort_keygen
+        # would with ns.PATH.
+        return partial(natsort_keygen, None, ns.LOCALE | ns.IGNORECASE), True
+
+    # ICU installed
+    def icu_component_keygen() -> Callable[[str], Any]:
+        loc = natsort.compat.locale.get_icu_locale()
+        collator = icu.Collator.createInstance(loc)
+        collator.setAttribute(
+            icu.UCollAttribute.NUMERIC_COLLATION,
+            icu.UCollAttributeValue.ON,
+        )
+        return cast("Callable[[str], Any]", collator.getSortKey)
 
-This is the output of :func:`os_sort_keygen` with default values.
+    return icu_component_keygen, True
 
-See Also
---------
-os_sort_keygen
 
-"""
+# Exposed for simplicity if one needs the default OS sort key.
+# It is created on first access, see __getattr__ at the bottom of this module.
+os_sort_key: OSSortKeyType
 
 
 def os_sorted(
@@ -846,6 +2101,64 @@ def os_sorted(
     This will implicitly coerce all inputs to str before collating.
 
     """
-    if presort:
-        seq = sorted(seq, reverse=reverse, key=str)
-    return sorted(seq, reverse=reverse, key=os_sort_keygen(key))
+    result = sorted(seq, reverse=reverse, key=str) if presort else list(seq)
+
+    # Each distinct path component is collated only once for the whole input.
+    component_keygen, treat_base = _os_sort_component_keygen()
+    component_keys = _KeyMemo(component_keygen())
+    keys = [
+        tuple(map(component_keys.__getitem__, _split_apply(x, key, treat_base)))
+        for x in result
+    ]
+    index = sorted(range(len(keys)), reverse=reverse, key=keys.__getitem__)
+    return [result[i] for i in index]
+
+
+class _KeyMemo(dict[str, Any]):
+    """A dictionary of keys that computes the key of a missing string."""
+
+    __slots__ = ("keygen",)
+
+    def __init__(self, keygen: Callable[[str], Any]) -> None:
+        super().__init__()
+        self.keygen = keygen
+
+    def __missing__(self, x: str) -> Any:  # noqa: ANN401
+        value = self[x] = self.keygen(x)
+        return value
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The default keys are only created when first used because creating
+    # them compiles regular expressions and probes for optional libraries.
+    if name == "natsort_key":
+        default_key = natsort_keygen()
+        default_key.__doc__ = """\
+natsort_key(val)
+The default natural sorting key.
+
+This is the output of :func:`natsort_keygen` with default values.
+
+See Also
+--------
+natsort_keygen
+
+"""
+    elif name == "os_sort_key":
+        default_key = os_sort_keygen()
+        default_key.__doc__ = """
+os_sort_key(val)
+The default key to replicate your file browser's sort order.
+
+This is the output of :func:`os_sort_keygen` with default values.
+
+See Also
+--------
+os_sort_keygen
+
+"""
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = default_key
+    return default_key
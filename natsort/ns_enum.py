@@ -119,6 +119,25 @@ class ns(enum.IntEnum):  # noqa: N801
         without `PRESORT` the order of these two values would depend on
         the order they appeared in the input (because Python's `sorted`
         is a stable sorting algorithm).
+    VERSION, V
+        Tell `natsort` to interpret strings as version numbers such as
+        "1.10.0rc2" or "2.0.0-beta.3" using a dedicated parser rather
+        than the general number search. Each string becomes a tuple of
+        integers, where a dotted release sorts numerically component by
+        component (ignoring trailing zeros, so "1.10" equals "1.10.0"),
+        and development ("dev"), pre-release ("a"/"alpha", "b"/"beta",
+        "c"/"rc"/"pre"/"preview"), and post-release ("post"/"rev"/"r")
+        tags are ordered before or after the release they follow.
+        Any text after the version is compared as a plain string,
+        and strings that do not start with a version are placed first.
+        All other options besides `PRESORT` are ignored for strings.
+    BYTES, B
+        Tell `natsort` to sort *bytes* naturally, as it does *str*, without
+        decoding them. Only ASCII digits are numbers, and only the
+        `FLOAT`, `SIGNED`, `NOEXP`, `PATH`, `IGNORECASE`,
+        `LOWERCASEFIRST`, `GROUPLETTERS` and `PRESORT` options apply
+        (case options to ASCII letters only). Without this, *bytes* are
+        compared as-is.
 
     Notes
     -----
@@ -149,6 +168,8 @@ class ns(enum.IntEnum):  # noqa: N801
     COMPATIBILITYNORMALIZE = CN = 1 << next(_counter)
     NUMAFTER = NA = 1 << next(_counter)
     PRESORT = PS = 1 << next(_counter)
+    VERSION = V = 1 << next(_counter)
+    BYTES = B = 1 << next(_counter)
 
     # Following were previously options but are now defaults.
     DEFAULT = 0
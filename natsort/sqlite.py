@@ -0,0 +1,416 @@
+"""
+Natural ordering with SQLite databases.
+
+:func:`register` adds a collation and a SQL function to a
+:class:`sqlite3.Connection` so that queries can sort naturally, and use an
+index to do so, without reading the rows into Python. :class:`KeyCache`
+stores natural keys in a database file so that they can be reused by
+later programs.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+
+import natsort
+import natsort.compat.locale
+from natsort.natsort import natsort_keygen
+from natsort.ns_enum import NSType, ns
+from natsort.utils import encode_key
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+# The collation compares each value many times during a sort, so remembers
+# the keys of this many recent values.
+_COLLATION_CACHE_SIZE = 1 << 16
+
+
+def register(
+    conn: sqlite3.Connection,
+    name: str = "NATURAL",
+    alg: NSType = ns.DEFAULT,
+    *,
+    function: str | None = None,
+) -> None:
+    """
+    Add natural ordering to a SQLite connection.
+
+    Two things are registered with `conn`:
+
+    * A collation called `name`, so ``ORDER BY col COLLATE "NATURAL"`` sorts
+      text naturally (``NATURAL`` is an SQL keyword, so must be quoted).
+      SQLite calls the collation to compare each pair of values, which
+      cannot use an index and is slow for large tables.
+    * A deterministic function of one argument, called `function`, that
+      returns the natural key of its argument encoded as a BLOB by
+      :func:`~natsort.encode_key`. ``ORDER BY NATURAL_KEY(col)`` sorts
+      like the collation, but because the function is deterministic it
+      can also be used in an index
+      (``CREATE INDEX i ON t(NATURAL_KEY(col))``), which SQLite then uses
+      to sort, or to scan a natural range with ``BETWEEN``, without
+      computing any keys. The function accepts any SQL value, and
+      returns NULL for NULL.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection to register with. The registrations only last as
+        long as the connection, so must be made for each new connection
+        (in particular, before using an index created with `function`).
+
+    name : str, optional
+        The name of the collation. The default is ``"NATURAL"``.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. Keys from ``ns.LOCALE``
+        depend on the locale, so an index made with them is only valid
+        while the locale does not change. As with `natsorted`,
+        ``ns.PRESORT`` orders values with equal keys by their `str`, so
+        the collation and the function both include it. The default is
+        `ns.INT`.
+
+    function : str, optional
+        The name of the SQL function. The default is `name` followed by
+        ``"_KEY"``.
+
+    See Also
+    --------
+    natsort.encode_key
+
+    Examples
+    --------
+    Sort naturally in a query::
+
+        >>> import sqlite3
+        >>> from natsort.sqlite import register
+        >>> conn = sqlite3.connect(":memory:")
+        >>> register(conn)
+        >>> _ = conn.execute("CREATE TABLE t (name TEXT)")
+        >>> _ = conn.executemany(
+        ...     "INSERT INTO t VALUES (?)", [("num3",), ("num10",), ("num2",)]
+        ... )
+        >>> sql = 'SELECT name FROM t ORDER BY name COLLATE "NATURAL"'
+        >>> conn.execute(sql).fetchall()
+        [('num2',), ('num3',), ('num10',)]
+        >>> _ = conn.execute("CREATE INDEX t_natural ON t(NATURAL_KEY(name))")
+        >>> conn.execute(
+        ...     "SELECT name FROM t WHERE NATURAL_KEY(name) >= NATURAL_KEY('num3') "
+        ...     "ORDER BY NATURAL_KEY(name)"
+        ... ).fetchall()
+        [('num3',), ('num10',)]
+        >>> conn.close()
+
+    """
+    key = natsort_keygen(None, alg)
+    if alg & ns.PRESORT:
+        key = _presorted(key)
+    conn.create_collation(name, _collation(key))
+    conn.create_function(
+        f"{name}_KEY" if function is None else function,
+        1,
+        _encoded_key_function(key),
+        deterministic=True,
+    )
+
+
+def _presorted(key: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Order values with equal keys by their string form, like natsorted."""
+    return lambda x: (key(x), str(x))
+
+
+def _collation(key: Callable[[Any], Any]) -> Callable[[str, str], int]:
+    """Create a function that compares two strings naturally."""
+    cached_key = lru_cache(maxsize=_COLLATION_CACHE_SIZE)(key)
+
+    def collate(a: str, b: str) -> int:
+        ka, kb = cached_key(a), cached_key(b)
+        return int(ka > kb) - int(ka < kb)
+
+    return collate
+
+
+def _encoded_key_function(
+    key: Callable[[Any], Any],
+) -> Callable[[Any], bytes | None]:
+    """Create a function that returns the encoded key of a SQL value."""
+
+    def encoded_key(x: Any) -> bytes | None:  # noqa: ANN401
+        return None if x is None else encode_key(key(x))
+
+    return encoded_key
+
+
+# The most inputs looked up by one query (SQLite allows at least 999),
+# unless there are at least 1 / _SCAN_RATIO as many inputs as stored keys,
+# when all the keys are read instead.
+_LOOKUP_SIZE = 500
+_SCAN_RATIO = 4
+
+# Any change to the natsort version invalidates all keys, and keys of
+# locale-aware algorithms are also kept apart by a fingerprint of the
+# locale; see _locale_fingerprint. The triggers keep the number of keys
+# of each namespace, so that neither len() nor eviction counts the rows.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS namespaces (
+    id INTEGER PRIMARY KEY,
+    alg INTEGER NOT NULL,
+    locale TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (alg, locale)
+);
+CREATE TABLE IF NOT EXISTS keys (
+    namespace INTEGER NOT NULL,
+    input TEXT NOT NULL,
+    key BLOB NOT NULL,
+    PRIMARY KEY (namespace, input)
+);
+CREATE TRIGGER IF NOT EXISTS keys_insert AFTER INSERT ON keys BEGIN
+    UPDATE namespaces SET size = size + 1 WHERE id = NEW.namespace;
+END;
+CREATE TRIGGER IF NOT EXISTS keys_delete AFTER DELETE ON keys BEGIN
+    UPDATE namespaces SET size = size - 1 WHERE id = OLD.namespace;
+END;
+"""
+
+
+class KeyCache:
+    """
+    Store the natural keys of strings in a SQLite database file.
+
+    Programs that repeatedly sort mostly the same strings (such as nightly
+    batch jobs) can use a cache to compute the key of each distinct string
+    only once, ever. The keys are encoded with :func:`~natsort.encode_key`,
+    and sorting by the encoded keys gives the same order as sorting by the
+    keys themselves (which is faster, because they are `bytes`).
+
+    Each key is stored with the algorithm and (for locale-aware algorithms)
+    a fingerprint of the current locale, so one file can hold the keys of
+    several algorithms. All keys are discarded when the cache is opened
+    with a different version of natsort than the one that stored them.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The database file. It is created if it does not exist.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    max_size : int, optional
+        The most keys that the file holds (for all algorithms together).
+        When storing new keys makes it hold more, the keys that were
+        stored first are removed until it holds `max_size` (first in,
+        first out: finding a key in the cache does not keep it longer).
+        A cache smaller than the set of strings that a program sorts will
+        keep removing keys that are needed again, so this should be above
+        the number of distinct strings sorted. The default is 100000000.
+
+    Examples
+    --------
+    Sort with a cache, then sort again without computing any keys::
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from natsort.sqlite import KeyCache
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     with KeyCache(Path(tmp, "keys.db")) as cache:
+        ...         first = cache.natsorted(["num3", "num10", "num2"])
+        ...     with KeyCache(Path(tmp, "keys.db")) as cache:
+        ...         second = cache.natsorted(["num10", "num2"])
+        ...         n = len(cache)
+        ...
+        >>> first, second, n
+        (['num2', 'num3', 'num10'], ['num2', 'num10'], 3)
+
+    """
+
+    __slots__ = ("_conn", "_keygen", "_namespace", "alg", "max_size")
+
+    def __init__(  # noqa: D107
+        self,
+        path: str | os.PathLike[str],
+        alg: NSType = ns.DEFAULT,
+        *,
+        max_size: int = 100_000_000,
+    ) -> None:
+        if max_size < 1:
+            msg = f"KeyCache: 'max_size' must be at least 1, got {max_size!r}"
+            raise ValueError(msg)
+        self.alg = alg
+        self.max_size = max_size
+        self._keygen = natsort_keygen(None, alg)
+        self._conn = sqlite3.connect(path)
+        try:
+            self._namespace = self._open_namespace()
+        except BaseException:
+            self._conn.close()
+            raise
+
+    def _open_namespace(self) -> int:
+        """Create or check the tables, and find the namespace of the keys."""
+        conn = self._conn
+        conn.executescript(_SCHEMA)
+        with conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'version'")
+            version = row.fetchone()
+            if version is None or version[0] != natsort.__version__:
+                conn.execute("DELETE FROM keys")
+                conn.execute("DELETE FROM namespaces")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                    (natsort.__version__,),
+                )
+            fingerprint = _locale_fingerprint(self.alg)
+            conn.execute(
+                "INSERT OR IGNORE INTO namespaces (alg, locale) VALUES (?, ?)",
+                (self.alg, fingerprint),
+            )
+            row = conn.execute(
+                "SELECT id FROM namespaces WHERE alg = ? AND locale = ?",
+                (self.alg, fingerprint),
+            )
+            namespace: int = row.fetchone()[0]
+        return namespace
+
+    def keys(self, seq: Iterable[str]) -> list[bytes]:
+        """
+        Return the encoded natural key of each string.
+
+        The keys of strings that are not in the cache are computed,
+        and stored. Inputs that are not `str` have their key computed,
+        but not stored.
+        """
+        items = list(seq)
+        strings = {x for x in items if type(x) is str}
+        found = self._lookup(strings)
+        missing = strings.difference(found)
+        keygen = self._keygen
+        if missing:
+            new = [(x, encode_key(keygen(x))) for x in missing]
+            self._store(new)
+            found.update(new)
+        return [found[x] if type(x) is str else encode_key(keygen(x)) for x in items]
+
+    def _lookup(self, inputs: set[str]) -> dict[str, bytes]:
+        """Find the stored keys of the given strings."""
+        execute = self._conn.execute
+        if len(inputs) * _SCAN_RATIO >= len(self):
+            # Reading every key is much faster than looking up most of them.
+            rows = execute(
+                "SELECT input, key FROM keys WHERE namespace = ?", (self._namespace,)
+            )
+            return {x: key for x, key in rows if x in inputs}
+        found: dict[str, bytes] = {}
+        todo = list(inputs)
+        for start in range(0, len(todo), _LOOKUP_SIZE):
+            chunk = todo[start : start + _LOOKUP_SIZE]
+            params = ", ".join("?" * len(chunk))
+            found.update(
+                execute(
+                    "SELECT input, key FROM keys "  # noqa: S608
+                    f"WHERE namespace = ? AND input IN ({params})",
+                    (self._namespace, *chunk),
+                )
+            )
+        return found
+
+    def _store(self, entries: list[tuple[str, bytes]]) -> None:
+        """Store new keys, then remove the oldest keys above the size limit."""
+        with self._conn as conn:
+            # Not REPLACE, whose deletions would not run the size trigger.
+            conn.executemany(
+                "INSERT OR IGNORE INTO keys VALUES (?, ?, ?)",
+                ((self._namespace, x, key) for x, key in entries),
+            )
+            row = conn.execute("SELECT SUM(size) FROM namespaces")
+            excess: int = row.fetchone()[0] - self.max_size
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM keys WHERE rowid IN "
+                    "(SELECT rowid FROM keys ORDER BY rowid LIMIT ?)",
+                    (excess,),
+                )
+
+    def natsorted(
+        self,
+        seq: Iterable[T],
+        key: Callable[[T], str] | None = None,
+        *,
+        reverse: bool = False,
+    ) -> list[T]:
+        """
+        Sort an iterable naturally, like :func:`~natsort.natsorted`.
+
+        The keys of the strings (or of `key` applied to each element)
+        come from the cache. The sort is stable, and as with `natsorted`,
+        ``ns.PRESORT`` orders elements with equal keys by their `str`.
+        """
+        items = list(seq)
+        strings = items if key is None else map(key, items)
+        keys = self.keys(cast("Iterable[str]", strings))
+        index = list(range(len(items)))
+        if self.alg & ns.PRESORT:
+            # See natsort_inplace for why PRESORT is implemented as two sorts.
+            index.sort(reverse=reverse, key=lambda i: str(items[i]))
+        index.sort(reverse=reverse, key=keys.__getitem__)
+        return [items[i] for i in index]
+
+    def __len__(self) -> int:
+        """Return the number of keys stored for this algorithm and locale."""
+        row = self._conn.execute(
+            "SELECT size FROM namespaces WHERE id = ?", (self._namespace,)
+        )
+        count: int = row.fetchone()[0]
+        return count
+
+    def clear(self) -> None:
+        """Remove the keys stored for this algorithm and locale."""
+        with self._conn as conn:
+            conn.execute("DELETE FROM keys WHERE namespace = ?", (self._namespace,))
+
+    def close(self) -> None:
+        """Close the database file."""
+        self._conn.close()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+
+def _locale_fingerprint(alg: NSType) -> str:
+    """
+    Describe everything about the locale that the keys of *alg* depend on.
+
+    This is empty if *alg* does not depend on the locale. Otherwise the
+    collation of a sample string is included, in case the collation rules
+    of a locale change.
+    """
+    if not alg & (ns.LOCALEALPHA | ns.LOCALENUM):
+        return ""
+    import locale  # noqa: PLC0415
+
+    compat = natsort.compat.locale
+    return repr(
+        (
+            compat.get_strxfrm()("Aa1,5 Éé-ß"),
+            compat.get_thousands_sep(),
+            compat.get_decimal_point(),
+            locale.setlocale(locale.LC_COLLATE),
+            locale.setlocale(locale.LC_NUMERIC),
+        )
+    )
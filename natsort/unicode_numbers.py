@@ -1,35 +1,66 @@
-"""Pre-determine the collection of unicode decimals, digits, and numerals."""
+"""
+Pre-determine the collection of unicode decimals, digits, and numerals.
+
+The tables are generated ahead of time by dev/generate_new_unicode_numbers.py,
+and are only loaded the first time one of this module's attributes is used.
+If the running Python has a different version of the unicode database than
+the one that generated the tables, they are checked against it at that time.
+"""
 
 from __future__ import annotations
 
 import unicodedata
+from typing import Any
+
+# The attributes below are loaded on first access by __getattr__.
+numeric_chars: list[str]
+digit_chars: list[str]
+decimal_chars: list[str]
+numeric: str
+digits: str
+decimals: str
+digits_no_decimals: str
+numeric_no_decimals: str
+
+
+def _load() -> dict[str, Any]:
+    """Load the unicode number tables, adjusting for this Python if needed."""
+    from natsort import unicode_numeric_data as data  # noqa: PLC0415
+
+    if data.unidata_version == unicodedata.unidata_version:
+        numeric = data.numeric
+        digits = data.digits
+        decimals = data.decimals
+        digits_no_decimals = data.digits_no_decimals
+        numeric_no_decimals = data.numeric_no_decimals
+    else:
+        # Only keep the characters this Python considers numeric, and let
+        # it decide which of those are digits and decimals.
+        numeric = "".join(
+            [a for a in data.numeric if unicodedata.numeric(a, None) is not None]
+        )
+        digits = "".join([a for a in numeric if unicodedata.digit(a, None) is not None])
+        decimals = "".join(
+            [a for a in numeric if unicodedata.decimal(a, None) is not None]
+        )
+        digits_no_decimals = "".join([x for x in digits if x not in decimals])
+        numeric_no_decimals = "".join([x for x in numeric if x not in decimals])
+
+    return {
+        "numeric_chars": list(numeric),
+        "digit_chars": list(digits),
+        "decimal_chars": list(decimals),
+        "numeric": numeric,
+        "digits": digits,
+        "decimals": decimals,
+        "digits_no_decimals": digits_no_decimals,
+        "numeric_no_decimals": numeric_no_decimals,
+    }
+
 
-from natsort.unicode_numeric_hex import numeric_hex
-
-# Convert each hex into the literal Unicode character.
-# Stop if a ValueError is raised in case of a narrow Unicode build.
-# The extra check with unicodedata is in case this Python version
-# does not support some characters.
-numeric_chars = []
-for a in numeric_hex:
-    try:
-        character = chr(a)
-    except ValueError:  # pragma: no cover
-        break
-    if unicodedata.numeric(character, None) is None:
-        continue  # pragma: no cover
-    numeric_chars.append(character)
-
-# The digit characters are a subset of the numerals.
-digit_chars = [a for a in numeric_chars if unicodedata.digit(a, None) is not None]
-
-# The decimal characters are a subset of the numerals
-# (probably of the digits, but let's be safe).
-decimal_chars = [a for a in numeric_chars if unicodedata.decimal(a, None) is not None]
-
-# Create a single string with the above data.
-decimals = "".join(decimal_chars)
-digits = "".join(digit_chars)
-numeric = "".join(numeric_chars)
-digits_no_decimals = "".join([x for x in digits if x not in decimals])
-numeric_no_decimals = "".join([x for x in numeric if x not in decimals])
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name not in __annotations__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals().update(_load())
+    return globals()[name]
@@ -40,16 +40,18 @@ and thus has a slightly improved performance at runtime.
 
 from __future__ import annotations
 
+import os
 import re
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from functools import partial, reduce
 from itertools import chain as ichain
 from operator import methodcaller
-from pathlib import PurePath
+from pathlib import PurePath, PurePosixPath, PureWindowsPath
 from re import Match, Pattern
 from typing import (
     TYPE_CHECKING,
     Any,
+    AnyStr,
     Callable,
     Union,
     cast,
@@ -57,18 +59,15 @@ from typing import (
 )
 from unicodedata import normalize
 
+import natsort.compat.locale
+from natsort import unicode_numbers
 from natsort.compat.fastnumbers import try_float, try_int
-from natsort.compat.locale import (
-    StrOrBytes,
-    get_decimal_point,
-    get_strxfrm,
-    get_thousands_sep,
-)
 from natsort.ns_enum import NS_DUMB, NSType, ns
-from natsort.unicode_numbers import digits_no_decimals, numeric_no_decimals
 
 if TYPE_CHECKING:
     from typing_extensions import Protocol
+
+    from natsort.compat.locale import StrOrBytes
 else:
     Protocol = object
 
@@ -90,12 +89,6 @@ Sortable = Union[SupportsDunderLT, SupportsDunderGT]
 StrToStr = Callable[[str], str]
 AnyCall = Callable[[Any], Any]
 
-# For the bytes transform factory
-BytesTuple = tuple[bytes]
-NestedBytesTuple = tuple[tuple[bytes]]
-BytesTransform = Union[BytesTuple, NestedBytesTuple]
-BytesTransformer = Callable[[bytes], BytesTransform]
-
 # For the number transform factory
 BasicTuple = tuple[Any, ...]
 NestedAnyTuple = tuple[BasicTuple, ...]
@@ -103,6 +96,12 @@ AnyTuple = Union[BasicTuple, NestedAnyTuple]
 NumTransform = AnyTuple
 NumTransformer = Callable[[Any], NumTransform]
 
+# For the bytes transform factory
+BytesTuple = tuple[bytes]
+NestedBytesTuple = tuple[tuple[bytes]]
+BytesTransform = Union[BytesTuple, NestedBytesTuple, AnyTuple]
+BytesTransformer = Callable[[bytes], BytesTransform]
+
 # For the string component transform factory
 StrBytesNum = Union[str, bytes, float, int]
 StrTransformer = Callable[[Iterable[str]], Iterator[StrBytesNum]]
@@ -137,10 +136,6 @@ class NumericalRegularExpressions:
     Not intended to be made an instance - use class methods only.
     """
 
-    # All unicode numeric characters (minus the decimal characters).
-    numeric: str = numeric_no_decimals
-    # All unicode digit characters (minus the decimal characters).
-    digits: str = digits_no_decimals
     # Regular expression to match exponential component of a float.
     exp: str = r"(?:[eE][-+]?\d+)?"
     # Regular expression to match a floating point number.
@@ -149,7 +144,16 @@ class NumericalRegularExpressions:
     @classmethod
     def _construct_regex(cls, fmt: str) -> Pattern[str]:
         """Given a format string, construct the regex with class attributes."""
-        return re.compile(fmt.format(**vars(cls)), flags=re.UNICODE)
+        return re.compile(
+            fmt.format(
+                # All unicode numeric characters (minus the decimal characters).
+                numeric=unicode_numbers.numeric_no_decimals,
+                # All unicode digit characters (minus the decimal characters).
+                digits=unicode_numbers.digits_no_decimals,
+                **vars(cls),
+            ),
+            flags=re.UNICODE,
+        )
 
     @classmethod
     def int_sign(cls) -> Pattern[str]:
@@ -202,14 +206,43 @@ def regex_chooser(alg: NSType) -> Pattern[str]:
     else:
         alg &= ns.INT | ns.SIGNED
 
+    # Only the selected regular expression is constructed.
     return {
-        ns.INT: NumericalRegularExpressions.int_nosign(),
-        ns.FLOAT: NumericalRegularExpressions.float_nosign_exp(),
-        ns.INT | ns.SIGNED: NumericalRegularExpressions.int_sign(),
-        ns.FLOAT | ns.SIGNED: NumericalRegularExpressions.float_sign_exp(),
-        ns.FLOAT | ns.NOEXP: NumericalRegularExpressions.float_nosign_noexp(),
-        ns.FLOAT | ns.SIGNED | ns.NOEXP: NumericalRegularExpressions.float_sign_noexp(),
-    }[alg]
+        ns.INT: NumericalRegularExpressions.int_nosign,
+        ns.FLOAT: NumericalRegularExpressions.float_nosign_exp,
+        ns.INT | ns.SIGNED: NumericalRegularExpressions.int_sign,
+        ns.FLOAT | ns.SIGNED: NumericalRegularExpressions.float_sign_exp,
+        ns.FLOAT | ns.NOEXP: NumericalRegularExpressions.float_nosign_noexp,
+        ns.FLOAT | ns.SIGNED | ns.NOEXP: NumericalRegularExpressions.float_sign_noexp,
+    }[alg]()
+
+
+def bytes_regex_chooser(alg: NSType) -> Pattern[bytes]:
+    """
+    Select an appropriate *bytes* regex for the type of number of interest.
+
+    These match the same numbers as the expressions of `regex_chooser`,
+    except that only ASCII digits are numbers.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Used to indicate the regular expression to select.
+
+    Returns
+    -------
+    regex : compiled regex object
+        Regular expression object that matches the desired number type.
+
+    """
+    sign = r"[-+]?" if alg & ns.SIGNED else ""
+    if not alg & ns.FLOAT:
+        number = r"\d+"
+    elif alg & ns.NOEXP:
+        number = NumericalRegularExpressions.float_num
+    else:
+        number = NumericalRegularExpressions.float_num + NumericalRegularExpressions.exp
+    return re.compile(f"({sign}{number})".encode())
 
 
 def _no_op(x: Any) -> Any:  # noqa: ANN401
@@ -364,8 +397,11 @@ def parse_bytes_factory(alg: NSType) -> BytesTransformer:
     See Also
     --------
     natsort_key
+    parse_natural_bytes_factory
 
     """
+    if alg & ns.BYTES:
+        return parse_natural_bytes_factory(alg)
     # We don't worry about ns.UNGROUPLETTERS | ns.LOCALEALPHA because
     # bytes cannot be compared to strings.
     if alg & ns.PATH and alg & ns.IGNORECASE:
@@ -377,6 +413,65 @@ def parse_bytes_factory(alg: NSType) -> BytesTransformer:
     return lambda x: (x,)
 
 
+def parse_natural_bytes_factory(alg: NSType) -> BytesTransformer:
+    """
+    Create a function that will split and format a *bytes* object into a tuple.
+
+    This is the *bytes* counterpart of `parse_string_factory`, without
+    decoding. The *bytes* are split by a regular expression from
+    `bytes_regex_chooser`, and the numbers are converted directly from
+    the *bytes*. Of the locale and case options, only ``ns.IGNORECASE``,
+    ``ns.LOWERCASEFIRST`` and ``ns.GROUPLETTERS`` apply, to ASCII letters.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format and split the *bytes*.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts *bytes* input and returns a tuple
+        containing the *bytes* split into numeric and non-numeric
+        components, where the numeric components are converted into
+        numeric objects. The first element is *always* *bytes*,
+        and then alternates number then *bytes*. With ``ns.PATH``,
+        each path component is split this way in a nested tuple.
+        Intended to be used as the *bytes_func* argument to *natsort_key*.
+
+    See Also
+    --------
+    natsort_key
+    parse_bytes_factory
+
+    """
+    split = bytes_regex_chooser(alg).split
+    to_number = float if alg & ns.FLOAT else int
+    function_chain: list[Callable[[bytes], bytes]] = []
+    if alg & ns.LOWERCASEFIRST:
+        function_chain.append(bytes.swapcase)
+    if alg & ns.IGNORECASE:
+        function_chain.append(bytes.lower)
+    transform = chain_functions(function_chain)
+    group_letters = alg & ns.GROUPLETTERS
+
+    def func(x: bytes) -> BasicTuple:
+        # The numbers are the captured (odd) elements of the split, and
+        # the text between them (empty only between two numbers) separates
+        # them, as sep_inserter does for str.
+        parts: list[Any] = split(transform(x))
+        parts[1::2] = map(to_number, parts[1::2])
+        if group_letters:
+            parts[::2] = map(groupletters_bytes, parts[::2])
+        if not parts[-1]:
+            parts.pop()
+        return tuple(parts)
+
+    if alg & ns.PATH:
+        return lambda x: tuple(map(func, bytes_path_splitter(x)))
+    return func
+
+
 def parse_number_or_none_factory(
     alg: NSType,
     sep: StrOrBytes,
@@ -547,6 +642,136 @@ def parse_path_factory(str_split: StrParser) -> PathSplitter:
     return lambda x: tuple(map(str_split, path_splitter(x)))
 
 
+# The first element of the key of a string that does not start with a
+# version. It is less than every release number and every marker (the end
+# marker -2, and the lowest tag marker, dev's -6), so such strings sort
+# before every release or pre-release, including "0.0" whose key is (-2,).
+_NOT_A_VERSION = -7
+
+
+def parse_version_factory(alg: NSType) -> StrParser:  # noqa: ARG001
+    """
+    Create a function that will parse a version *str* into a tuple.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to parse the *str*. Currently there are no
+        options that change how versions are parsed.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts string input and returns a tuple
+        of integers describing the version at the start of the string,
+        followed by any leftover text as a single string. Intended
+        to be used as the *string_func* argument to *natsort_key*.
+
+    See Also
+    --------
+    natsort_key
+    parse_version_number_or_none_factory
+
+    Notes
+    -----
+    The release numbers are followed by a pair of integers for each
+    tag (a negative marker identifying the tag, then the tag's number),
+    and finally the marker -2 to end the version. All markers are
+    negative so that they sort before any further release number, and
+    tags that precede a release (dev, alpha, beta, rc) have markers less
+    than -2 while post-releases have -1. Strings that do not start with
+    a version become (_NOT_A_VERSION, string) so that they sort before
+    any version.
+
+    """
+    markers = {
+        "dev": -6,
+        "a": -5,
+        "alpha": -5,
+        "b": -4,
+        "beta": -4,
+        "c": -3,
+        "rc": -3,
+        "pre": -3,
+        "preview": -3,
+        "post": -1,
+        "rev": -1,
+        "r": -1,
+    }
+    # Longest first so that e.g. "preview" is not matched as "pre".
+    names = "|".join(sorted(markers, key=len, reverse=True))
+    tag = rf"[-_.]?({names})(?![a-z])[-_.]?([0-9]*)"
+    version = re.compile(
+        rf"v?([0-9]+(?:\.[0-9]+)*)((?:{tag})*)",
+        flags=re.IGNORECASE,
+    )
+
+    def func(
+        x: PathArg,
+        *,
+        _match: MatchFn = version.match,
+        _findall: Callable[[str], list[tuple[str, str]]] = re.compile(
+            tag, flags=re.IGNORECASE
+        ).findall,
+        _markers: dict[str, int] = markers,
+    ) -> FinalTransform:
+        if isinstance(x, PurePath):
+            x = str(x)
+        # Most versions are only a dotted release, which can skip the regex.
+        digits = x.replace(".", "")
+        if (
+            digits.isdecimal()
+            and digits.isascii()
+            and x[0] != "." != x[-1]
+            and ".." not in x
+        ):
+            key = list(map(int, x.split(".")))
+            tags = rest = ""
+        else:
+            m = _match(x)
+            if m is None:
+                return _NOT_A_VERSION, x
+            key = list(map(int, m[1].split(".")))
+            tags, rest = m[2], x[m.end() :]
+        while key and not key[-1]:
+            key.pop()  # Trailing zeros are insignificant, so 1.0 == 1.
+        if tags:
+            for name, number in _findall(tags):
+                key += (_markers[name.lower()], int(number or 0))
+        if rest:
+            return *key, -2, rest
+        return *key, -2
+
+    return func
+
+
+def parse_version_number_or_none_factory(str_parse: StrParser) -> NumTransformer:
+    """
+    Create a function that will parse a number (or None) as a version.
+
+    Parameters
+    ----------
+    str_parse : callable
+        The output of the *parse_version_factory* function.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts numeric input and returns the same
+        tuple as *str_parse* would for the number's string form,
+        except None which returns an empty tuple so that it sorts
+        first. Intended to be used as the *num_func* argument
+        to *natsort_key*.
+
+    See Also
+    --------
+    natsort_key
+    parse_version_factory
+
+    """
+    return lambda x: () if x is None else str_parse(str(x))
+
+
 def sep_inserter(iterator: Iterator[Any], sep: StrOrBytes) -> Iterator[Any]:
     """
     Insert '' between numbers in an iterator.
@@ -626,44 +851,175 @@ def input_string_transform_factory(alg: NSType) -> StrToStr:
         function_chain.append(methodcaller("casefold"))
 
     if alg & ns.LOCALENUM:
-        # Create a regular expression that will remove thousands separators.
-        strip_thousands = r"""
-            (?<=[0-9]{{1}})  # At least 1 number
-            (?<![0-9]{{4}})  # No more than 3 numbers
-            {nodecimal}      # Cannot follow decimal
-            {thou}           # The thousands separator
-            (?=[0-9]{{3}}    # Three numbers must follow
-             ([^0-9]|$)      # But a non-number after that
+        function_chain.append(
+            locale_number_transform_factory(
+                alg,
+                natsort.compat.locale.get_thousands_sep(),
+                natsort.compat.locale.get_decimal_point(),
             )
-        """
-        nodecimal = r""
-        if alg & ns.FLOAT:
-            # Make a regular expression component that will ensure no
-            # separators are removed after a decimal point.
-            d = re.escape(get_decimal_point())
-            nodecimal += r"(?<!" + d + r"[0-9])"
-            nodecimal += r"(?<!" + d + r"[0-9]{2})"
-            nodecimal += r"(?<!" + d + r"[0-9]{3})"
-        strip_thousands = strip_thousands.format(
-            thou=re.escape(get_thousands_sep()),
-            nodecimal=nodecimal,
         )
-        strip_thousands_re = re.compile(strip_thousands, flags=re.VERBOSE)
-        function_chain.append(partial(strip_thousands_re.sub, ""))
-
-        # Create a regular expression that will change the decimal point to
-        # a period if not already a period.
-        decimal = get_decimal_point()
-        if alg & ns.FLOAT and decimal != ".":
-            switch_decimal = r"(?<=[0-9]){decimal}|{decimal}(?=[0-9])"
-            switch_decimal = switch_decimal.format(decimal=re.escape(decimal))
-            switch_decimal_re = re.compile(switch_decimal)
-            function_chain.append(partial(switch_decimal_re.sub, "."))
 
     # Return the chained functions.
     return chain_functions(function_chain)
 
 
+def locale_number_transform_factory(
+    alg: NSType,
+    thousands_sep: str,
+    decimal_point: str,
+) -> StrToStr:
+    """
+    Create a function to normalize locale-dependent numbers in a string.
+
+    Valid thousands separators are removed, and if *alg* contains
+    ``FLOAT`` the decimal point is changed to a period. This is done
+    with a single :func:`re.sub` call whose pattern begins with the
+    separator characters, so the regular expression engine can skip
+    directly between separators instead of evaluating lookbehinds
+    at every character of the input.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format the *str*.
+    thousands_sep : str
+        The thousands separator of the current locale.
+    decimal_point : str
+        The decimal point of the current locale.
+
+    Returns
+    -------
+    func : callable
+        A function to be chained into the output of
+        *input_string_transform_factory*.
+
+    See Also
+    --------
+    input_string_transform_factory
+    locale_number_two_pass_factory
+
+    """
+
+    # The combined pattern relies on both separators being single characters
+    # that cannot be confused with digits, which is what nearly every locale
+    # uses. Anything more exotic uses the original two-pass algorithm.
+    def simple(sep: str) -> bool:
+        return len(sep) == 1 and not ("0" <= sep <= "9")
+
+    use_float = alg & ns.FLOAT
+    if not (
+        (not thousands_sep or simple(thousands_sep))
+        and (not use_float or simple(decimal_point))
+    ):
+        return locale_number_two_pass_factory(alg, thousands_sep, decimal_point)
+
+    # A thousands separator follows one to three digits (that are not
+    # themselves preceded by the decimal point) and precedes exactly three.
+    # All lookbehinds include the separator itself so that the pattern
+    # starts with a literal. An empty separator is never removed.
+    thou = re.escape(thousands_sep)
+    dec = re.escape(decimal_point)
+    strip_thousands = ""
+    if thousands_sep:
+        nodecimal = ""
+        if use_float:
+            nodecimal = "".join(rf"(?<!{dec}[0-9]{{{n}}}{thou})" for n in range(1, 4))
+        strip_thousands = (
+            rf"{thou}(?<=[0-9]{thou})(?<![0-9]{{4}}{thou}){nodecimal}"
+            r"(?=[0-9]{3}(?![0-9]))"
+        )
+
+    # A decimal point next to a digit is changed to a period.
+    if not use_float or decimal_point == ".":
+        if not strip_thousands:
+            return _no_op
+        return partial(re.compile(strip_thousands).sub, "")
+    switch_decimal = rf"{dec}(?:(?<=[0-9]{dec})|(?=[0-9]))"
+    if not strip_thousands:
+        return partial(re.compile(switch_decimal).sub, ".")
+
+    # When both are needed, the empty group marks a thousands separator
+    # match. If the separators are the same character, thousands separator
+    # removal takes precedence, as it did when done in two passes.
+    both = re.compile(rf"{strip_thousands}()|{switch_decimal}")
+
+    def replace(m: Match[str]) -> str:
+        return "" if m.lastindex else "."
+
+    return partial(both.sub, replace)
+
+
+def locale_number_two_pass_factory(
+    alg: NSType,
+    thousands_sep: str,
+    decimal_point: str,
+) -> StrToStr:
+    """
+    Create a function to normalize locale-dependent numbers in two passes.
+
+    The first pass removes thousands separators, and the second pass
+    changes the decimal point to a period. Used by
+    *locale_number_transform_factory* when the separators are not
+    single non-digit characters.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format the *str*.
+    thousands_sep : str
+        The thousands separator of the current locale.
+    decimal_point : str
+        The decimal point of the current locale.
+
+    Returns
+    -------
+    func : callable
+        A function that removes thousands separators and (if *alg*
+        contains ``FLOAT``) changes the decimal point to a period.
+
+    See Also
+    --------
+    locale_number_transform_factory
+
+    """
+    function_chain: list[StrToStr] = []
+
+    # Create a regular expression that will remove thousands separators.
+    strip_thousands = r"""
+        (?<=[0-9]{{1}})  # At least 1 number
+        (?<![0-9]{{4}})  # No more than 3 numbers
+        {nodecimal}      # Cannot follow decimal
+        {thou}           # The thousands separator
+        (?=[0-9]{{3}}    # Three numbers must follow
+         ([^0-9]|$)      # But a non-number after that
+        )
+    """
+    nodecimal = r""
+    if alg & ns.FLOAT:
+        # Make a regular expression component that will ensure no
+        # separators are removed after a decimal point.
+        d = re.escape(decimal_point)
+        nodecimal += r"(?<!" + d + r"[0-9])"
+        nodecimal += r"(?<!" + d + r"[0-9]{2})"
+        nodecimal += r"(?<!" + d + r"[0-9]{3})"
+    strip_thousands = strip_thousands.format(
+        thou=re.escape(thousands_sep),
+        nodecimal=nodecimal,
+    )
+    strip_thousands_re = re.compile(strip_thousands, flags=re.VERBOSE)
+    function_chain.append(partial(strip_thousands_re.sub, ""))
+
+    # Create a regular expression that will change the decimal point to
+    # a period if not already a period.
+    if alg & ns.FLOAT and decimal_point != ".":
+        switch_decimal = r"(?<=[0-9]){decimal}|{decimal}(?=[0-9])"
+        switch_decimal = switch_decimal.format(decimal=re.escape(decimal_point))
+        switch_decimal_re = re.compile(switch_decimal)
+        function_chain.append(partial(switch_decimal_re.sub, "."))
+
+    return chain_functions(function_chain)
+
+
 def string_component_transform_factory(alg: NSType) -> StrTransformer:
     """
     Create a function to either transform a string or convert to a number.
@@ -695,7 +1051,7 @@ def string_component_transform_factory(alg: NSType) -> StrTransformer:
     if group_letters:
         func_chain.append(groupletters)
     if use_locale:
-        func_chain.append(get_strxfrm())
+        func_chain.append(natsort.compat.locale.get_strxfrm())
 
     # Return the correct chained functions.
     kwargs: dict[str, float | Callable[[str], StrOrBytes] | bool]
@@ -799,6 +1155,30 @@ def groupletters(x: str, _low: StrToStr = lower_function) -> str:
     return "".join(ichain.from_iterable((_low(y), y) for y in x))
 
 
+def groupletters_bytes(x: bytes) -> bytes:
+    """
+    Double all bytes, making doubled ASCII letters lowercase.
+
+    This is the *bytes* counterpart of `groupletters`.
+
+    Parameters
+    ----------
+    x : bytes
+        The bytes to modify.
+
+    Returns
+    -------
+    bytes
+
+    Examples
+    --------
+        >>> groupletters_bytes(b"Apple")
+        b'aAppppllee'
+
+    """
+    return bytes(ichain.from_iterable(zip(x.lower(), x)))
+
+
 def chain_functions(functions: Iterable[AnyCall]) -> AnyCall:
     """
     Chain a list of single-argument functions together and return.
@@ -898,33 +1278,297 @@ def path_splitter(
         ('this', 'thing', '.ext')
 
     """
-    if not isinstance(s, PurePath):
-        s = PurePath(s)
+    # Split the path into parts. Strings are split directly, because
+    # constructing a PurePath for each one is expensive.
+    if isinstance(s, PurePath):
+        *path_parts, base = s.parts or (str(s),)
+    else:
+        *path_parts, base = split_path_string(s)
 
-    # Split the path into parts.
-    try:
-        *path_parts, base = s.parts
-    except ValueError:
-        path_parts = []
-        base = str(s)
-
-    suffixes = []
-    if treat_base:
-        # Now, split off the file extensions until
-        #  - we reach a decimal number at the beginning of the suffix
-        #  - more than two suffixes have been seen
-        #  - a suffix is more than five characters (including leading ".")
-        #  - there are no more extensions
-        suffix_threshold = 5
-        for i, suffix in enumerate(reversed(PurePath(base).suffixes)):
-            if _d_match(suffix) or i > 1 or len(suffix) > suffix_threshold:
-                break
-            suffixes.append(suffix)
-        suffixes.reverse()
-
-    # Remove the suffixes from the base component
-    base = base.replace("".join(suffixes), "")
+    suffixes: list[str] = []
+    if treat_base and base[-1:] != "." and os.sep not in base:
+        suffixes = _split_suffixes(base, ".", _d_match)
+        # Remove the suffixes from the base component
+        base = base.replace("".join(suffixes), "")
     base_component = [base] if base else []
 
     # Join all path comonents in an iterator
     return filter(None, ichain(path_parts, base_component, suffixes))
+
+
+def bytes_path_splitter(
+    s: bytes,
+    *,
+    treat_base: bool = True,
+    _d_match: Callable[[bytes], Match[bytes] | None] = re.compile(rb"\.\d").match,
+    _sep: bytes = os.fsencode(os.sep),
+    _altsep: bytes | None = None if os.altsep is None else os.fsencode(os.altsep),
+) -> Iterator[bytes]:
+    """
+    Split a *bytes* path into its path components.
+
+    This is the *bytes* counterpart of `path_splitter`, without decoding
+    (except for paths beginning with a drive or with two separators,
+    which are left to `PurePath`).
+
+    Parameters
+    ----------
+    s : bytes
+        The path to split.
+    treat_base: bool, optional
+        If True, treat the base of component of the file path as
+        special and split off extensions. If False, do not do this.
+        The default is True.
+
+    Returns
+    -------
+    split : tuple
+        The path split by directory components and extensions.
+
+    Examples
+    --------
+        >>> tuple(bytes_path_splitter(b"this/thing.ext"))
+        (b'this', b'thing', b'.ext')
+
+    """
+    if _altsep is not None:
+        if s[1:2] == b":":
+            return map(
+                os.fsencode, path_splitter(os.fsdecode(s), treat_base=treat_base)
+            )
+        s = s.replace(_altsep, _sep)
+    if s[:2] == _sep + _sep:
+        return map(os.fsencode, path_splitter(os.fsdecode(s), treat_base=treat_base))
+    parts = [x for x in s.split(_sep) if x and x != b"."]
+    if s[:1] == _sep:
+        parts.insert(0, _sep)
+    *path_parts, base = parts or [b"."]
+
+    suffixes: list[bytes] = []
+    if treat_base and base[-1:] != b"." and _sep not in base:
+        suffixes = _split_suffixes(base, b".", _d_match)
+        base = base.replace(b"".join(suffixes), b"")
+    base_component = [base] if base else []
+    return filter(None, ichain(path_parts, base_component, suffixes))
+
+
+def _split_suffixes(
+    base: AnyStr,
+    dot: AnyStr,
+    d_match: Callable[[AnyStr], object],
+) -> list[AnyStr]:
+    """Find the file extensions at the end of the base of a path."""
+    # Split off the file extensions until
+    #  - we reach a decimal number at the beginning of the suffix
+    #  - more than two suffixes have been seen
+    #  - a suffix is more than five characters (including leading ".")
+    #  - there are no more extensions
+    # Leading dots do not start an extension, as with PurePath.suffixes.
+    suffix_threshold = 5
+    suffixes: list[AnyStr] = []
+    stem = base
+    while len(suffixes) < 2:  # noqa: PLR2004
+        stem, _, suffix = stem.rpartition(dot)
+        suffix = dot + suffix
+        if not stem.lstrip(dot) or d_match(suffix):
+            break
+        if len(suffix) > suffix_threshold:
+            break
+        suffixes.append(suffix)
+    suffixes.reverse()
+    return suffixes
+
+
+def split_path_string(
+    s: str,
+    sep: str = os.sep,
+    altsep: str | None = os.altsep,
+) -> list[str]:
+    """
+    Split a path string into the same parts as ``PurePath(s).parts``.
+
+    Repeated separators and "." components are dropped, and the root
+    (if any) is the first part. Paths that begin with a drive or with
+    two separators have more involved rules, so are left to `PurePath`
+    (or rather its Windows form if there is an *altsep*).
+
+    Parameters
+    ----------
+    s : str
+        The path to split.
+    sep : str, optional
+        The path separator. The default is that of the current OS.
+    altsep : str, optional
+        An alternative path separator, or None if there is none.
+        The default is that of the current OS.
+
+    Returns
+    -------
+    parts : list
+        The parts of the path. This is never empty; an empty path
+        is the current directory, ".".
+
+    Examples
+    --------
+        >>> split_path_string("/this//is/./a/path/", sep="/", altsep=None)
+        ['/', 'this', 'is', 'a', 'path']
+
+    """
+    pure_path = PurePosixPath if altsep is None else PureWindowsPath
+    if altsep is not None:
+        if s[1:2] == ":":
+            return list(pure_path(s).parts)
+        s = s.replace(altsep, sep)
+    if s[:2] == sep + sep:
+        return list(pure_path(s).parts)
+    parts = [x for x in s.split(sep) if x and x != "."]
+    if s[:1] == sep:
+        parts.insert(0, sep)
+    return parts or ["."]
+
+
+# Each element of an encoded key (see encode_key) starts with one of these
+# tags. The end of a tuple has the smallest tag so that a tuple sorts before
+# any longer tuple that it begins. The four number tags are in numerical
+# order, and str and bytes share a tag because they are never compared.
+_END, _NEG_INF, _NEG, _NON_NEG, _POS_INF, _TEXT, _TUPLE = range(7)
+_COMPLEMENT = bytes(range(255, -1, -1))
+_LONG_SIZE = 0xFF
+_SMALL_INT = 1 << (8 * (_LONG_SIZE - 1))
+
+
+def encode_key(key: Sequence[Any], *, prefix: bool = False) -> bytes:
+    """
+    Encode a natsort key as *bytes* that sort in the same order.
+
+    For any two keys *a* and *b*, ``encode_key(a) < encode_key(b)`` if and
+    only if ``a < b``, and the encodings are equal if and only if the keys
+    are. This lets a natural ordering be stored, or be used by programs
+    (such as databases) that only know how to compare bytes.
+
+    Parameters
+    ----------
+    key : tuple
+        The key to encode, as returned by a natsort key function. It may
+        contain *str*, *bytes*, *int*, non-NaN *float*, and nested tuples.
+    prefix : bool, optional
+        Leave the key open-ended, so the result is a prefix of the
+        encoding of every key that begins with the elements of *key*,
+        and whose first different element (if any) begins with the text
+        of the last element of *key*. The default is *False*.
+
+    Returns
+    -------
+    bytes
+
+    Raises
+    ------
+    TypeError
+        If *key* contains an object of any other type.
+    ValueError
+        If *key* contains NaN, which has no place in the order.
+
+    Examples
+    --------
+        >>> encode_key(("a", 2)) < encode_key(("a", 10)) < encode_key(("b",))
+        True
+        >>> encode_key(("a", 10, ".txt")).startswith(
+        ...     encode_key(("a", 10, ".t"), prefix=True)
+        ... )
+        True
+
+    """
+    out = bytearray()
+    _encode_tuple(out, key, prefix=prefix)
+    return bytes(out)
+
+
+def _encode_tuple(out: bytearray, key: Sequence[Any], *, prefix: bool) -> None:
+    """Append the encoding of the elements of a tuple to *out*."""
+    for x in key[:-1] if prefix else key:
+        # Fast paths for the most common elements of natsort keys.
+        if type(x) is bytes:
+            out.append(_TEXT)
+            out += x.replace(b"\x00", b"\x00\xff")
+            out += b"\x00\x01"
+        elif type(x) is int and 0 <= x < _SMALL_INT:
+            size = (x.bit_length() + 7) // 8
+            out.append(_NON_NEG)
+            out.append(size)
+            out += x.to_bytes(size, "big")
+            out += b"\x00\x01"
+        else:
+            _encode_element(out, x, prefix=False)
+    if not prefix:
+        out.append(_END)
+    elif key:
+        _encode_element(out, key[-1], prefix=True)
+
+
+def _encode_element(out: bytearray, x: Any, *, prefix: bool) -> None:  # noqa: ANN401
+    """Append the encoding of one element of a key to *out*."""
+    if isinstance(x, str):
+        x = x.encode("utf-8", "surrogatepass")
+    if isinstance(x, bytes):
+        # Escape NUL so the terminator sorts before any continuation.
+        out.append(_TEXT)
+        out += x.replace(b"\x00", b"\x00\xff")
+        if not prefix:
+            out += b"\x00\x01"
+    elif isinstance(x, tuple):
+        out.append(_TUPLE)
+        _encode_tuple(out, x, prefix=prefix)
+    else:
+        _encode_number(out, x)
+
+
+def _encode_number(out: bytearray, x: Any) -> None:  # noqa: ANN401
+    """Append the encoding of an int or float to *out*."""
+    if isinstance(x, float):
+        if x != x:
+            msg = "cannot encode a key containing NaN"
+            raise ValueError(msg)
+        if x in {float("inf"), float("-inf")}:
+            out.append(_POS_INF if x > 0 else _NEG_INF)
+            return
+        num, den = x.as_integer_ratio()
+    elif isinstance(x, int):
+        num, den = x, 1
+    else:
+        msg = f"cannot encode a key containing {type(x).__name__!r}"
+        raise TypeError(msg)
+    # The magnitude encoding is prefix-free, so inverting every byte
+    # exactly reverses its order, as is needed for negative numbers.
+    if num < 0:
+        out.append(_NEG)
+        out += _encode_magnitude(-num, den).translate(_COMPLEMENT)
+    else:
+        out.append(_NON_NEG)
+        out += _encode_magnitude(num, den)
+
+
+def _encode_magnitude(num: int, den: int) -> bytes:
+    """
+    Encode the non-negative number *num* / *den*, where *den* is a power of 2.
+
+    The integer part is big-endian after its length in bytes, and the
+    fractional part is its binary expansion with NUL escaped, followed by
+    a terminator that sorts before any continuation.
+    """
+    whole, rem = divmod(num, den)
+    size = (whole.bit_length() + 7) // 8
+    if size < _LONG_SIZE:
+        head = bytes((size,))
+    else:
+        head = bytes((_LONG_SIZE,)) + size.to_bytes(4, "big")
+    if not rem:
+        return head + whole.to_bytes(size, "big") + b"\x00\x01"
+    bits = den.bit_length() - 1
+    frac_size = (bits + 7) // 8
+    frac = (rem << (8 * frac_size - bits)).to_bytes(frac_size, "big").rstrip(b"\x00")
+    return (
+        head
+        + whole.to_bytes(size, "big")
+        + frac.replace(b"\x00", b"\x00\xff")
+        + b"\x00\x01"
+    )
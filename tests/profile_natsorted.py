@@ -8,6 +8,7 @@ from __future__ import annotations
 import cProfile
 import locale
 import sys
+from operator import itemgetter
 
 try:
     from natsort import natsort_keygen, ns
@@ -36,6 +37,9 @@ basic_key = natsort_keygen()
 real_key = natsort_keygen(alg=ns.REAL)
 path_key = natsort_keygen(alg=ns.PATH)
 locale_key = natsort_keygen(alg=ns.LOCALE)
+fields_key = natsort_keygen(
+    fields=[(itemgetter(0), ns.IGNORECASE), (itemgetter(1), ns.REAL)]
+)
 
 
 def prof_time_to_generate() -> None:
@@ -73,6 +77,10 @@ cProfile.run(
 cProfile.run('prof_parsing(some_bytes, "*** Basic Call, Byte String ***")', sort="time")
 cProfile.run('prof_parsing(a_path, "*** Path Call ***", path_key)', sort="time")
 cProfile.run('prof_parsing(a_list, "*** Basic Call, Recursive ***")', sort="time")
+cProfile.run(
+    'prof_parsing(a_list, "*** Fields Call ***", fields_key)',
+    sort="time",
+)
 cProfile.run(
     'prof_parsing("434,930,000 dollars", "*** Locale Call ***", locale_key)',
     sort="time",
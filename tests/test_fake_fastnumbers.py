@@ -8,10 +8,13 @@ import unicodedata
 from math import isinf
 from typing import cast
 
+import pytest
 from hypothesis import given
-from hypothesis.strategies import floats, integers, text
+from hypothesis.strategies import floats, integers, sampled_from, text
 
-from natsort.compat.fake_fastnumbers import fast_float, fast_int
+from natsort.compat.fake_fastnumbers import fast_float, fast_int, try_float, try_int
+from natsort.ns_enum import NSType, ns
+from natsort.utils import regex_chooser
 
 
 def is_float(x: str) -> bool:
@@ -134,3 +137,41 @@ def test_fast_int_with_key_applies_to_string_example() -> None:
 @given(text().filter(not_an_int).filter(bool))
 def test_fast_int_with_key_applies_to_string(x: str) -> None:
     assert fast_int(x, key=lambda x: x.upper()) == x.upper()
+
+
+def test_try_float_converts_split_components_example() -> None:
+    given = ["a", "5.", "b", "-6.2e3", ".txt", "nan", " inf", "nanny", "½", "-"]
+    expected = ["A", 5.0, "B", -6.2e3, ".TXT", 7, float("inf"), "NANNY", 0.5, "-"]
+    assert list(try_float(given, map=True, nan=7, on_fail=str.upper)) == expected
+
+
+def test_try_int_converts_split_components_example() -> None:
+    given = ["a", "56", "b", "-6", "+", "۱۲", "²", ".txt"]
+    expected = ["A", 56, "B", -6, "+", 12, 2, ".TXT"]
+    assert list(try_int(given, map=True, on_fail=str.upper)) == expected
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.INT,
+        ns.INT | ns.SIGNED,
+        ns.FLOAT,
+        ns.REAL,
+        ns.FLOAT | ns.NOEXP,
+        ns.REAL | ns.NOEXP,
+    ],
+)
+@given(x=text(alphabet=sampled_from("0123456789.eE+- a_nfNI۱²½")).filter(bool))
+def test_try_functions_are_identical_to_fast_functions_for_split_components(
+    x: str,
+    alg: NSType,
+) -> None:
+    components = list(filter(None, regex_chooser(alg).split(x)))
+    if alg & ns.FLOAT:
+        result = try_float(components, map=True, nan=7, on_fail=str.upper)
+        expected = [fast_float(y, nan=7, key=str.upper) for y in components]
+    else:
+        result = try_int(components, map=True, on_fail=str.upper)
+        expected = [fast_int(y, key=str.upper) for y in components]
+    assert list(result) == expected
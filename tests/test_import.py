@@ -0,0 +1,71 @@
+"""\
+Test that importing natsort defers expensive work until it is needed.
+
+See dev/importtime.py to measure the import time itself.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import natsort
+from natsort import natsort as implementation
+
+
+def imported_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the modules it imported."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code + "\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_natsort_does_not_import_implementation_or_backends() -> None:
+    modules = imported_modules("import natsort")
+    assert "natsort" in modules
+    assert "natsort.ns_enum" in modules
+    deferred = {
+        "natsort.natsort",
+        "natsort.fs",
+        "natsort.mmap_index",
+        "natsort.utils",
+        "natsort.compat.fastnumbers",
+        "natsort.compat.locale",
+        "natsort.unicode_numeric_data",
+        "fastnumbers",
+        "icu",
+        "platform",
+    }
+    assert modules.isdisjoint(deferred)
+
+
+def test_natural_sorting_does_not_import_locale_or_os_backends() -> None:
+    code = "import natsort; natsort.natsorted(['a10', 'a2'])"
+    modules = imported_modules(code)
+    assert "natsort.natsort" in modules
+    assert modules.isdisjoint({"icu", "platform", "locale"})
+
+
+def test_lazy_attributes_are_the_same_objects_as_in_the_implementation() -> None:
+    assert natsort.natsorted is implementation.natsorted
+    assert natsort.natsort_key is implementation.natsort_key
+    assert natsort.os_sort_key is implementation.os_sort_key
+    assert natsort.natsort_key("a10") == ("a", 10)
+    assert "natsort_keygen" in (natsort.natsort_key.__doc__ or "")
+
+
+def test_all_public_names_are_available() -> None:
+    for name in natsort.__all__:
+        assert getattr(natsort, name) is not None
+    assert set(natsort.__all__) <= set(dir(natsort))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no attribute 'not_a_thing'"):
+        natsort.not_a_thing  # noqa: B018
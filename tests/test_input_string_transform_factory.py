@@ -6,10 +6,14 @@ from typing import Callable
 
 import pytest
 from hypothesis import example, given
-from hypothesis.strategies import integers, text
+from hypothesis.strategies import integers, sampled_from, text
 
 from natsort.ns_enum import NS_DUMB, NSType, ns
-from natsort.utils import input_string_transform_factory
+from natsort.utils import (
+    input_string_transform_factory,
+    locale_number_transform_factory,
+    locale_number_two_pass_factory,
+)
 
 
 def thousands_separated_int(n: str) -> str:
@@ -124,3 +128,28 @@ def test_input_string_transform_factory_does_nothing_with_non_num_input() -> Non
     input_string_transform_func = input_string_transform_factory(ns.LOCALE | ns.FLOAT)
     expected = "154s,t53"
     assert input_string_transform_func("154s,t53") == expected
+
+
+@pytest.mark.parametrize("alg", [ns.LOCALENUM, ns.LOCALENUM | ns.FLOAT])
+@pytest.mark.parametrize(
+    ("thousands_sep", "decimal_point"),
+    [
+        (",", "."),
+        (".", ","),
+        ("\xa0", ","),
+        ("'", "."),
+        ("", "."),
+        (",", ","),
+        ("..", ","),  # Not a single character, uses the two-pass fallback.
+    ],
+)
+@given(x=text(alphabet=sampled_from("0123456789.,'\xa0 a")))
+def test_locale_number_transform_factory_is_identical_to_two_pass_algorithm(
+    x: str,
+    alg: NSType,
+    thousands_sep: str,
+    decimal_point: str,
+) -> None:
+    single = locale_number_transform_factory(alg, thousands_sep, decimal_point)
+    two_pass = locale_number_two_pass_factory(alg, thousands_sep, decimal_point)
+    assert single(x) == two_pass(x)
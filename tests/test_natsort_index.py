@@ -0,0 +1,137 @@
+"""
+Testing for the on-disk index of the lines of a file in natural order.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort import NatsortIndex, natsort_index, natsort_keygen, natsorted, ns
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from natsort.ns_enum import NSType
+
+LINES = [b"shard_250", b"shard_9", b"Shard_100.txt", b"shard_100", b"", b"shard_10"]
+LINES += [b"shard_100a", b"shard_251", b"other", b"shard_99.5", b"shard_100"]
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    (tmp_path / "in.txt").write_bytes(b"\n".join(LINES) + b"\n")
+    return tmp_path / "in.txt"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE | ns.PRESORT, ns.REAL])
+def test_natsort_index_holds_the_lines_in_natural_order(
+    tmp_path: Path,
+    chunk_size: int,
+    alg: NSType,
+) -> None:
+    lines = [*LINES, b"\x80a01", b"\x80A1", b"'a1", b"'A01", b"\\1.0", b"\\01"]
+    (tmp_path / "in.txt").write_bytes(b"\n".join(lines) + b"\n")
+    with natsort_index(
+        tmp_path / "in.txt", tmp_path / "in.idx", alg=alg, chunk_size=chunk_size
+    ) as index:
+        assert index.alg == alg | ns.BYTES
+        assert [index.line(i) for i in range(len(index))] == natsorted(
+            lines, alg=alg | ns.BYTES
+        )
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE, ns.REAL])
+@pytest.mark.parametrize(
+    ("low", "high"),
+    [("shard_100", "shard_250"), (b"shard_99", None), (None, "shard_9"), ("z", "a")],
+)
+def test_natsort_index_between_finds_a_natural_range(
+    corpus: Path,
+    alg: NSType,
+    low: str | bytes | None,
+    high: str | bytes | None,
+) -> None:
+    natsort_index(corpus, corpus.with_suffix(".idx"), alg=alg).close()
+    key = natsort_keygen(alg=alg | ns.BYTES)
+
+    def encode(x: str | bytes) -> bytes:
+        return x.encode() if isinstance(x, str) else x
+
+    expected = [
+        x
+        for x in natsorted(LINES, alg=alg | ns.BYTES)
+        if (low is None or key(encode(low)) <= key(x))
+        and (high is None or key(x) <= key(encode(high)))
+    ]
+    with NatsortIndex(corpus.with_suffix(".idx"), corpus) as index:
+        assert [index.line(i) for i in index.between(low, high)] == expected
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        ("shard_100", [b"shard_100", b"shard_100", b"Shard_100.txt", b"shard_100a"]),
+        ("shard_100.t", [b"Shard_100.txt"]),
+        ("shard_25", []),
+        ("sh", natsorted(LINES[:4] + LINES[5:8] + LINES[9:], alg=ns.IGNORECASE | ns.B)),
+        ("", natsorted(LINES, alg=ns.IGNORECASE | ns.B)),
+    ],
+)
+def test_natsort_index_prefix_finds_lines_beginning_with_a_natural_key(
+    corpus: Path,
+    prefix: str,
+    expected: list[bytes],
+) -> None:
+    with natsort_index(corpus, corpus.with_suffix(".idx"), alg=ns.IGNORECASE) as index:
+        assert [index.line(i) for i in index.prefix(prefix)] == expected
+
+
+def test_natsort_index_gives_offsets_lengths_and_keys(tmp_path: Path) -> None:
+    (tmp_path / "in.txt").write_bytes(b"item10\0item9\0item1")
+    index = natsort_index(tmp_path / "in.txt", tmp_path / "in.idx", sep=b"\0")
+    assert [index[i] for i in range(len(index))] == [(13, 5), (7, 5), (0, 6)]
+    assert index[-1] == (0, 6)
+    assert index.key(0) < index.key(1) < index.key(2)
+    assert index.bisect_left("item9") == 1
+    assert index.bisect_right("item9") == 2
+    index.close()
+    with pytest.raises(ValueError, match="indexed file"):
+        NatsortIndex(tmp_path / "in.idx").line(0)
+
+
+def test_natsort_index_handles_empty_files(tmp_path: Path) -> None:
+    (tmp_path / "in.txt").write_bytes(b"")
+    with natsort_index(tmp_path / "in.txt", tmp_path / "in.idx") as index:
+        assert len(index) == 0
+        assert index.between("a", "b") == range(0)
+        assert index.prefix("") == range(0)
+
+
+def test_natsort_index_rejects_files_that_are_not_indexes(corpus: Path) -> None:
+    with pytest.raises(ValueError, match="not a natsort index"):
+        NatsortIndex(corpus)
+
+
+def test_natsort_index_rejects_a_file_changed_since_it_was_indexed(
+    corpus: Path,
+) -> None:
+    index = corpus.with_suffix(".idx")
+    natsort_index(corpus, index).close()
+    stat = corpus.stat()
+    # The same size, but a different time: the lines may have moved.
+    corpus.write_bytes(b"\n".join(LINES[::-1]) + b"\n")
+    os.utime(corpus, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    with pytest.raises(ValueError, match="has changed since it was indexed"):
+        NatsortIndex(index, corpus)
+    # The same time, but a different size.
+    corpus.write_bytes(b"\n".join(LINES[:3]) + b"\n")
+    os.utime(corpus, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    with pytest.raises(ValueError, match="has changed since it was indexed"):
+        NatsortIndex(index, corpus)
+    # The index can still be used without reading lines.
+    with NatsortIndex(index) as opened:
+        assert len(opened) == len(LINES)
@@ -5,12 +5,15 @@ See the README or the natsort homepage for more details.
 
 from __future__ import annotations
 
+import gc
 import os
+from operator import itemgetter
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 import pytest
 
-from natsort import natsort_key, natsort_keygen, natsorted, ns
+from natsort import cached_natsort_keygen, natsort_key, natsort_keygen, natsorted, ns
 from natsort.compat.locale import get_strxfrm, null_string_locale
 
 if TYPE_CHECKING:
@@ -48,6 +51,41 @@ def test_natsort_keygen_with_invalid_alg_input_raises_value_error() -> None:
         natsort_keygen(None, "1")  # type: ignore[arg-type]
 
 
+def test_natsort_keygen_with_fields_uses_an_algorithm_per_field() -> None:
+    ns_key = natsort_keygen(
+        fields=[(itemgetter(0), ns.PATH), (itemgetter(2), ns.REAL), (None, ns.DEFAULT)]
+    )
+    row = ("/a/b2", "ignored", "x-1.5")
+    assert ns_key(row) == (
+        natsort_keygen(itemgetter(0), ns.PATH)(row),
+        natsort_keygen(itemgetter(2), ns.REAL)(row),
+        natsort_keygen()(row),
+    )
+
+
+def test_natsort_keygen_with_fields_parses_any_field_like_natsort_keygen() -> None:
+    fields = [(itemgetter(0), ns.VERSION), (itemgetter(1), ns.REAL)]
+    fields += [(itemgetter(2), ns.BYTES), (itemgetter(3), ns.PATH)]
+    row = ("1.2.3rc1", -2.5, b"x10", PurePosixPath("a/b1.txt"))
+    assert natsort_keygen(fields=fields)(row) == tuple(
+        natsort_keygen(getter, alg)(row) for getter, alg in fields
+    )
+
+
+def test_natsort_keygen_with_fields_combines_alg_and_applies_key_first() -> None:
+    ns_key = natsort_keygen(
+        key=itemgetter("row"),
+        alg=ns.IGNORECASE,
+        fields=[(itemgetter(1), ns.FLOAT)],
+    )
+    assert ns_key({"row": ("a", "B1.5")}) == (("b", 1.5),)
+
+
+def test_natsort_keygen_with_fields_validates_each_alg() -> None:
+    with pytest.raises(ValueError, match="'alg' argument"):
+        natsort_keygen(fields=[(None, "1")])  # type: ignore[list-item]
+
+
 @pytest.mark.parametrize(
     ("alg", "expected"),
     [(ns.DEFAULT, ("a-", 5, ".", 34, "e", 1)), (ns.FLOAT | ns.SIGNED, ("a", -50.34))],
@@ -195,3 +233,50 @@ def test_natsort_keygen_with_locale_bytes(
     mocker.patch("natsort.compat.locale.dumb_sort", return_value=is_dumb)
     ns_key = natsort_keygen(alg=alg)
     assert ns_key(bytes_input) == expected
+
+
+class Item:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_cached_natsort_keygen_only_computes_each_key_once(
+    mocker: MockerFixture,
+) -> None:
+    items = [Item("num3"), Item("num5"), Item("num2")]
+    getter = mocker.Mock(side_effect=lambda x: x.name)
+    key = cached_natsort_keygen(key=getter)
+    assert sorted(items, key=key) == [items[2], items[0], items[1]]
+    assert sorted(items, key=key) == [items[2], items[0], items[1]]
+    assert getter.call_count == 3
+    assert len(key) == 3
+    assert key(items[0]) == natsort_keygen(key=lambda x: x.name)(items[0])
+
+
+def test_cached_natsort_keygen_can_invalidate_and_clear() -> None:
+    items = [Item("num3"), Item("num5"), Item("num2")]
+    key = cached_natsort_keygen(key=lambda x: x.name)
+    sorted(items, key=key)
+    items[2].name = "num9"
+    assert sorted(items, key=key) == [items[2], items[0], items[1]]
+    key.invalidate(items[2], Item("not cached"))
+    assert len(key) == 2
+    assert sorted(items, key=key) == [items[0], items[1], items[2]]
+    key.clear()
+    assert len(key) == 0
+
+
+def test_cached_natsort_keygen_forgets_garbage_collected_objects() -> None:
+    key = cached_natsort_keygen(key=lambda x: x.name)
+    item = Item("num3")
+    key(item)
+    assert len(key) == 1
+    del item
+    gc.collect()
+    assert len(key) == 0
+
+
+def test_cached_natsort_keygen_does_not_cache_objects_without_weakrefs() -> None:
+    key = cached_natsort_keygen(alg=ns.REAL)
+    assert key("a-5") == ("a", -5)
+    assert len(key) == 0
@@ -0,0 +1,70 @@
+"""
+Testing for sorting the lines of a memory-mapped file.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort import natsort_mmap, natsorted, ns
+
+if TYPE_CHECKING:
+    from array import array
+    from pathlib import Path
+
+    from natsort.ns_enum import NSType
+
+
+def lines_at(data: bytes, pairs: array[int]) -> list[bytes]:
+    return [data[pairs[i] : pairs[i] + pairs[i + 1]] for i in range(0, len(pairs), 2)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE | ns.PRESORT, ns.REAL])
+def test_natsort_mmap_gives_the_same_order_as_natsorted(
+    tmp_path: Path,
+    chunk_size: int,
+    reverse: bool,
+    alg: NSType,
+) -> None:
+    lines = [b"a10", b"A1", b"a01", b"", b"a1", b"b-2.5", b"b1", b"a2", b"A1", b"a1"]
+    lines += [b"\x80a01", b"\x80A1", b"'a1", b"'A01", b"\\1.0", b"\\01"]
+    data = b"\n".join(lines) + b"\n"
+    (tmp_path / "in.txt").write_bytes(data)
+    pairs = natsort_mmap(
+        tmp_path / "in.txt", reverse=reverse, alg=alg, chunk_size=chunk_size
+    )
+    assert lines_at(data, pairs) == natsorted(
+        lines, reverse=reverse, alg=alg | ns.BYTES
+    )
+
+
+def test_natsort_mmap_can_write_the_sorted_file(tmp_path: Path) -> None:
+    (tmp_path / "in.txt").write_bytes(b"item10\0item9\0item1")
+    pairs = natsort_mmap(tmp_path / "in.txt", sep=b"\0", output=tmp_path / "out.txt")
+    assert list(pairs) == [13, 5, 7, 5, 0, 6]
+    assert (tmp_path / "out.txt").read_bytes() == b"item1\0item9\0item10\0"
+
+
+def test_natsort_mmap_handles_empty_files(tmp_path: Path) -> None:
+    (tmp_path / "in.txt").write_bytes(b"")
+    pairs = natsort_mmap(tmp_path / "in.txt", output=tmp_path / "out.txt")
+    assert len(pairs) == 0
+    assert (tmp_path / "out.txt").read_bytes() == b""
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"sep": b""}, "'sep'"), ({"chunk_size": 0}, "'chunk_size'")],
+)
+def test_natsort_mmap_rejects_bad_arguments(
+    tmp_path: Path,
+    kwargs: dict[str, bytes | int],
+    match: str,
+) -> None:
+    (tmp_path / "in.txt").write_bytes(b"a\n")
+    with pytest.raises(ValueError, match=match):
+        natsort_mmap(tmp_path / "in.txt", **kwargs)  # type: ignore[arg-type]
@@ -6,13 +6,21 @@ See the README or the natsort homepage for more details.
 from __future__ import annotations
 
 import math
+from itertools import islice
 from operator import itemgetter
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 import pytest
 
-from natsort import as_utf8, natsorted, ns
+from natsort import (
+    as_utf8,
+    natsort_inplace,
+    natsorted,
+    natsorted_iter,
+    natsorted_paths,
+    ns,
+)
 
 if TYPE_CHECKING:
     from natsort.ns_enum import NSType
@@ -420,3 +428,95 @@ def test_natsort_sorts_consistently_with_presort() -> None:
     given = ["a1", "a1.45", "a01", "a1.4500"]
     result = natsorted(given, alg=ns.FLOAT | ns.PRESORT)
     assert result == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.FLOAT | ns.PRESORT])
+def test_natsort_inplace_sorts_the_same_list_as_natsorted(
+    float_list: list[str],
+    reverse: bool,
+    alg: NSType,
+) -> None:
+    given = [*float_list, "a1", "a01", "a1.45", "a1.4500"]
+    expected = natsorted(given, key=str.upper, reverse=reverse, alg=alg)
+    natsort_inplace(given, key=str.upper, reverse=reverse, alg=alg)
+    assert given == expected
+
+
+@pytest.mark.parametrize(
+    ("reverse", "expected"),
+    [
+        (False, ["01", 1, "1", "A01", "a001", "a01", "a1", "a1", "a1.0", "b"]),
+        (True, ["b", "a1.0", "a1", "a1", "a01", "a001", "A01", 1, "1", "01"]),
+    ],
+)
+def test_natsorted_presort_orders_ties_by_string_then_input_order(
+    reverse: bool,
+    expected: list[str | int],
+) -> None:
+    given = ["a1", "A01", "a01", 1, "1", "a1.0", "01", "a001", "b", "a1"]
+    result = natsorted(given, reverse=reverse, alg=ns.IGNORECASE | ns.PRESORT)
+    assert result == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE | ns.PRESORT])
+def test_natsorted_iter_yields_the_same_order_as_natsorted(
+    reverse: bool,
+    alg: NSType,
+) -> None:
+    given = ["a1", "A01", "a01", 1, "1", "a10", "01", "a001", "b", "a1", "a2"]
+    expected = natsorted(given, reverse=reverse, alg=alg)
+    assert list(natsorted_iter(given, reverse=reverse, alg=alg)) == expected
+
+
+def test_natsorted_iter_is_lazy_after_computing_keys() -> None:
+    given = (f"num{i}" for i in range(100, 0, -1))
+    result = natsorted_iter(given, key=str.upper)
+    assert next(result) == "num1"
+    assert list(islice(result, 2)) == ["num2", "num3"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "alg", [ns.DEFAULT, ns.IGNORECASE | ns.PRESORT, ns.FLOAT, ns.VERSION]
+)
+def test_natsorted_paths_gives_the_same_order_as_natsorted_with_path(
+    reverse: bool,
+    alg: NSType,
+) -> None:
+    given = [
+        "/p/a10/x.txt",
+        "/p/a2",
+        "p/A01/x.txt",
+        "/p/a01/y",
+        "/p/a1/x",
+        "/p/a2/x.tar.gz",
+        "/p/a2/x",
+        "/p",
+        "./p/a1.5",
+        "/p//a2/x",
+        "/",
+    ]
+    expected = natsorted(given, reverse=reverse, alg=alg | ns.PATH)
+    assert natsorted_paths(given, reverse=reverse, alg=alg) == expected
+
+
+def test_natsorted_paths_supports_key_and_pathlib() -> None:
+    given = [
+        ("c", PurePosixPath("a/10/something")),
+        ("a", PurePosixPath("a/1/something")),
+        ("b", PurePosixPath("a/1")),
+    ]
+    assert natsorted_paths(given, key=itemgetter(1)) == [given[2], given[1], given[0]]
+
+
+def test_natsorted_sorts_bytes_naturally_with_bytes_option() -> None:
+    given = [b"dir/file10.log", b"dir/file9.log", b"dir/file9.log.1", b"d/x"]
+    assert natsorted(given) == sorted(given)
+    assert natsorted(given, alg=ns.BYTES | ns.PATH) == [
+        b"d/x",
+        b"dir/file9.log",
+        b"dir/file9.log.1",
+        b"dir/file10.log",
+    ]
@@ -5,9 +5,13 @@ See the README or the natsort homepage for more details.
 
 from __future__ import annotations
 
+from array import array
 from operator import itemgetter
+from typing import Literal
 
 import pytest
+from hypothesis import given as hypothesis_given
+from hypothesis.strategies import integers, lists, permutations
 
 from natsort import (
     as_ascii,
@@ -17,9 +21,16 @@ from natsort import (
     index_humansorted,
     index_natsorted,
     index_realsorted,
+    natgroupby,
+    natmedian,
+    natnth,
+    natpartition,
+    natpercentile,
+    natrank,
     natsorted,
     ns,
     order_by_index,
+    order_by_index_inplace,
     realsorted,
 )
 
@@ -96,6 +107,31 @@ def test_index_natsorted_can_presort() -> None:
     assert result == expected
 
 
+def test_index_natsorted_presort_and_reverse_keep_ties_in_input_order() -> None:
+    given = iter(["a01", "a1", "b2", "a1", "a01"])
+    result = index_natsorted(given, reverse=True, alg=ns.PRESORT)
+    assert result == [2, 1, 3, 0, 4]
+
+
+def test_index_natsorted_can_return_compact_array() -> None:
+    given = ["num3", "num5", "num2"]
+    result = index_natsorted(given, output="array")
+    assert result == array("l", [2, 0, 1])
+
+
+def test_index_natsorted_can_return_numpy_array() -> None:
+    np = pytest.importorskip("numpy")
+    given = ["num3", "num5", "num2"]
+    result = index_natsorted(given, output="numpy")
+    assert result.dtype == np.intp
+    assert result.tolist() == [2, 0, 1]
+
+
+def test_index_natsorted_rejects_unknown_output_type() -> None:
+    with pytest.raises(ValueError, match="'output' must be"):
+        index_natsorted(["a"], output="tuple")  # type: ignore[call-overload]
+
+
 def test_index_realsorted_is_identical_to_index_natsorted_with_real_alg(
     float_list: list[str],
 ) -> None:
@@ -122,3 +158,178 @@ def test_order_by_index_returns_generator_with_iter_true() -> None:
     index = [2, 0, 1]
     assert order_by_index(given, index, True) != [given[i] for i in index]
     assert list(order_by_index(given, index, True)) == [given[i] for i in index]
+
+
+@hypothesis_given(lists(integers()).flatmap(lambda x: permutations(range(len(x)))))
+def test_order_by_index_inplace_matches_order_by_index(index: list[int]) -> None:
+    given = [f"a{i * 7 % 5}" for i in range(len(index))]
+    other = array("l", range(len(index)))
+    expected = order_by_index(given, index), order_by_index(other, index)
+    order_by_index_inplace(index, given, other)
+    assert given == expected[0]
+    assert list(other) == expected[1]
+
+
+def test_order_by_index_inplace_applies_natsort_index_to_all_sequences() -> None:
+    given = ["num3", "num5", "num2"]
+    other = ["foo", "bar", "baz"]
+    order_by_index_inplace(index_natsorted(given), given, other)
+    assert given == ["num2", "num3", "num5"]
+    assert other == ["baz", "foo", "bar"]
+
+
+@pytest.mark.parametrize(
+    ("index", "match"),
+    [
+        ([0, 1], "same length"),
+        ([0, 0, 1], "permutation"),
+        ([0, 1, 3], "permutation"),
+        ([0, 1, -1], "permutation"),
+    ],
+)
+def test_order_by_index_inplace_rejects_bad_index_without_modifying(
+    index: list[int], match: str
+) -> None:
+    given = ["num3", "num5", "num2"]
+    with pytest.raises(ValueError, match=match):
+        order_by_index_inplace(index, given)
+    assert given == ["num3", "num5", "num2"]
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [
+        ("dense", [2, 3, 1, 2, 3]),
+        ("min", [2, 4, 1, 2, 4]),
+        ("ordinal", [2, 4, 1, 3, 5]),
+    ],
+)
+def test_natrank_gives_equal_natural_keys_the_same_rank(
+    method: Literal["dense", "min", "ordinal"],
+    expected: list[int],
+) -> None:
+    given = ["num3", "num5", "num2", "num03", "num05"]
+    assert natrank(given, method=method) == expected
+
+
+def test_natrank_supports_reverse_key_and_alg() -> None:
+    given = [("a", "num5.10"), ("b", "num-3"), ("c", "num5.3"), ("d", "num2")]
+    assert natrank(given, key=itemgetter(1), reverse=True, alg=ns.REAL) == [2, 4, 1, 3]
+
+
+def test_natrank_ordinal_can_presort() -> None:
+    given = ["a1", "a1.4500", "a01", "a1.45"]
+    result = natrank(given, method="ordinal", alg=ns.FLOAT | ns.PRESORT)
+    assert order_by_index(given, sorted(range(4), key=result.__getitem__)) == (
+        natsorted(given, alg=ns.FLOAT | ns.PRESORT)
+    )
+
+
+def test_natrank_can_return_compact_array() -> None:
+    assert natrank(["b", "a", "b"], output="array") == array("l", [2, 1, 2])
+
+
+def test_natrank_rejects_unknown_method() -> None:
+    with pytest.raises(ValueError, match="'method' must be"):
+        natrank(["a"], method="max")  # type: ignore[call-overload]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("k", [0, 1, 777, 1498, -1, -700])
+def test_natnth_and_natpartition_agree_with_natsorted(k: int, reverse: bool) -> None:
+    given = [f"num{(i * 7919) % 500}" for i in range(1500)]
+    expected = natsorted(given, reverse=reverse)
+    assert natnth(given, k, reverse=reverse) == expected[k]
+    result = natpartition(given, k, reverse=reverse)
+    assert result[k] == expected[k]
+    assert natsorted(result[:k], reverse=reverse) == expected[:k]
+    assert natsorted(result, reverse=reverse) == expected
+
+
+def test_natnth_supports_key_and_alg() -> None:
+    given = [("a", "num5.10"), ("b", "num-3"), ("c", "num5.3"), ("d", "num2")]
+    assert natnth(given, 1, key=itemgetter(1), alg=ns.REAL) == ("d", "num2")
+
+
+def test_natnth_can_presort() -> None:
+    given = ["a1", "a1.4500", "a01", "a1.45"]
+    expected = natsorted(given, alg=ns.FLOAT | ns.PRESORT)
+    for k in range(4):
+        assert natnth(given, k, alg=ns.FLOAT | ns.PRESORT) == expected[k]
+
+
+def test_natmedian_returns_the_lower_median() -> None:
+    assert natmedian(["num10", "num2", "num9", "num1"]) == "num2"
+    assert natmedian(["num10", "num2", "num9"]) == "num9"
+
+
+def test_natpercentile_uses_the_lower_element() -> None:
+    given = [f"item{i}" for i in range(10, 0, -1)]
+    assert natpercentile(given, 50) == "item5"
+    assert natpercentile(given, [0, 25, 100]) == ["item1", "item3", "item10"]
+
+
+@pytest.mark.parametrize("k", [3, -4])
+def test_natnth_rejects_out_of_range_positions(k: int) -> None:
+    with pytest.raises(IndexError):
+        natnth(["a", "b", "c"], k)
+
+
+def test_natmedian_and_natpercentile_reject_empty_input() -> None:
+    with pytest.raises(IndexError):
+        natmedian([])
+    with pytest.raises(IndexError):
+        natpercentile([], 50)
+
+
+@pytest.mark.parametrize("q", [-1, 100.5])
+def test_natpercentile_rejects_out_of_range_percentiles(q: float) -> None:
+    with pytest.raises(ValueError, match="percentile"):
+        natpercentile(["a"], q)
+
+
+def test_natgroupby_groups_by_the_leading_key_component() -> None:
+    given = ["frame_b10.exr", "frame_a2.exr", "frame_b9.exr", "frame_a10.exr", "x"]
+    assert list(natgroupby(given)) == [
+        (("frame_a",), ["frame_a2.exr", "frame_a10.exr"]),
+        (("frame_b",), ["frame_b9.exr", "frame_b10.exr"]),
+        (("x",), ["x"]),
+    ]
+
+
+def test_natgroupby_groups_elements_starting_with_a_number_together() -> None:
+    given = ["2b", "a1", "10c", "1a", "2a"]
+    assert list(natgroupby(given)) == [
+        (("",), ["1a", "2a", "2b", "10c"]),
+        (("a",), ["a1"]),
+    ]
+    assert list(natgroupby(given, by=2)) == [
+        (("", 1), ["1a"]),
+        (("", 2), ["2a", "2b"]),
+        (("", 10), ["10c"]),
+        (("a", 1), ["a1"]),
+    ]
+
+
+def test_natgroupby_supports_more_components_and_reverse() -> None:
+    given = ["v1.2a", "v1.10", "v1.2b", "v2"]
+    result = list(natgroupby(given, by=2, reverse=True, alg=ns.FLOAT))
+    assert result == [
+        (("v", 2.0), ["v2"]),
+        (("v", 1.2), ["v1.2b", "v1.2a"]),
+        (("v", 1.1), ["v1.10"]),
+    ]
+
+
+def test_natgroupby_supports_callable_key_and_alg() -> None:
+    given = [("a", "Item5"), ("b", "item10"), ("c", "ITEM2"), ("d", "other")]
+    result = natgroupby(given, by=itemgetter(0), key=itemgetter(1), alg=ns.IGNORECASE)
+    assert list(result) == [
+        ("item", [("c", "ITEM2"), ("a", "Item5"), ("b", "item10")]),
+        ("other", [("d", "other")]),
+    ]
+
+
+def test_natgroupby_rejects_empty_prefix() -> None:
+    with pytest.raises(ValueError, match="'by' must be at least 1"):
+        natgroupby(["a"], by=0)
@@ -0,0 +1,147 @@
+"""
+Testing for the natural sorting of directory listings.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort import natglob, natsorted, natsorted_scandir, natwalk, ns, os_sorted
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for directory in ["d10/x", "d2/x2", "d2/x10", "d1"]:
+        (tmp_path / directory).mkdir(parents=True)
+    for file in ["f10", "f2", "F1", "d2/f10.txt", "d2/f9.txt", "d2/x10/a"]:
+        (tmp_path / file).touch()
+    return tmp_path
+
+
+def test_natsorted_scandir_sorts_entries_by_name(tree: Path) -> None:
+    result = natsorted_scandir(tree)
+    assert [entry.name for entry in result] == [
+        "F1",
+        "d1",
+        "d2",
+        "d10",
+        "f2",
+        "f10",
+    ]
+    is_dir = [entry.is_dir() for entry in result]
+    assert is_dir == [False, True, True, True, False, False]
+
+
+def test_natsorted_scandir_supports_key_reverse_and_alg(tree: Path) -> None:
+    result = natsorted_scandir(
+        tree,
+        key=lambda entry: entry.name.upper(),
+        reverse=True,
+        alg=ns.IGNORECASE,
+    )
+    assert [entry.name for entry in result] == ["f10", "f2", "F1", "d10", "d2", "d1"]
+
+
+def test_natsorted_scandir_can_sort_like_os_sorted(tree: Path) -> None:
+    result = natsorted_scandir(tree, alg=None)
+    assert [entry.name for entry in result] == os_sorted(
+        path.name for path in tree.iterdir()
+    )
+
+
+def test_natwalk_gives_the_same_results_as_os_walk_in_natural_order(
+    tree: Path,
+) -> None:
+    expected = []
+    for dirpath, dirnames, filenames in os.walk(tree):
+        dirnames[:] = natsorted(dirnames)
+        expected.append((dirpath, dirnames, natsorted(filenames)))
+    expected = natsorted(expected, key=lambda x: x[0], alg=ns.PATH)
+    assert list(natwalk(tree)) == expected
+    assert [x[0] for x in expected] == [
+        str(tree / x) for x in ["", "d1", "d2", "d2/x2", "d2/x10", "d10", "d10/x"]
+    ]
+
+
+def test_natwalk_only_visits_the_directories_left_in_dirnames(tree: Path) -> None:
+    result = []
+    for dirpath, dirnames, _ in natwalk(tree, reverse=True):
+        result.append(os.path.relpath(dirpath, tree))
+        if "d2" in dirnames:
+            dirnames.remove("d2")
+    assert result == [os.path.normpath(x) for x in [".", "d10", "d10/x", "d1"]]
+
+
+def test_natwalk_bottom_up_visits_subdirectories_first(tree: Path) -> None:
+    result = [os.path.relpath(x[0], tree) for x in natwalk(tree, topdown=False)]
+    expected = ["d1", "d2/x2", "d2/x10", "d2", "d10/x", "d10", "."]
+    assert result == [os.path.normpath(x) for x in expected]
+
+
+def test_natwalk_reports_errors_to_onerror(tmp_path: Path) -> None:
+    errors: list[OSError] = []
+    result = list(natwalk(tmp_path / "missing", onerror=errors.append))
+    assert result == []
+    assert len(errors) == 1
+    assert isinstance(errors[0], FileNotFoundError)
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_natwalk_follows_symlinks_only_if_asked(tree: Path) -> None:
+    (tree / "link").symlink_to(tree / "d2", target_is_directory=True)
+    not_followed = [x[0] for x in natwalk(tree)]
+    followed = [x[0] for x in natwalk(tree, followlinks=True)]
+    assert str(tree / "link") not in not_followed
+    assert str(tree / "link" / "x2") in followed
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+@pytest.mark.parametrize(
+    "pattern",
+    ["*", "**", "**/*", "d*/x*", "d2/**", "**/", "d?/", "f[0-9]*", "d2", "d3/*"],
+)
+def test_natglob_matches_the_same_paths_as_glob(
+    tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pattern: str,
+    recursive: bool,
+) -> None:
+    monkeypatch.chdir(tree)
+    result = list(natglob(pattern, recursive=recursive))
+    assert sorted(result) == sorted(glob.glob(pattern, recursive=recursive))  # noqa: PTH207
+
+
+def test_natglob_sorts_each_directory_as_it_is_searched(
+    tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tree)
+    result = natglob("**", recursive=True, alg=ns.IGNORECASE)
+    expected = ["d1", "d2", "d2/f9.txt", "d2/f10.txt", "d2/x2", "d2/x10", "d2/x10/a"]
+    expected += ["d10", "d10/x", "F1", "f2", "f10"]
+    assert list(result) == [os.path.normpath(x) for x in expected]
+
+
+def test_natglob_gives_recursive_matches_directory_by_directory(
+    tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tree / "z.txt").touch()
+    monkeypatch.chdir(tree)
+    result = natglob("**/*.txt", recursive=True)
+    expected = ["z.txt", "d2/f9.txt", "d2/f10.txt"]
+    assert list(result) == [os.path.normpath(x) for x in expected]
+
+
+def test_natglob_can_return_a_list_in_reverse_order(tree: Path) -> None:
+    result = natglob(str(tree / "d*" / "*"), reverse=True, lazy=False)
+    assert isinstance(result, list)
+    expected = ["d10/x", "d2/x10", "d2/x2", "d2/f10.txt", "d2/f9.txt"]
+    assert result == [str(tree / x) for x in expected]
@@ -5,6 +5,7 @@ Testing for the OS sorting
 from __future__ import annotations
 
 import platform
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -17,6 +18,9 @@ except ImportError:
 else:
     has_icu = True
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 def test_os_sorted_compound() -> None:
     given = [
@@ -222,3 +226,27 @@ else:
 def test_os_sorted_corpus() -> None:
     result = natsort.os_sorted(given)
     assert result == expected
+
+
+def test_os_sorted_gives_the_same_order_as_os_sort_keygen() -> None:
+    given = [f"/p/Folder ({i % 7})/file{i % 5}.tar.gz" for i in range(30, 0, -1)]
+    expected = sorted(given, key=natsort.os_sort_keygen(), reverse=True)
+    assert natsort.os_sorted(given, reverse=True) == expected
+
+
+def test_os_sorted_collates_each_distinct_component_once(
+    mocker: MockerFixture,
+) -> None:
+    collated: list[str] = []
+
+    def component_key(x: str) -> str:
+        collated.append(x)
+        return x
+
+    mocker.patch(
+        "natsort.natsort._os_sort_component_keygen",
+        return_value=(lambda: component_key, True),
+    )
+    given = ["b/x.txt", "a/x.txt", "b/y.txt", "a/x.txt"]
+    assert natsort.os_sorted(given) == ["a/x.txt", "a/x.txt", "b/x.txt", "b/y.txt"]
+    assert sorted(collated) == [".txt", "a", "b", "x", "y"]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 from hypothesis import given
-from hypothesis.strategies import binary
+from hypothesis.strategies import binary, text
 
+from natsort import natsort_keygen
 from natsort.ns_enum import NSType, ns
 from natsort.utils import BytesTransformer, parse_bytes_factory
 
@@ -28,3 +31,35 @@ def test_parse_bytest_factory_makes_function_that_returns_tuple(
 ) -> None:
     parse_bytes_func = parse_bytes_factory(alg)
     assert parse_bytes_func(x) == example_func(x)
+
+
+def encode_strings(x: Any) -> Any:  # noqa: ANN401
+    if isinstance(x, tuple):
+        return tuple(map(encode_strings, x))
+    return x.encode() if isinstance(x, str) else x
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.REAL,
+        ns.FLOAT | ns.NOEXP,
+        ns.IGNORECASE,
+        ns.LOWERCASEFIRST | ns.GROUPLETTERS,
+        ns.PATH,
+        ns.PATH | ns.SIGNED | ns.IGNORECASE,
+    ],
+)
+@given(x=text(alphabet="aB019.-+eE /_"))
+def test_parse_natural_bytes_gives_the_same_key_as_the_ascii_string(
+    x: str,
+    alg: NSType,
+) -> None:
+    expected = encode_strings(natsort_keygen(alg=alg)(x))
+    assert parse_bytes_factory(alg | ns.BYTES)(x.encode()) == expected
+
+
+def test_parse_natural_bytes_converts_ascii_digits_only() -> None:
+    given = "a12b\u0663".encode()
+    assert parse_bytes_factory(ns.BYTES)(given) == (b"a", 12, "b\u0663".encode())
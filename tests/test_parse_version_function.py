@@ -0,0 +1,106 @@
+"""These test the utils.py functions."""
+
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, text
+
+from natsort import natsort_keygen, versionsorted
+from natsort.ns_enum import ns
+from natsort.utils import (
+    parse_version_factory,
+    parse_version_number_or_none_factory,
+)
+
+
+@pytest.mark.parametrize(
+    ("x", "expected"),
+    [
+        ("1.10.0", (1, 10, -2)),
+        ("v1.10.0", (1, 10, -2)),
+        ("1.10.0rc2", (1, 10, -3, 2, -2)),
+        ("2.0.0-beta.3", (2, -4, 3, -2)),
+        ("2.0.0-BETA", (2, -4, 0, -2)),
+        ("1.0a1.dev4", (1, -5, 1, -6, 4, -2)),
+        ("1.0.post1", (1, -1, 1, -2)),
+        ("1.0.0.1", (1, 0, 0, 1, -2)),
+        ("0.0", (-2,)),
+        ("1.2.3+build.5", (1, 2, 3, -2, "+build.5")),
+        ("1.0-bugfix", (1, -2, "-bugfix")),
+        ("latest", (-7, "latest")),
+        (PurePosixPath("3.1"), (3, 1, -2)),
+    ],
+)
+def test_parse_version_factory_makes_function_that_returns_integer_tuple(
+    x: str,
+    expected: tuple[int | str, ...],
+) -> None:
+    assert parse_version_factory(ns.VERSION)(x) == expected
+
+
+def test_parse_version_number_or_none_factory_parses_number_as_version() -> None:
+    func = parse_version_number_or_none_factory(parse_version_factory(ns.VERSION))
+    assert func(2) == (2, -2)
+    assert func(1.5) == (1, 5, -2)
+    assert func(None) == ()
+
+
+def test_versionsorted_orders_releases_and_tags() -> None:
+    given = [
+        "2.0.0",
+        "1.10.0.post1",
+        "1.10.0",
+        "1.10.0rc2",
+        "1.10.0rc1",
+        "1.10.0b1",
+        "1.10.0a1",
+        "1.10.0.dev1",
+        "1.9.12",
+        "1.9.2",
+        "v1.9",
+        "2.0.0-beta.3",
+        "2.0.0-beta.10",
+    ]
+    expected = [
+        "v1.9",
+        "1.9.2",
+        "1.9.12",
+        "1.10.0.dev1",
+        "1.10.0a1",
+        "1.10.0b1",
+        "1.10.0rc1",
+        "1.10.0rc2",
+        "1.10.0",
+        "1.10.0.post1",
+        "2.0.0-beta.3",
+        "2.0.0-beta.10",
+        "2.0.0",
+    ]
+    assert versionsorted(given) == expected
+    assert versionsorted(given, reverse=True) == expected[::-1]
+
+
+def test_versionsorted_places_non_versions_and_none_first() -> None:
+    given = ["1.0", None, "latest", 2, "0.1"]
+    assert versionsorted(given) == [None, "latest", "0.1", "1.0", 2]
+
+
+@given(
+    lists(integers(0, 100), min_size=1, max_size=5),
+    sampled_from(["", "a", "b", "rc", ".dev", ".post", "-beta."]),
+    integers(0, 100),
+    text(),
+)
+def test_version_keys_can_always_be_compared(
+    release: list[int],
+    tag: str,
+    number: int,
+    rest: str,
+) -> None:
+    key = natsort_keygen(alg=ns.VERSION)
+    version = ".".join(map(str, release)) + (f"{tag}{number}" if tag else "")
+    for other in ["1.0", "1.0.0.0.0.1", "1.0rc1+local", "latest", ""]:
+        assert isinstance(key(version + rest) < key(other), bool)
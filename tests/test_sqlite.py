@@ -0,0 +1,213 @@
+"""
+Testing for natural ordering inside SQLite databases.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING, Callable, NoReturn
+
+import pytest
+
+import natsort
+from natsort import natsort_keygen, natsorted, ns
+from natsort.sqlite import KeyCache, register
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from natsort.ns_enum import NSType
+
+NAMES = ["shard_250", "Shard_9", "shard_100.txt", "shard_100", "", "shard_10"]
+NAMES += ["shard_100a", "shard_251", "other", "shard_99.5", "shard_-3", "shard_1e2"]
+
+
+@pytest.fixture
+def conn() -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (name)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(x,) for x in NAMES])
+    yield conn
+    conn.close()
+
+
+def names(conn: sqlite3.Connection, sql: str) -> list[str]:
+    return [row[0] for row in conn.execute(sql)]
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE, ns.REAL, ns.PATH])
+def test_register_adds_a_natural_collation(
+    conn: sqlite3.Connection, alg: NSType
+) -> None:
+    register(conn, alg=alg)
+    sql = 'SELECT name FROM t ORDER BY name COLLATE "NATURAL"'
+    assert names(conn, sql) == natsorted(NAMES, alg=alg)
+    sql = 'SELECT name FROM t ORDER BY name COLLATE "NATURAL" DESC'
+    assert names(conn, sql) == natsorted(NAMES, alg=alg, reverse=True)
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE, ns.REAL, ns.PATH])
+def test_register_adds_a_function_giving_the_encoded_natural_key(
+    conn: sqlite3.Connection, alg: NSType
+) -> None:
+    register(conn, "NAT", alg)
+    sql = "SELECT name FROM t ORDER BY NAT_KEY(name), rowid"
+    assert names(conn, sql) == natsorted(NAMES, alg=alg)
+    sql = (
+        "SELECT name FROM t "
+        "WHERE NAT_KEY(name) BETWEEN NAT_KEY('shard_100') AND NAT_KEY('shard_250') "
+        "ORDER BY NAT_KEY(name), rowid"
+    )
+    key = natsort_keygen(alg=alg)
+    expected = [x for x in NAMES if key("shard_100") <= key(x) <= key("shard_250")]
+    assert names(conn, sql) == natsorted(expected, alg=alg)
+
+
+TIES = ["a01", "a1", "A1", "a001", "b2", "B02"]
+
+
+@pytest.mark.parametrize("alg", [ns.PRESORT, ns.IGNORECASE | ns.PRESORT])
+@pytest.mark.parametrize("expr", ['name COLLATE "NATURAL"', "NATURAL_KEY(name)"])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_register_orders_equal_keys_by_str_with_presort(
+    alg: NSType, expr: str, *, reverse: bool
+) -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (name)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(x,) for x in TIES])
+    register(conn, alg=alg)
+    order = "DESC" if reverse else "ASC"
+    sql = f"SELECT name FROM t ORDER BY {expr} {order}"  # noqa: S608
+    assert names(conn, sql) == natsorted(TIES, alg=alg, reverse=reverse)
+    conn.close()
+
+
+def test_register_function_can_be_used_in_an_index(conn: sqlite3.Connection) -> None:
+    register(conn, function="natkey")
+    conn.execute("CREATE INDEX t_natural ON t(natkey(name))")
+    sql = "SELECT name FROM t ORDER BY natkey(name)"
+    plan = " ".join(str(row) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+    assert "t_natural" in plan
+    assert "TEMP B-TREE" not in plan
+    assert names(conn, sql) == natsorted(NAMES)
+
+
+def test_register_function_accepts_any_sql_value(conn: sqlite3.Connection) -> None:
+    register(conn)
+    conn.executemany("INSERT INTO t VALUES (?)", [(None,), (5,), (2.5,), (b"x",)])
+    sql = "SELECT name FROM t WHERE name IS NULL OR typeof(name) != 'blob' "
+    sql += "ORDER BY NATURAL_KEY(name), rowid"
+    result = names(conn, sql)
+    assert result == [None, *natsorted([*NAMES, 5, 2.5])]
+    assert conn.execute("SELECT NATURAL_KEY(x'7831')").fetchone()[0] is not None
+
+
+def no_keygen(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the keys of new caches fail if they are computed."""
+
+    def fail(x: str) -> NoReturn:
+        raise AssertionError(x)
+
+    def keygen(*_: object) -> Callable[[str], NoReturn]:
+        return fail
+
+    monkeypatch.setattr("natsort.sqlite.natsort_keygen", keygen)
+
+
+def test_key_cache_sorts_naturally_with_stored_keys(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with KeyCache(tmp_path / "keys.db", ns.REAL) as cache:
+        assert cache.natsorted(NAMES) == natsorted(NAMES, alg=ns.REAL)
+        assert len(cache) == len(NAMES)
+    key = natsort_keygen(alg=ns.REAL)
+    no_keygen(monkeypatch)
+    with KeyCache(tmp_path / "keys.db", ns.REAL) as cache:
+        assert cache.natsorted(NAMES[::-1]) == natsorted(NAMES[::-1], alg=ns.REAL)
+        assert cache.keys(NAMES) == [natsort.encode_key(key(x)) for x in NAMES]
+
+
+def test_key_cache_natsorted_supports_key_and_reverse(tmp_path: Path) -> None:
+    items = [(x, i) for i, x in enumerate(NAMES + NAMES)]
+    with KeyCache(tmp_path / "keys.db") as cache:
+        result = cache.natsorted(items, key=lambda x: x[0], reverse=True)
+    assert result == natsorted(items, key=lambda x: x[0], reverse=True)
+
+
+@pytest.mark.parametrize("alg", [ns.PRESORT, ns.IGNORECASE | ns.PRESORT])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_cache_natsorted_orders_equal_keys_by_str_with_presort(
+    tmp_path: Path, alg: NSType, *, reverse: bool
+) -> None:
+    items = [(x, i) for i, x in enumerate(TIES)]
+    with KeyCache(tmp_path / "keys.db", alg) as cache:
+        assert cache.natsorted(TIES, reverse=reverse) == natsorted(
+            TIES, alg=alg, reverse=reverse
+        )
+        result = cache.natsorted(items, key=lambda x: x[0], reverse=reverse)
+    assert result == natsorted(items, key=lambda x: x[0], reverse=reverse, alg=alg)
+
+
+def test_key_cache_only_stores_strings(tmp_path: Path) -> None:
+    given: list[str | float] = ["a5", 5, 2.5, "a5"]
+    with KeyCache(tmp_path / "keys.db") as cache:
+        keys = cache.keys(given)  # type: ignore[arg-type]
+        assert keys == [natsort.encode_key(natsort.natsort_key(x)) for x in given]
+        assert len(cache) == 1
+
+
+def test_key_cache_keeps_the_keys_of_each_algorithm_apart(tmp_path: Path) -> None:
+    with KeyCache(tmp_path / "keys.db") as cache:
+        cache.keys(NAMES)
+    with KeyCache(tmp_path / "keys.db", ns.IGNORECASE) as cache:
+        assert len(cache) == 0
+        assert cache.natsorted(NAMES) == natsorted(NAMES, alg=ns.IGNORECASE)
+        cache.clear()
+        assert len(cache) == 0
+    with KeyCache(tmp_path / "keys.db") as cache:
+        assert len(cache) == len(NAMES)
+
+
+def test_key_cache_discards_keys_from_other_natsort_versions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with KeyCache(tmp_path / "keys.db") as cache:
+        cache.keys(NAMES)
+    monkeypatch.setattr(natsort, "__version__", "0.0.0")
+    with KeyCache(tmp_path / "keys.db") as cache:
+        assert len(cache) == 0
+
+
+def test_key_cache_removes_the_oldest_keys_above_its_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with KeyCache(tmp_path / "keys.db", max_size=3) as cache:
+        cache.keys(["a1"])
+        cache.keys(["a2"])
+        cache.keys(["a3", "a4"])
+        assert len(cache) == 3
+    no_keygen(monkeypatch)
+    with KeyCache(tmp_path / "keys.db", max_size=3) as cache:
+        cache.keys(["a2", "a3", "a4"])
+        with pytest.raises(AssertionError, match="a1"):
+            cache.keys(["a1"])
+
+
+def test_key_cache_counts_keys_removed_from_other_algorithms(tmp_path: Path) -> None:
+    with KeyCache(tmp_path / "keys.db", max_size=3) as cache:
+        cache.keys(["a1", "a2"])
+    with KeyCache(tmp_path / "keys.db", ns.IGNORECASE, max_size=3) as cache:
+        cache.keys(["a3", "a4"])
+        assert len(cache) == 2
+        cache.keys(["a3", "a4", "a5"])
+        assert len(cache) == 3
+    with KeyCache(tmp_path / "keys.db", max_size=3) as cache:
+        assert len(cache) == 0
+        cache.keys(["a1"])
+        assert len(cache) == 1
+
+
+def test_key_cache_rejects_a_size_below_one(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="'max_size'"):
+        KeyCache(tmp_path / "keys.db", max_size=0)
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import unicodedata
 import warnings
+from typing import TYPE_CHECKING
 
+from natsort import unicode_numbers, unicode_numeric_data
 from natsort.unicode_numbers import (
     decimal_chars,
     decimals,
@@ -17,7 +19,10 @@ from natsort.unicode_numbers import (
     numeric_chars,
     numeric_no_decimals,
 )
-from natsort.unicode_numeric_hex import numeric_hex
+from natsort.unicode_numeric_data import numeric as generated
+
+if TYPE_CHECKING:
+    import pytest
 
 
 def test_numeric_chars_contains_only_valid_unicode_numeric_characters() -> None:
@@ -51,7 +56,7 @@ def test_numeric_chars_contains_all_valid_unicode_numeric_and_digit_characters()
 
 def test_missing_unicode_number_in_collection() -> None:
     ok = True
-    set_numeric_hex = set(numeric_hex)
+    set_numeric = set(numeric)
     for i in range(0x110000):
         try:
             a = chr(i)
@@ -60,12 +65,12 @@ def test_missing_unicode_number_in_collection() -> None:
         if a in "0123456789":
             continue
         if unicodedata.numeric(a, None) is not None:  # noqa: SIM102
-            if i not in set_numeric_hex:
+            if a not in set_numeric:
                 ok = False
     if not ok:
         warnings.warn(
             """\
-Not all numeric unicode characters are represented in natsort/unicode_numeric_hex.py
+Not all numeric unicode characters are represented in natsort/unicode_numeric_data.py
 This can be addressed by running dev/generate_new_unicode_numbers.py with the current \
 version of Python.
 It would be much appreciated if you would submit a Pull Request to the natsort
@@ -79,3 +84,25 @@ def test_combined_string_contains_all_characters_in_list() -> None:
     assert numeric == "".join(numeric_chars)
     assert digits == "".join(digit_chars)
     assert decimals == "".join(decimal_chars)
+
+
+def test_tables_are_filtered_if_unicode_database_version_differs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Pretend the tables came from a different version of Python, and that
+    # they contain a character that is not numeric in the running version.
+    monkeypatch.setattr(unicodedata, "unidata_version", "0.0.0")
+    monkeypatch.setattr(unicode_numeric_data, "numeric", generated + "x")
+    # Forget the loaded tables, so the next access loads them again.
+    for name in unicode_numbers.__annotations__:
+        monkeypatch.delattr(unicode_numbers, name, raising=False)
+
+    assert "x" not in unicode_numbers.numeric
+    assert "\u0665" in unicode_numbers.numeric
+    assert "\u0665" in unicode_numbers.decimals
+    assert "\u00bd" in unicode_numbers.numeric_no_decimals
+    assert unicode_numbers.numeric == "".join(
+        a for a in generated if unicodedata.numeric(a, None) is not None
+    )
+    assert set(unicode_numbers.digits_no_decimals).isdisjoint(unicode_numbers.decimals)
+    assert set(unicode_numbers.numeric_no_decimals).isdisjoint(unicode_numbers.decimals)
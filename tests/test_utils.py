@@ -13,7 +13,7 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, lists, sampled_from, text
 
-from natsort import utils
+from natsort import natsort_keygen, utils
 from natsort.ns_enum import NSType, ns
 
 if TYPE_CHECKING:
@@ -161,6 +161,41 @@ def test_path_splitter_splits_path_string_by_sep(x: list[str]) -> None:
     assert tuple(utils.path_splitter(z)) == tuple(pathlib.Path(z).parts)
 
 
+@given(text(alphabet="/.ab1"))
+def test_split_path_string_gives_posix_path_parts(x: str) -> None:
+    expected = pathlib.PurePosixPath(x).parts or (".",)
+    assert tuple(utils.split_path_string(x, "/", None)) == expected
+
+
+@given(text(alphabet="/\\.ab1:"))
+def test_split_path_string_gives_windows_path_parts(x: str) -> None:
+    expected = pathlib.PureWindowsPath(x).parts or (".",)
+    assert tuple(utils.split_path_string(x, "\\", "/")) == expected
+
+
+@given(text(alphabet="/.ab1"))
+def test_bytes_path_splitter_splits_like_path_splitter(x: str) -> None:
+    expected = tuple(map(os.fsencode, utils.path_splitter(x)))
+    assert tuple(utils.bytes_path_splitter(os.fsencode(x))) == expected
+
+
+@pytest.mark.parametrize(
+    ("given", "expected"),
+    [
+        ("file..tar", ("file", ".", ".tar")),
+        ("..hidden.gz", ("..hidden", ".gz")),
+        ("archive.tar.gz.", ("archive.tar.gz.",)),
+        ("a.b.c.d", ("a.b", ".c", ".d")),
+    ],
+)
+def test_path_splitter_follows_pathlib_suffix_rules(
+    given: str,
+    expected: tuple[str, ...],
+) -> None:
+    assert tuple(utils.path_splitter(given)) == expected
+    assert tuple(utils.path_splitter(pathlib.PurePath(given))) == expected
+
+
 @pytest.mark.parametrize(
     ("given", "expected"),
     [
@@ -196,3 +231,44 @@ def test_path_splitter_splits_path_string_by_sep_and_removes_extension(
         pathlib.Path(z).stem,
         pathlib.Path(z).suffix,
     )
+
+
+NUMBERS = [0, -0.0, 1, -1, 0.5, -0.5, 1.5, 255, 256, 2**2048, -(2**2048), 1e300]
+NUMBERS += [5e-324, -5e-324, 0.1, float("inf"), float("-inf"), 2.0**53 + 2]
+
+
+@pytest.mark.parametrize("a", NUMBERS)
+@pytest.mark.parametrize("b", NUMBERS)
+def test_encode_key_orders_numbers_numerically(a: float, b: float) -> None:
+    assert (utils.encode_key((a,)) < utils.encode_key((b,))) is (a < b)
+    assert (utils.encode_key((a,)) == utils.encode_key((b,))) is (a == b)
+
+
+@pytest.mark.parametrize(
+    "alg", [ns.DEFAULT, ns.REAL | ns.PATH, ns.IGNORECASE | ns.NUMAFTER, ns.VERSION]
+)
+@given(lists(text(alphabet="aB.-/1 0\x00é5e+"), min_size=2, max_size=2))
+def test_encode_key_gives_bytes_in_the_order_of_keys(alg: NSType, x: list[str]) -> None:
+    a, b = map(natsort_keygen(alg=alg), x)
+    assert (utils.encode_key(a) < utils.encode_key(b)) is (a < b)
+    assert (utils.encode_key(a) == utils.encode_key(b)) is (a == b)
+
+
+@given(text(alphabet="aB.-\x00é"), integers(0), text(alphabet="aB.-\x00é"), integers(0))
+def test_encode_key_prefix_begins_the_keys_that_extend_its_text(
+    x: str, num: int, y: str, n: int
+) -> None:
+    key = natsort_keygen()
+    prefix = utils.encode_key(key(f"{x}{num}{y[:n]}"), prefix=True)
+    assert utils.encode_key(key(f"{x}{num}{y}")).startswith(prefix)
+    assert not utils.encode_key(key(f"{x}{num + 1}{y}")).startswith(prefix)
+
+
+@pytest.mark.parametrize(
+    ("key", "error"), [((float("nan"),), ValueError), ((None,), TypeError)]
+)
+def test_encode_key_rejects_unorderable_elements(
+    key: tuple[float | None], error: type[Exception]
+) -> None:
+    with pytest.raises(error):
+        utils.encode_key(key)